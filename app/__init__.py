@@ -9,15 +9,46 @@ login_manager = LoginManager()
 # CHANGE: accept optional test_config so pytest can inject a temp DB, TESTING=True, etc.
 def create_app(test_config: dict | None = None):
     app = Flask(__name__, template_folder="templates", static_folder="static")
-    app.config.from_object("app.config.Config")
+    # deployment profile (dev | sqlite-prod | postgres-prod) from APP_PROFILE
+    from app.config import check_required, profile_config
+    app.config.from_object(profile_config())
 
     # ADD: allow tests to override settings safely (e.g., SQLite tempfile / in-memory)
     if test_config:
         app.config.update(test_config)
+    # fail here, with the variable's name, rather than on the first database access
+    check_required(app.config)
 
     db.init_app(app)
     login_manager.init_app(app)
 
+    from app import sqlite_pragmas
+    sqlite_pragmas.init_app(app)
+
+    from app.control.view_counter import view_counter
+    view_counter.init_app(app)
+
+    from app.entity.principal import principal_cache
+    principal_cache.init_app(app)
+
+    from app.control.dashboard_metrics import dashboard_metrics
+    dashboard_metrics.init_app(app)
+
+    from app.control.report_cache import report_cache
+    report_cache.init_app(app)
+
+    from app.control.report_jobs import report_jobs
+    report_jobs.init_app(app)
+
+    from app.control.user_import_jobs import user_import_jobs
+    user_import_jobs.init_app(app)
+
+    from app.control.category_catalog import category_catalog
+    category_catalog.init_app(app)
+
+    from app.control.request_ranking import request_ranking
+    request_ranking.init_app(app)
+
     with app.app_context():
         # keep your entity imports exactly as-is
         from app.entity.user_profile import UserProfile
@@ -27,6 +58,10 @@ def create_app(test_config: dict | None = None):
         from app.entity.shortlist import Shortlist
         from app.entity.match_record import MatchRecord
         from app.entity.report import Report
+        from app.entity.report_job import ReportJob
+        from app.entity.import_job import ImportJob
+        from app.entity.daily_rollup import DailyRollup
+        from app.entity.table_version import TableVersion
 
         # OPTIONAL: if you worry about touching a prod DB during tests, you can guard:
         # if app.config.get("TESTING", False):
@@ -35,8 +70,15 @@ def create_app(test_config: dict | None = None):
         #     db.create_all()
         db.create_all()
 
+        # bring databases created by older versions up to the declared schema
+        from app.migrations import upgrade
+        upgrade()
+
         register_blueprints(app)
 
+    from app.cli import register_commands
+    register_commands(app)
+
     login_manager.login_view = "boundary.login"
 
     # ADD: tiny health endpoint so CI has a deterministic check
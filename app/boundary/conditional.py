@@ -0,0 +1,90 @@
+"""
+Conditional GET for boundary pages.
+
+@conditional(validator, cache_control) sits under @login_required. Before the
+view runs it calls validator(**view_args), which returns (token,
+last_modified): a cheap token for the data the page shows (TableVersion
+counters, a per-user digest, a row's generatedAt) and a naive-UTC datetime
+for Last-Modified, or None when there is no meaningful one. The token is
+hashed with the endpoint, user, query string, page-or-fragment choice (see
+wants_fragment) and ETAG_SALT into a weak ETag. A request whose If-None-Match (or, without one,
+If-Modified-Since) still matches gets an empty 304; the controllers and the
+template never run.
+
+Pages are rendered normally when the validator returns None (e.g. an unknown
+ID, so the view can 404) and while flashed messages are waiting: the browser's
+copy would not show them.
+"""
+import hashlib
+from datetime import timezone
+from functools import wraps
+from flask import current_app, make_response, request, session
+from flask_login import current_user
+from sqlalchemy import select
+from app import db
+from app.entity.table_version import TableVersion
+
+# pages whose content changes with the data: the browser must ask every time
+REVALIDATE = "private, no-cache"
+# request headers that pick between a full page and its #results fragment
+FRAGMENT_VARY = ("HX-Request", "HX-History-Restore-Request")
+
+
+def wants_fragment() -> bool:
+    # htmx filter / page swap; a history restore (back button on a cache miss) needs the whole page
+    return request.headers.get("HX-Request") == "true" and "HX-History-Restore-Request" not in request.headers
+
+
+def table_versions(*tables) -> tuple:
+    """Write counters of the given tables in one query, in argument order (0 for never written)."""
+    found = dict(db.session.execute(
+        select(TableVersion.tableName, TableVersion.version).where(TableVersion.tableName.in_(tables))
+    ).all())
+    return tuple(found.get(name, 0) for name in tables)
+
+
+def _etag(token) -> str:
+    user = current_user.get_id() if current_user.is_authenticated else ""
+    # list pages answer htmx swaps with a fragment of the same URL
+    parts = (current_app.config.get("ETAG_SALT", ""), request.endpoint, user,
+             request.query_string.decode("latin-1"), "fragment" if wants_fragment() else "page", repr(token))
+    return hashlib.sha1("\x1f".join(map(str, parts)).encode()).hexdigest()[:24]
+
+
+def _not_modified(etag, last_modified) -> bool:
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    since = request.if_modified_since
+    return bool(last_modified and since and last_modified <= since)
+
+
+def conditional(validator, cache_control: str = REVALIDATE):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ("GET", "HEAD") or session.get("_flashes"):
+                return view(*args, **kwargs)
+            validated = validator(**kwargs)
+            if validated is None:
+                return view(*args, **kwargs)
+            token, last_modified = validated
+            if last_modified is not None:
+                # HTTP dates have whole seconds; stored times are naive UTC
+                last_modified = last_modified.replace(microsecond=0, tzinfo=timezone.utc)
+            etag = _etag(token)
+
+            if _not_modified(etag, last_modified):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            # a 304 carries the same Vary as the page it stands for
+            response.vary.update(FRAGMENT_VARY)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.headers["Cache-Control"] = cache_control
+            return response
+        return wrapper
+    return decorator
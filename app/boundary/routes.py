@@ -6,7 +6,7 @@ Conventions:
 - Controllers: one per user story (imported below)
 - Redirect after login handled by AuthController (already implemented)
 """
-from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, make_response, Response, stream_with_context
 from flask_login import login_required, current_user
 from werkzeug.exceptions import NotFound
 
@@ -38,6 +38,9 @@ from app.control.csr_viewShortlist_controller import CsrViewShortlistController
 from app.control.csr_searchHistory_controller import CsrSearchHistoryController
 from app.control.csr_viewHistory_controller import CsrViewHistoryController
 from app.control.csr_removeShortlist_controller import CsrRemoveShortlistController
+from app.control.pagination import Pagination
+from app.control.dashboard_metrics import dashboard_metrics
+from app.control.category_catalog import category_catalog
 
 
 # --- PIN controllers ---
@@ -59,9 +62,32 @@ from app.control.platform_searchCategory_controller import PlatformSearchCategor
 from app.control.platform_generateDailyReport_controller import PlatformGenerateDailyReportController
 from app.control.platform_generateWeeklyReport_controller import PlatformGenerateWeeklyReportController
 from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
+from app.control.platform_exportReport_controller import PlatformExportReportController
+
+# --- Streaming exports ---
+from app.control.export_stream import EXPORT_FORMATS, encode_rows
+from app.boundary.conditional import FRAGMENT_VARY, conditional, table_versions, wants_fragment
 
 boundary_bp = Blueprint("boundary", __name__)
 
+
+def export_response(fmt, filename, header, rows):
+    # rows is lazy; the body is encoded and sent batch by batch while the cursor is read
+    return Response(
+        stream_with_context(encode_rows(fmt, header, rows)),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
+
+
+def render_list(template, partial, **context):
+    """Renders a list page, or only its #results partial (rows + pagination) for an htmx swap."""
+    fragment = wants_fragment()
+    response = make_response(render_template(partial if fragment else template, fragment=fragment, **context))
+    response.vary.update(FRAGMENT_VARY)
+    return response
+
+
 # ----------------------------------
 # HOME & AUTH
 # ----------------------------------
@@ -103,55 +129,22 @@ from app import db
 @boundary_bp.route("/admin/dashboard")
 @login_required
 def admin_dashboard():
-    # Calculate statistics for dashboard
-    total_users = UserAccount.query.count()
-    active_users = UserAccount.query.filter_by(isActive=True).count()
-    suspended_users = UserAccount.query.filter_by(isActive=False).count()
-    total_profiles = UserProfile.query.count()
-
-    # Pass data to template
-    return render_template(
-        "admin/dashboard.html",
-        total_users=total_users,
-        active_users=active_users,
-        suspended_users=suspended_users,
-        total_profiles=total_profiles
-    )
+    # Cached counter snapshot (one query on a miss)
+    return render_template("admin/dashboard.html", **dashboard_metrics.admin())
 
 
 # Users list + search
 @boundary_bp.route("/admin/users")
 @login_required
 def admin_users():
-    from app.entity.user_account import UserAccount
     search_query = request.args.get("search", "").strip()
     page = request.args.get("page", 1, type=int)
     per_page = 10
 
-    if search_query:
-        users = UserAdminSearchUserAccountController().searchUserAccountByName(search_query)
-        total = len(users)
-        start = (page - 1) * per_page
-        end = start + per_page
-        pagination_users = users[start:end]
-
-        # Define a simple pagination helper dynamically
-        class Pagination:
-            def __init__(self, page, per_page, total, items):
-                self.page = page
-                self.per_page = per_page
-                self.total = total
-                self.items = items
-                self.pages = (total + per_page - 1) // per_page
-                self.has_prev = page > 1
-                self.has_next = page < self.pages
-                self.prev_num = page - 1
-                self.next_num = page + 1
-
-        pagination = Pagination(page, per_page, total, pagination_users)
-
-    else:
-        pagination = UserAccount.query.paginate(page=page, per_page=per_page, error_out=False)
+    # matching accounts, paginated and counted in the database (app/control/user_search.py)
+    pagination = UserAdminSearchUserAccountController("admin_user_row").searchUserAccountPage(
+        search_query, page, per_page
+    )
 
     return render_template(
         "admin/users.html",
@@ -161,6 +154,15 @@ def admin_users():
     )
 
 
+# Export the (filtered) user list
+@boundary_bp.route("/admin/users/export.<any(csv, ndjson):fmt>")
+@login_required
+def admin_users_export(fmt):
+    search_query = request.args.get("search", "").strip()
+    header, rows = UserAdminSearchUserAccountController().exportUserAccounts(search_query)
+    return export_response(fmt, "users", header, rows)
+
+
 # Create user (GET form + POST submit)
 @boundary_bp.route("/admin/users/create", methods=["GET", "POST"])
 @login_required
@@ -188,6 +190,46 @@ def admin_create_user():
 
     return render_template("admin/create_user.html", profiles=profiles)
 
+# Bulk import user accounts from a CSV upload
+@boundary_bp.route("/admin/users/import", methods=["GET", "POST"])
+@login_required
+def admin_import_users():
+    from app.entity.user_profile import UserProfile
+    from app.control.user_import_jobs import user_import_jobs
+
+    if request.method == "POST":
+        upload = request.files.get("file")
+        profile_id = request.form.get("profile_id", type=int)
+        if not upload or not upload.filename:
+            flash("Choose a CSV file to import.", "danger")
+        else:
+            # hashing a large file takes minutes: a background job imports it, the page polls
+            try:
+                job = user_import_jobs.enqueue(upload.read(), upload.filename, profile_id, current_user.userID)
+                return redirect(url_for("boundary.admin_import_job", job_id=job.jobID))
+            except Exception as e:
+                flash(str(e), "danger")
+
+    profiles = UserProfile.query.filter_by(isActive=True).all()
+    return render_template("admin/import_users.html", profiles=profiles, job=None)
+
+
+@boundary_bp.route("/admin/users/import/jobs/<int:job_id>")
+@login_required
+def admin_import_job(job_id):
+    from app.entity.user_profile import UserProfile
+    from app.control.user_import_jobs import user_import_jobs
+    job = user_import_jobs.get(job_id)
+    if request.accept_mimetypes.best == "application/json":
+        if job is None:
+            return jsonify({"error": "Job not found."}), 404
+        return jsonify(job.to_dict())
+    if job is None:
+        flash("Import job not found.", "warning")
+        return redirect(url_for("boundary.admin_import_users"))
+    profiles = UserProfile.query.filter_by(isActive=True).all()
+    return render_template("admin/import_users.html", profiles=profiles, job=job)
+
 # view user account detail
 @boundary_bp.route("/admin/users/<int:user_id>")
 @login_required
@@ -430,67 +472,46 @@ from app import db
 @boundary_bp.route("/csr/dashboard")
 @login_required
 def csr_dashboard():
-    # Count all open requests
-    open_requests_count = Request.query.filter_by(status="open").count()
-
-    # Count requests shortlisted by this CSR
-    shortlist_count = Shortlist.query.filter_by(csrRepID=current_user.userID).count()
-
-    # Count matches completed by this CSR
-    matches_count = MatchRecord.query.filter_by(csrRepID=current_user.userID).count()
-
-    # Pass the results to the template
-    return render_template(
-        "csr/dashboard.html",
-        open_requests_count=open_requests_count,
-        shortlist_count=shortlist_count,
-        matches_count=matches_count
-    )
+    # Open requests, this CSR's shortlist and completed matches (cached snapshot)
+    return render_template("csr/dashboard.html", **dashboard_metrics.csr(current_user.userID))
 
 
 @boundary_bp.route("/csr/requests")
 @login_required
 def csr_requests():
     from app.control.csr_searchRequest_controller import CsrSearchRequestController
-    from app.entity.category import Category
 
     # pagination params
     page = request.args.get("page", 1, type=int)
     per_page = 9
 
-    # selected filter value
+    # selected filter values
     selected_category = request.args.get("category")
+    keyword = request.args.get("q", "").strip()
+    sort = request.args.get("sort", "newest")
+    if sort not in ("newest", "recommended"):
+        sort = "newest"
+
+    # active categories for the dropdown (cached catalog); an htmx swap keeps the page's form
+    categories = [] if wants_fragment() else category_catalog.active()
+
+    controller = CsrSearchRequestController("request_card")
+    if sort == "recommended":
+        # personalised top-K for this CSR rep (app/control/request_ranking.py)
+        pagination = controller.recommendRequestPage(
+            current_user.userID, selected_category, page, per_page, keyword=keyword
+        )
+    else:
+        # get one page of filtered results (LIMIT/OFFSET in the database)
+        pagination = controller.searchRequestPage(selected_category, page, per_page, keyword=keyword)
 
-    # fetch all active categories for dropdown
-    categories = Category.query.filter_by(isActive=True).all()
-
-    # get filtered results
-    results = CsrSearchRequestController().searchRequest(selected_category)
-    
-    # paginate manually (since we already filtered)
-    total = len(results)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated = results[start:end]
-
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = SimplePagination(page, per_page, total)
-
-    return render_template(
-        "csr/requests.html",
-        requests=paginated,
+    return render_list(
+        "csr/requests.html", "csr/_requests_results.html",
+        requests=pagination.items,
         categories=categories,
         selected_category=selected_category,
+        keyword=keyword,
+        sort=sort,
         pagination=pagination
     )
 
@@ -517,11 +538,36 @@ def csr_shortlist_add(request_id):
         flash("This request is already in your shortlist.", "info")
     return redirect(url_for("boundary.csr_requests"))
 
+@boundary_bp.route("/csr/shortlist/bulk", methods=["POST"])
+@login_required
+def csr_shortlist_bulk():
+    # form: action=add|remove, request_ids=<id> (repeated)
+    action = request.form.get("action")
+    request_ids = request.form.getlist("request_ids", type=int)
+    try:
+        if action == "add":
+            n = CsrSaveToShortlistController().saveManyToShortlist(request_ids, current_user.userID)
+            flash(f"{n} request(s) added to shortlist.", "success")
+        elif action == "remove":
+            n = CsrRemoveShortlistController().removeManyFromShortlist(current_user.userID, request_ids)
+            flash(f"{n} request(s) removed from shortlist.", "warning")
+        else:
+            flash("Invalid shortlist action.", "danger")
+    except Exception as e:
+        flash(str(e), "danger")
+    return redirect(url_for("boundary.csr_shortlist"))
+
+def _shortlist_validator():
+    from app.control.shortlist_store import version_name
+    # the CSR's own shortlist counter: shortlist_store writes through Core, so "shortlists" is never bumped
+    return table_versions(version_name(current_user.userID), "requests", "categories", "user_accounts"), None
+
+
 @boundary_bp.route("/csr/shortlist")
 @login_required
+@conditional(_shortlist_validator)
 def csr_shortlist():
     from app.control.csr_searchShortlist_controller import CsrSearchShortlistController
-    from app.entity.category import Category
 
     # Pagination setup
     page = request.args.get("page", 1, type=int)
@@ -530,37 +576,19 @@ def csr_shortlist():
     # Get selected category filter
     selected_category = request.args.get("category", type=int)
 
-    # Fetch shortlist filtered by category
-    results = CsrSearchShortlistController().searchShortlistByCategory(current_user.userID, selected_category)
-
-    # Paginate manually
-    total = len(results)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated_results = results[start:end]
-
-    # Pagination helper class
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = SimplePagination(page, per_page, total)
+    # Fetch one page of the shortlist filtered by category
+    pagination = CsrSearchShortlistController("shortlist_card").searchShortlistPage(
+        current_user.userID, selected_category, page, per_page
+    )
 
-    # All active categories for dropdown
-    categories = Category.query.filter_by(isActive=True).all()
+    # All active categories for dropdown (cached catalog); not needed for an htmx swap
+    categories = [] if wants_fragment() else category_catalog.active()
 
     # Extract associated requests for display
-    requests = [s.request for s in paginated_results]
+    requests = [s.request for s in pagination.items]
 
-    return render_template(
-        "csr/shortlist.html",
+    return render_list(
+        "csr/shortlist.html", "csr/_shortlist_results.html",
         requests=requests,
         pagination=pagination,
         categories=categories,
@@ -570,9 +598,9 @@ def csr_shortlist():
 
 @boundary_bp.route("/csr/matches")
 @login_required
+@conditional(lambda: (table_versions("match_records", "requests", "categories", "user_accounts"), None))
 def csr_matches():
     from app.control.csr_searchHistory_controller import CsrSearchHistoryController
-    from app.entity.category import Category
 
     # Get filters
     page = request.args.get("page", 1, type=int)
@@ -581,39 +609,26 @@ def csr_matches():
     start_date = request.args.get("start_date", "").strip()
     end_date = request.args.get("end_date", "").strip()
 
-    # Fetch all categories for dropdown
-    categories = Category.query.filter_by(isActive=True).all()
-
-    # Apply filters
-    results = CsrSearchHistoryController().searchHistory(
-        current_user.userID,
-        category_filter,
-        start_date,
-        end_date
-    )
-
-    # Pagination
-    total = len(results)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated = results[start:end]
-
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
+    # Active categories for dropdown (cached catalog); not needed for an htmx swap
+    categories = [] if wants_fragment() else category_catalog.active()
 
-    pagination = SimplePagination(page, per_page, total)
+    # Apply filters + pagination in the database
+    try:
+        pagination = CsrSearchHistoryController("csr_history_row").searchHistoryPage(
+            current_user.userID,
+            category_filter,
+            start_date,
+            end_date,
+            page,
+            per_page
+        )
+    except ValueError as e:
+        flash(str(e), "danger")
+        pagination = Pagination([], page, per_page, 0)
 
-    return render_template(
-        "csr/matches.html",
-        matches=paginated,
+    return render_list(
+        "csr/matches.html", "csr/_matches_results.html",
+        matches=pagination.items,
         categories=categories,
         selected_category=category_filter,
         start_date=start_date,
@@ -622,6 +637,22 @@ def csr_matches():
     )
 
 
+@boundary_bp.route("/csr/matches/export.<any(csv, ndjson):fmt>")
+@login_required
+def csr_matches_export(fmt):
+    category_filter = request.args.get("category", type=int)
+    start_date = request.args.get("start_date", "").strip()
+    end_date = request.args.get("end_date", "").strip()
+    try:
+        header, rows = CsrSearchHistoryController().exportHistory(
+            current_user.userID, category_filter, start_date, end_date
+        )
+    except ValueError as e:
+        flash(str(e), "danger")
+        return redirect(url_for("boundary.csr_matches"))
+    return export_response(fmt, "match-history", header, rows)
+
+
 
 
 @boundary_bp.route("/csr/shortlist/<int:request_id>/remove", methods=["POST"])
@@ -646,21 +677,8 @@ from sqlalchemy import or_
 @boundary_bp.route("/pin/dashboard")
 @login_required
 def pin_dashboard():
-    stats = {
-        "total": Request.query.filter_by(pinID=current_user.userID).count(),
-        "draft": Request.query.filter(
-            Request.pinID == current_user.userID,
-            Request.status.ilike("draft")
-        ).count(),
-        "open": Request.query.filter(
-            Request.pinID == current_user.userID,
-            Request.status.ilike("open")
-        ).count(),
-        "completed": Request.query.filter(
-            Request.pinID == current_user.userID,
-            Request.status.ilike("completed")
-        ).count(),
-    }
+    # per-status counts from one grouped query (cached snapshot)
+    stats = dashboard_metrics.pin(current_user.userID)
 
     matches_count = stats["completed"]
 
@@ -684,32 +702,14 @@ def pin_requests():
     search_query = request.args.get("search", "").strip()
 
     # --- run controller query ---
-    controller = PinSearchRequestController()
-    all_requests = controller.searchRequests(current_user.userID, keyword=search_query)
-
-    # --- paginate manually ---
-    total = len(all_requests)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated = all_requests[start:end]
-
-    # --- simple pagination helper ---
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = SimplePagination(page, per_page, total)
+    controller = PinSearchRequestController("pin_request_row")
+    pagination = controller.searchRequestsPage(
+        current_user.userID, keyword=search_query, page=page, per_page=per_page
+    )
 
-    return render_template(
-        "pin/requests.html",
-        requests=paginated,
+    return render_list(
+        "pin/requests.html", "pin/_requests_results.html",
+        requests=pagination.items,
         pagination=pagination,
         search_query=search_query,
     )
@@ -724,15 +724,16 @@ def pin_view_request(request_id):
         flash(str(e), "danger")
         return redirect(url_for("boundary.pin_requests"))
 
-    return render_template("pin/view_request.html", request=req)
+    # include views still buffered by the write-behind view counter
+    views = PinTrackViewsController().trackViews(request_id)
+    return render_template("pin/view_request.html", request=req, views=views)
 
 
 
 @boundary_bp.route("/pin/requests/create", methods=["GET", "POST"])
 @login_required
 def pin_create_request():
-    from app.entity.category import Category
-    categories = Category.query.filter_by(isActive=True).all()
+    categories = category_catalog.active()
 
     if request.method == "POST":
         category_id = request.form.get("category_id")
@@ -759,15 +760,14 @@ def pin_create_request():
 @login_required
 def pin_edit_request(request_id):
     from app.entity.request import Request
-    from app.entity.category import Category
     from app.control.pin_updateRequest_controller import PinUpdateRequestController
 
     req = Request.query.get(request_id)
     if not req or req.pinID != current_user.userID:
         raise NotFound("Request not found or unauthorized.")
 
-    # fetch active categories for dropdown
-    categories = Category.query.filter_by(isActive=True).all()
+    # fetch active categories for dropdown (cached catalog)
+    categories = category_catalog.active()
 
     if request.method == "POST":
         # grab inputs
@@ -820,33 +820,18 @@ def pin_match_records():
     page = request.args.get("page", 1, type=int)
     per_page = 10
 
-    # Controller call
-    results = PinSearchMatchRecordController().searchMatchRecord(
-        current_user.userID, category_query, start_date, end_date
-    )
-
-    # Manual pagination
-    total = len(results)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated_matches = results[start:end]
-
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = SimplePagination(page, per_page, total)
+    # Controller call (filtered + paginated in the database)
+    try:
+        pagination = PinSearchMatchRecordController("pin_history_row").searchMatchRecordPage(
+            current_user.userID, category_query, start_date, end_date, page, per_page
+        )
+    except ValueError as e:
+        flash(str(e), "danger")
+        pagination = Pagination([], page, per_page, 0)
 
     return render_template(
         "pin/matches.html",
-        matches=paginated_matches,
+        matches=pagination.items,
         pagination=pagination,
         category_query=category_query,
         start_date=start_date,
@@ -854,6 +839,24 @@ def pin_match_records():
     )
 
 
+@boundary_bp.route("/pin/match-records/export.<any(csv, ndjson):fmt>")
+@login_required
+def pin_match_records_export(fmt):
+    from app.control.pin_searchMatchRecord_controller import PinSearchMatchRecordController
+
+    category_query = request.args.get("category", "").strip()
+    start_date = request.args.get("start_date", "").strip()
+    end_date = request.args.get("end_date", "").strip()
+    try:
+        header, rows = PinSearchMatchRecordController().exportMatchRecords(
+            current_user.userID, category_query, start_date, end_date
+        )
+    except ValueError as e:
+        flash(str(e), "danger")
+        return redirect(url_for("boundary.pin_match_records"))
+    return export_response(fmt, "match-records", header, rows)
+
+
 @boundary_bp.route("/pin/requests/<int:request_id>/view-counters")
 @login_required
 def pin_request_counters(request_id):
@@ -869,23 +872,12 @@ def pin_request_counters(request_id):
 @boundary_bp.route("/pm/dashboard")
 @login_required
 def pm_dashboard():
-    from app.entity.category import Category
-    from app.entity.request import Request
-    from app.entity.match_record import MatchRecord
-    from app.entity.report import Report
-
-    summary = {
-        "total_categories": Category.query.count(),
-        "total_requests": Request.query.count(),
-        "open_requests": Request.query.filter_by(status="open").count(),
-        "total_reports": Report.query.count(),
-        "total_matches": MatchRecord.query.count(),
-    }
-
+    summary = dashboard_metrics.pm()
     return render_template("pm/dashboard.html", summary=summary)
 
 @boundary_bp.route("/pm/categories")
 @login_required
+@conditional(lambda: (table_versions("categories", "requests"), None))
 def pm_categories():
     from app.control.platform_searchCategory_controller import PlatformSearchCategoryController
     from app.entity.category import Category
@@ -904,10 +896,14 @@ def pm_categories():
         page=page, per_page=per_page, error_out=False
     )
 
-    return render_template(
-        "pm/categories.html",
+    # request totals for the page in one grouped query (not a lazy load per row)
+    request_counts = PlatformViewCategoryController().requestCounts([c.categoryID for c in pagination.items])
+
+    return render_list(
+        "pm/categories.html", "pm/_categories_results.html",
         categories=pagination.items,
         pagination=pagination,
+        request_counts=request_counts,
         q=q
     )
 
@@ -970,78 +966,128 @@ def pm_activate_category(category_id):
     return redirect(url_for("boundary.pm_categories"))
 
 # Reports
+def _report_list_validator():
+    from app.entity.report import Report
+    from app.control.report_jobs import report_jobs
+    # reports are only ever added; the manager's unfinished jobs are listed above the table
+    reports = tuple(db.session.execute(db.select(db.func.count(), db.func.max(Report.reportID))).one())
+    jobs = tuple((job.jobID, job.status, job.progress) for job in report_jobs.recent(current_user.userID))
+    return (reports, jobs), None
+
+
 @boundary_bp.route("/pm/reports")
 @login_required
+@conditional(_report_list_validator)
 def pm_reports():
     page = request.args.get("page", 1, type=int)
     per_page = 10
 
     from app.entity.report import Report
+    from app.control.report_jobs import report_jobs
     pagination = Report.query.order_by(Report.generatedAt.desc()).paginate(page=page, per_page=per_page, error_out=False)
 
     return render_template(
         "pm/reports.html",
         reports=pagination.items,
-        pagination=pagination
+        pagination=pagination,
+        jobs=report_jobs.recent(current_user.userID)
     )
 
 
 @boundary_bp.route("/pm/reports/generate", methods=["GET", "POST"])
 @login_required
 def pm_generate_report():
-    from app.control.platform_generateDailyReport_controller import PlatformGenerateDailyReportController
-    from app.control.platform_generateWeeklyReport_controller import PlatformGenerateWeeklyReportController
-    from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
-    from app import db
+    from app.control.report_jobs import report_jobs
+    from app.control.report_cache import report_cache
     if request.method == "POST":
         kind = request.form.get("report_type")  # "daily" | "weekly" | "monthly"
-        period = request.form.get("period")     # e.g. "2025-10-26", "2025-W43", "2025-10"
+        period = request.form.get("period")     # e.g. "2025-10-26", "2025-10-20" (week start), "2025-10"
         title = request.form.get("report_title")
+        wants_json = request.accept_mimetypes.best == "application/json"
 
-        # Pick controller based on kind
+        # an up-to-date report for the period is reused; otherwise a background worker builds it
         try:
-            if kind == "daily":
-                report = PlatformGenerateDailyReportController().generateDailyReport(
-                    current_user.userID,
-                    period
-                )
-            elif kind == "weekly":
-                report = PlatformGenerateWeeklyReportController().generateWeeklyReport(
-                    current_user.userID,
-                    period
-                )
-            elif kind == "monthly":
-                report = PlatformGenerateMonthlyReportController().generateMonthlyReport(
-                    current_user.userID,
-                    period
-                )
-            else:
-                flash("Invalid report type.", "danger")
-                return render_template("pm/generate_report.html")
+            report = report_cache.lookup(kind, period)
+            if report is None:
+                job, created = report_jobs.enqueue(kind, period, current_user.userID, title)
+        except ValueError as e:
+            if wants_json:
+                return jsonify({"error": str(e)}), 400
+            flash(str(e), "danger")
+            return render_template("pm/generate_report.html")
 
-            # optional: overwrite title with user's custom title
-            if title:
-                report.reportTitle = title
-                db.session.commit()
+        if report is not None:
+            report_url = url_for("boundary.pm_view_report", report_id=report.reportID)
+            if wants_json:
+                return jsonify({"reportID": report.reportID, "reportTitle": report.reportTitle,
+                                "reportUrl": report_url}), 200
+            # the cached report is reused as is, under the title it was generated with
+            if title and title.strip() and title.strip() != report.reportTitle:
+                flash(f"This report is already up to date; it keeps its title "
+                      f"'{report.reportTitle}', so '{title.strip()}' was not applied.", "info")
+            else:
+                flash("This report is already up to date.", "info")
+            return redirect(report_url)
 
-            flash("Report generated.", "success")
-            return redirect(url_for("boundary.pm_reports"))
+        status_url = url_for("boundary.pm_report_job", job_id=job.jobID)
+        if wants_json:
+            return jsonify(job.to_dict()), 202, {"Location": status_url}
 
-        except Exception as e:
-            flash(f"Failed to generate report: {e}", "danger")
-            return render_template("pm/generate_report.html")
+        if created:
+            flash(f"Report queued (job #{job.jobID}). It will appear below when ready.", "success")
+        else:
+            flash(f"An identical report is already being generated (job #{job.jobID}).", "info")
+        return redirect(url_for("boundary.pm_reports"))
 
     return render_template("pm/generate_report.html")
 
 
+@boundary_bp.route("/pm/reports/jobs/<int:job_id>")
+@login_required
+def pm_report_job(job_id):
+    from app.control.report_jobs import report_jobs
+    job = report_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found."}), 404
+    data = job.to_dict()
+    data["reportUrl"] = url_for("boundary.pm_view_report", report_id=job.reportID) if job.reportID else None
+    return jsonify(data)
+
+
+@boundary_bp.route("/pm/reports/cache")
+@login_required
+def pm_report_cache_stats():
+    from app.control.report_cache import report_cache
+    return jsonify(report_cache.stats())
+
+
+def _report_validator(report_id):
+    from app.entity.report import Report
+    # a stored report never changes, so its ID and timestamp identify the page
+    generated_at = db.session.execute(
+        db.select(Report.generatedAt).where(Report.reportID == report_id)
+    ).scalar()
+    return None if generated_at is None else ((report_id, generated_at), generated_at)
+
 
 @boundary_bp.route("/pm/reports/<int:report_id>")
 @login_required
+@conditional(_report_validator, cache_control="private, max-age=300")
 def pm_view_report(report_id):
     from app.entity.report import Report
-    import json
+    from sqlalchemy.orm import undefer_group
 
-    report = Report.query.get_or_404(report_id)
-    content = json.loads(report.reportData)
+    report = Report.query.options(undefer_group("payload")).get_or_404(report_id)
+    content = report.content
     return render_template("pm/view_report.html", report=report, content=content)
 
+
+@boundary_bp.route("/pm/reports/<int:report_id>/export.<any(csv, ndjson):fmt>")
+@login_required
+def pm_export_report(report_id, fmt):
+    try:
+        header, rows = PlatformExportReportController().exportReport(report_id)
+    except ValueError:
+        raise NotFound()
+    return export_response(fmt, f"report-{report_id}", header, rows)
+
@@ -0,0 +1,37 @@
+"""
+Maintenance commands, run with `flask --app main <command>`.
+"""
+import click
+
+
+def register_commands(app):
+    @app.cli.command("reconcile-shortlists")
+    def reconcile_shortlists():
+        """Recompute Request.shortlistCount from the shortlists table."""
+        from app.control.shortlist_store import reconcile_counts
+        fixed = reconcile_counts()
+        click.echo(f"Reconciled shortlist counts: {fixed} request(s) corrected.")
+
+    @app.cli.command("rebuild-rollups")
+    def rebuild_rollups():
+        """Recompute the daily report rollups from requests and match records."""
+        from app import db
+        from app.control.rollups import rebuild
+        cells = rebuild()
+        db.session.commit()
+        click.echo(f"Rebuilt report rollups: {cells} day/category/status cell(s).")
+
+    @app.cli.command("import-users")
+    @click.argument("csv_path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--profile", "profile_id", type=int, help="Profile ID for rows without a profile column.")
+    def import_users(csv_path, profile_id):
+        """Create user accounts from a CSV file (name,email,password[,age,phoneNumber,profile])."""
+        from flask import current_app
+        from app.control.useradmin_importUserAccounts_controller import UserAdminImportUserAccountsController
+        with open(csv_path, newline="", encoding="utf-8-sig") as fh:
+            result = UserAdminImportUserAccountsController().importUserAccounts(
+                fh, profile_id, hash_workers=current_app.config["USER_IMPORT_HASH_WORKERS"]
+            )
+        for line, message in result.errors:
+            click.echo(f"line {line}: {message}", err=True)
+        click.echo(f"Imported {result.created} user account(s); {result.rejected} row(s) rejected.")
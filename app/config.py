@@ -8,6 +8,55 @@ class Config:
     SQLALCHEMY_TRACKING_MODIFICATIONS = False
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # --- Request view counter (write-behind buffer, app/control/view_counter.py) ---
+    VIEW_COUNT_FLUSH_THRESHOLD = int(os.environ.get("VIEW_COUNT_FLUSH_THRESHOLD", 50))      # pending views
+    VIEW_COUNT_FLUSH_INTERVAL = float(os.environ.get("VIEW_COUNT_FLUSH_INTERVAL", 5.0))     # seconds, 0 = off
+
+    # --- Principal cache for the Flask-Login user loader (app/entity/principal.py) ---
+    PRINCIPAL_CACHE_TTL = float(os.environ.get("PRINCIPAL_CACHE_TTL", 60.0))                # seconds
+    PRINCIPAL_CACHE_SIZE = int(os.environ.get("PRINCIPAL_CACHE_SIZE", 4096))                # entries
+
+    # --- Dashboard counter snapshots (app/control/dashboard_metrics.py) ---
+    DASHBOARD_CACHE_TTL = float(os.environ.get("DASHBOARD_CACHE_TTL", 30.0))                # seconds
+
+    # --- Category catalog snapshot (app/control/category_catalog.py) ---
+    CATEGORY_CATALOG_TTL = float(os.environ.get("CATEGORY_CATALOG_TTL", 30.0))              # seconds between version checks
+
+    # --- "Recommended" request ranking for CSR reps (app/control/request_ranking.py) ---
+    RANKING_TTL = float(os.environ.get("RANKING_TTL", 10.0))                                # seconds between requests-version checks
+    RANKING_MAX_AGE = float(os.environ.get("RANKING_MAX_AGE", 300.0))                       # seconds before a rebuild picks up other workers' counts
+    RANKING_HALF_LIFE_DAYS = float(os.environ.get("RANKING_HALF_LIFE_DAYS", 14.0))          # recency halves every N days
+    RANKING_WEIGHTS = {"affinity": 0.6, "recency": 0.25, "popularity": 0.15}
+
+    # --- Request keyword search backend (app/control/request_search.py): auto | fts5 | like ---
+    SEARCH_BACKEND = os.environ.get("SEARCH_BACKEND", "auto")
+
+    # --- Admin user directory search backend (app/control/user_search.py): auto | trigram | like ---
+    USER_SEARCH_BACKEND = os.environ.get("USER_SEARCH_BACKEND", "auto")
+
+    # --- Background report generation (app/control/report_jobs.py) ---
+    REPORT_JOB_WORKERS = int(os.environ.get("REPORT_JOB_WORKERS", 2))                       # threads per process
+    REPORT_JOB_TIMEOUT = float(os.environ.get("REPORT_JOB_TIMEOUT", 900))                   # seconds before an active job counts as dead
+    REPORT_JOBS_EAGER = os.environ.get("REPORT_JOBS_EAGER", "0") == "1"                     # run jobs in the request thread
+
+    # --- Report payload compression (app/report_payload.py): none | zlib | zstd (needs zstandard) ---
+    REPORT_PAYLOAD_CODEC = os.environ.get("REPORT_PAYLOAD_CODEC", "zlib")
+
+    # --- Password hashing policy (app/passwords.py): scrypt | pbkdf2; cost = scrypt N or PBKDF2 iterations ---
+    # accounts hashed under another policy are re-hashed on their next successful login
+    PASSWORD_HASH_ALGORITHM = os.environ.get("PASSWORD_HASH_ALGORITHM", "scrypt")
+    PASSWORD_HASH_COST = int(os.environ.get("PASSWORD_HASH_COST", 32768))
+
+    # --- Bulk user import (app/control/useradmin_importUserAccounts_controller.py, user_import_jobs.py) ---
+    USER_IMPORT_CHUNK = int(os.environ.get("USER_IMPORT_CHUNK", 1000))                     # rows per lookup + INSERT
+    USER_IMPORT_HASH_WORKERS = int(os.environ.get("USER_IMPORT_HASH_WORKERS", os.cpu_count() or 1))  # hashing processes per import, <= 1 hashes in-process
+    USER_IMPORT_JOB_TIMEOUT = float(os.environ.get("USER_IMPORT_JOB_TIMEOUT", 3600))        # seconds before a running upload import counts as dead
+    USER_IMPORT_JOBS_EAGER = os.environ.get("USER_IMPORT_JOBS_EAGER", "0") == "1"           # import uploads in the request thread
+
+    # --- Conditional GET (app/boundary/conditional.py) ---
+    # set per deploy (e.g. the git revision) so browsers re-fetch pages whose templates changed
+    ETAG_SALT = os.environ.get("ETAG_SALT", "")
+
 # --- Session / Auth behavior ---
     SESSION_PERMANENT = False                 # session cookie 
     PERMANENT_SESSION_LIFETIME = timedelta(hours=8)  # not used when not permanent
@@ -19,4 +68,78 @@ class Config:
 
     # Cookie security 
     SESSION_COOKIE_HTTPONLY = True
-    SESSION_COOKIE_SECURE = False             # True if your app is served over HTTPS
\ No newline at end of file
+    SESSION_COOKIE_SECURE = False             # True if your app is served over HTTPS
+    # --- Database engine (Flask-SQLAlchemy) and per-connection SQLite pragmas (app/sqlite_pragmas.py) ---
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    SQLITE_PRAGMAS = {"busy_timeout": 5000}   # ms to wait for a lock instead of failing at once
+    # settings a profile cannot run without -> the environment variable that provides each (check_required)
+    REQUIRED_SETTINGS = {}
+
+
+# ----------------------------------
+# Deployment profiles, selected with APP_PROFILE (default: dev)
+# ----------------------------------
+
+class DevConfig(Config):
+    """Local development: the bundled SQLite file, default pool, rollback journal."""
+    PROFILE = "dev"
+
+
+class SQLiteProdConfig(Config):
+    """
+    Single-host production on SQLite. WAL lets readers run alongside the one
+    writer (view-count flushes, report jobs) instead of queueing behind it.
+    journal_mode=WAL is stored in the database file itself.
+    """
+    PROFILE = "sqlite-prod"
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 10)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+    }
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",                                                          # fsync at checkpoints; safe with WAL
+        "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT", 5000)),                 # ms
+        "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", -65536)),                   # negative = KiB (64 MiB)
+        "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 268435456)),                  # bytes (256 MiB)
+        "temp_store": "MEMORY",
+    }
+
+
+class PostgresProdConfig(Config):
+    """Production on PostgreSQL; DATABASE_URL is required (create_app refuses to start without it)."""
+    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
+    PROFILE = "postgres-prod"
+    REQUIRED_SETTINGS = {"SQLALCHEMY_DATABASE_URI": "DATABASE_URL"}
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 10)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 20)),
+        "pool_timeout": float(os.environ.get("DB_POOL_TIMEOUT", 30)),                   # seconds to wait for a connection
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", 1800)),                   # seconds; below server/proxy idle cut-offs
+        "pool_pre_ping": True,                                                          # drop connections the server closed
+    }
+    SQLITE_PRAGMAS = {}
+
+
+PROFILES = {
+    "dev": DevConfig,
+    "sqlite-prod": SQLiteProdConfig,
+    "postgres-prod": PostgresProdConfig,
+}
+
+
+def profile_config(name: str = None):
+    """The Config class for a profile name (default: the APP_PROFILE env var, else dev)."""
+    name = name or os.environ.get("APP_PROFILE", "dev")
+    if name not in PROFILES:
+        raise ValueError(f"Unknown APP_PROFILE {name!r}; expected one of: {', '.join(PROFILES)}.")
+    return PROFILES[name]
+
+
+def check_required(config) -> None:
+    """Raises RuntimeError naming the environment variables behind any unset REQUIRED_SETTINGS."""
+    missing = [env for key, env in (config.get("REQUIRED_SETTINGS") or {}).items() if not config.get(key)]
+    if missing:
+        raise RuntimeError(
+            f"APP_PROFILE {config.get('PROFILE')!r} requires {', '.join(missing)} to be set."
+        )
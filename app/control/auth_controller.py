@@ -1,11 +1,15 @@
 from flask_login import login_user, logout_user
 from flask import session
+from sqlalchemy.orm import joinedload
+from app import db
 from app.entity.user_account import UserAccount
+from app.passwords import hash_password, needs_rehash
+from app.entity.principal import principal_cache
 
 class AuthController:
     def login(self, email, password):
         # 1) Check account exists and is active
-        user = UserAccount.query.filter_by(email=email).first()
+        user = UserAccount.query.options(joinedload(UserAccount.profile)).filter_by(email=email).first()
         if not user or not user.isActive:
             return None, "Account not found or suspended."
 
@@ -13,11 +17,23 @@ class AuthController:
         if not user.check_password(password):
             return None, "Invalid credentials."
 
-        # 3) Log in using session cookie only (auto-logout when browser closes)
-        login_user(user, remember=False)
+        # 2b) Move hashes made under an older policy to the configured one while
+        #     the plain password is at hand (Core UPDATE: not a change reports track)
+        if needs_rehash(user._password):
+            db.session.execute(
+                UserAccount.__table__.update()
+                .where(UserAccount.__table__.c.userID == user.userID)
+                .values(password=hash_password(password))
+            )
+            db.session.commit()
+
+        # 3) Log in using session cookie only (auto-logout when browser closes);
+        #    prime the principal cache so the next request needs no identity query
+        principal = principal_cache.remember(user)
+        login_user(principal, remember=False)
 
         # 4) Determine redirect by role
-        role = (user.profile.profileName if user.profile else "").lower()
+        role = principal.role
         if role == "useradmin":
             return "/admin/dashboard", None
         if role in ("csrrep", "csr", "csr representative"):
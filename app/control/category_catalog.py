@@ -0,0 +1,116 @@
+"""
+In-process category catalog.
+
+Categories change only through the platform category controllers, yet every
+request, shortlist and match page needs the active list for its dropdown and
+the search controllers need names resolved to IDs. The catalog loads the
+whole table once into an immutable snapshot (id -> CategoryRef, the active
+list, lower-cased names) tagged with the categories TableVersion it was read
+at. The platform controllers call invalidate() after committing, and every
+CATEGORY_CATALOG_TTL seconds one primary-key read of that version catches
+writes made by other worker processes.
+"""
+import threading
+import time
+from collections import namedtuple
+from flask import current_app
+from sqlalchemy import select
+from app import db
+from app.entity.category import Category
+from app.entity.table_version import TableVersion
+
+CategoryRef = namedtuple("CategoryRef", "categoryID categoryName description isActive")
+
+
+class CatalogSnapshot:
+    """Read-only view of the categories table at one version."""
+
+    def __init__(self, version: int, refs):
+        self.version = version
+        self.by_id = {ref.categoryID: ref for ref in refs}
+        self.active = [ref for ref in refs if ref.isActive]
+        self._lower = [(ref.categoryName.lower(), ref) for ref in refs]
+
+    def name(self, category_id: int):
+        ref = self.by_id.get(category_id)
+        return ref.categoryName if ref else None
+
+    def is_active(self, category_id: int) -> bool:
+        ref = self.by_id.get(category_id)
+        return bool(ref and ref.isActive)
+
+    def active_ids(self) -> list:
+        return [ref.categoryID for ref in self.active]
+
+    def ids_matching(self, text: str, active_only: bool = False) -> list:
+        """IDs whose name contains text, case-insensitively (what an ILIKE '%text%' filter selects)."""
+        needle = (text or "").strip().lower()
+        return [ref.categoryID for lower, ref in self._lower
+                if needle in lower and (ref.isActive or not active_only)]
+
+
+def _version(session) -> int:
+    return session.execute(
+        select(TableVersion.version).where(TableVersion.tableName == Category.__tablename__)
+    ).scalar() or 0
+
+
+class _CatalogState:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.snapshot = None
+        self.checked_at = 0.0
+
+
+class CategoryCatalog:
+    """Flask extension; the snapshot lives in app.extensions["category_catalog"]."""
+
+    def init_app(self, app):
+        app.extensions["category_catalog"] = _CatalogState(app.config.get("CATEGORY_CATALOG_TTL", 30.0))
+
+    @staticmethod
+    def _state() -> _CatalogState:
+        return current_app.extensions["category_catalog"]
+
+    def snapshot(self) -> CatalogSnapshot:
+        state = self._state()
+        now = time.monotonic()
+        snap = state.snapshot
+        if snap is not None and now - state.checked_at < state.ttl:
+            return snap
+        with state.lock:
+            if state.snapshot is not None and now - state.checked_at < state.ttl:
+                return state.snapshot
+            if state.snapshot is None or _version(db.session) != state.snapshot.version:
+                state.snapshot = self._load()
+            state.checked_at = now
+            return state.snapshot
+
+    @staticmethod
+    def _load() -> CatalogSnapshot:
+        # version first: a write landing between the two reads only causes an extra reload later
+        version = _version(db.session)
+        rows = db.session.execute(
+            select(Category.categoryID, Category.categoryName, Category.description, Category.isActive)
+            .order_by(Category.categoryID)
+        ).all()
+        return CatalogSnapshot(version, [CategoryRef(*row) for row in rows])
+
+    # ---- shortcuts ----
+    def active(self) -> list:
+        """Active categories (CategoryRef), in ID order, for dropdowns."""
+        return self.snapshot().active
+
+    def name(self, category_id: int):
+        return self.snapshot().name(category_id)
+
+    # ---- invalidation ----
+    def invalidate(self):
+        """Categories were created, renamed, suspended or activated."""
+        state = self._state()
+        with state.lock:
+            state.snapshot = None
+
+
+category_catalog = CategoryCatalog()
@@ -2,27 +2,29 @@
 User Story:
 As a CSR Rep, I want to remove service requests from my shortlist so that I can manage saved opportunities.
 """
-from app import db
-from app.entity.shortlist import Shortlist
-from app.entity.request import Request
+from app.control import shortlist_store
+from app.control.dashboard_metrics import dashboard_metrics
 
 class CsrRemoveShortlistController:
     def removeFromShortlist(self, csrRepID: int, requestID: int) -> bool:
         """Removes a shortlist record and returns True if successful."""
-        record = Shortlist.query.filter_by(csrRepID=csrRepID, requestID=requestID).first()
-        if not record:
-            raise ValueError("Shortlist entry not found.")
-
         try:
-            # ✅ optional improvement — update request shortlist counter
-            req = record.request  # uses the relationship you added earlier
-            if req and req.shortlistCount and req.shortlistCount > 0:
-                req.shortlistCount -= 1
+            # atomic delete + SQL-side counter decrement
+            removed = shortlist_store.remove_many(csrRepID, [requestID])
+        except Exception as e:
+            raise RuntimeError(f"Failed to remove from shortlist: {e}")
 
-            db.session.delete(record)
-            db.session.commit()
-            return True
+        if not removed:
+            raise ValueError("Shortlist entry not found.")
+        dashboard_metrics.invalidate_shortlist(csrRepID)
+        return True
 
+    def removeManyFromShortlist(self, csrRepID: int, requestIDs: list) -> int:
+        """Removes many shortlist entries in one transaction; returns how many were removed."""
+        try:
+            removed = shortlist_store.remove_many(csrRepID, requestIDs)
         except Exception as e:
-            db.session.rollback()
             raise RuntimeError(f"Failed to remove from shortlist: {e}")
+        if removed:
+            dashboard_metrics.invalidate_shortlist(csrRepID)
+        return len(removed)
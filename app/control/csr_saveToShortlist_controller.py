@@ -1,20 +1,22 @@
 from app import db
 from app.entity.request import Request
-from app.entity.shortlist import Shortlist
+from app.control import shortlist_store
+from app.control.dashboard_metrics import dashboard_metrics
 
 class CsrSaveToShortlistController:
     def saveToShortlist(self, requestID: int, csrID: int) -> bool:
         """Adds a request to the CSR's shortlist and returns True if successful."""
-        r = Request.query.get(requestID)
-        if not r:
+        # one atomic insert-or-ignore + counter update; False if already shortlisted
+        if shortlist_store.add_many(csrID, [requestID]):
+            dashboard_metrics.invalidate_shortlist(csrID)
+            return True
+        if not db.session.get(Request, requestID):
             raise ValueError("Request not found.")
+        return False
 
-        # check if already shortlisted (optional safeguard)
-        exists = Shortlist.query.filter_by(csrRepID=csrID, requestID=requestID).first()
-        if exists:
-            return False
-
-        r.shortlistCount = (r.shortlistCount or 0) + 1
-        db.session.add(Shortlist(csrRepID=csrID, requestID=requestID))
-        db.session.commit()
-        return True
+    def saveManyToShortlist(self, requestIDs: list, csrID: int) -> int:
+        """Shortlists many requests in one transaction; returns how many were newly added."""
+        added = shortlist_store.add_many(csrID, requestIDs)
+        if added:
+            dashboard_metrics.invalidate_shortlist(csrID)
+        return len(added)
@@ -3,13 +3,32 @@ User Story:
 As a CSR Rep, I want to search and view the history of my completed volunteer services,
 filtered by category and date period.
 """
+from sqlalchemy.orm import aliased
 from app.entity.match_record import MatchRecord
-from datetime import datetime
-from sqlalchemy import func   # ✅ Add this
+from app.entity.request import Request
+from app.entity.category import Category
+from app.entity.user_account import UserAccount
+from app.control.pagination import paginate
+from app.control.date_range import apply_day_range
+from app.control.loader_profiles import with_profile
+from app.control.export_stream import BATCH
 
 class CsrSearchHistoryController:
+    def __init__(self, loader_profile: str = None):
+        # optional eager-loading profile (see app/control/loader_profiles.py)
+        self.loader_profile = loader_profile
+
     def searchHistory(self, userID: int, category_id: int = None, start_date: str = None, end_date: str = None):
         """Returns completed match records for a CSR representative filtered by category and date."""
+        return self.searchHistoryQuery(userID, category_id, start_date, end_date).all()
+
+    def searchHistoryPage(self, userID: int, category_id: int = None, start_date: str = None,
+                          end_date: str = None, page: int = 1, per_page: int = 10):
+        """Returns one Pagination page of the CSR's completed match records."""
+        return paginate(self.searchHistoryQuery(userID, category_id, start_date, end_date), page, per_page)
+
+    def searchHistoryQuery(self, userID: int, category_id: int = None, start_date: str = None, end_date: str = None):
+        """Builds the completed-history query (most recent first) without executing it."""
         q = MatchRecord.query.filter(
             MatchRecord.csrRepID == userID,
             MatchRecord.status == "completed"
@@ -19,11 +38,27 @@ class CsrSearchHistoryController:
         if category_id:
             q = q.filter(MatchRecord.categoryID == category_id)
 
-        # Filter by date range (compare DATE only)
-        if start_date:
-            q = q.filter(func.date(MatchRecord.completedAt) >= start_date)
+        # Filter by inclusive date range (half-open bounds on the raw column, index-friendly)
+        q = apply_day_range(q, MatchRecord.completedAt, start_date, end_date)
 
-        if end_date:
-            q = q.filter(func.date(MatchRecord.completedAt) <= end_date)
+        return with_profile(q.order_by(MatchRecord.completedAt.desc()), self.loader_profile)
 
-        return q.order_by(MatchRecord.completedAt.desc()).all()
+    def exportHistory(self, userID: int, category_id: int = None, start_date: str = None,
+                      end_date: str = None, batch: int = BATCH):
+        """
+        Returns (header, rows) for exporting the filtered history. rows is a lazy
+        iterator of column tuples read from the cursor `batch` rows at a time.
+        Invalid dates raise ValueError here, before anything is streamed.
+        """
+        req, cat, pin = aliased(Request), aliased(Category), aliased(UserAccount)
+        q = (
+            CsrSearchHistoryController().searchHistoryQuery(userID, category_id, start_date, end_date)
+            .outerjoin(req, req.requestID == MatchRecord.requestID)
+            .outerjoin(cat, cat.categoryID == MatchRecord.categoryID)
+            .outerjoin(pin, pin.userID == MatchRecord.pinID)
+            .with_entities(MatchRecord.matchRecordID, MatchRecord.requestID, req.title, cat.categoryName,
+                           pin.name, MatchRecord.matchedAt, MatchRecord.completedAt)
+            .yield_per(batch)
+        )
+        header = ("matchRecordID", "requestID", "title", "category", "personInNeed", "matchedAt", "completedAt")
+        return header, iter(q)
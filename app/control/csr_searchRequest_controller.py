@@ -3,17 +3,60 @@ User Story:
 As a CSR Rep, I want to search for service requests so that I can find opportunities that match my organization’s resources.
 """
 from app.entity.request import Request
-from app.entity.category import Category
+from app.control.category_catalog import category_catalog
+from app.control.pagination import Pagination, paginate
+from app.control.loader_profiles import with_profile
+from app.control.request_search import search_backend
+from app.control.request_ranking import request_ranking
 
 class CsrSearchRequestController:
-    def searchRequest(self, category: str):
-        """Returns a list of open requests filtered by category (if provided)."""
-        q = Request.query.join(Category, Request.categoryID == Category.categoryID)
+    def __init__(self, loader_profile: str = None):
+        # optional eager-loading profile (see app/control/loader_profiles.py)
+        self.loader_profile = loader_profile
 
-        # Filter only active categories and open requests
-        q = q.filter(Category.isActive == True, Request.status == "open")
+    def searchRequest(self, category: str, keyword: str = None):
+        """Returns a list of open requests filtered by category and keyword (if provided)."""
+        return self.searchRequestQuery(category, keyword).all()
 
-        if category:
-            q = q.filter(Category.categoryName.ilike(f"%{category}%"))
+    def searchRequestPage(self, category: str, page: int = 1, per_page: int = 9, keyword: str = None):
+        """Returns one Pagination page of open requests filtered by category and keyword."""
+        return paginate(self.searchRequestQuery(category, keyword), page, per_page)
 
-        return q.order_by(Request.requestID.desc()).all()
+    def recommendRequestPage(self, csr_id: int, category: str, page: int = 1, per_page: int = 9,
+                             keyword: str = None):
+        """
+        Returns one Pagination page of the same open requests, best first for
+        this CSR rep (see app/control/request_ranking.py).
+        """
+        catalog = category_catalog.snapshot()
+        category_ids = catalog.ids_matching(category, active_only=True) if category else catalog.active_ids()
+        request_ids = None
+        if keyword:
+            # the keyword narrows the candidates; the ranking replaces its relevance order
+            request_ids = [rid for (rid,) in self.searchRequestQuery(category, keyword)
+                           .with_entities(Request.requestID).order_by(None)]
+        page = max(page or 1, 1)
+        ids, total = request_ranking.top(csr_id, category_ids, request_ids, page, per_page)
+        rank = {rid: i for i, rid in enumerate(ids)}
+        items = []
+        if ids:
+            # status re-checked: the ranking snapshot can lag a close made by another worker
+            q = Request.query.filter(Request.requestID.in_(ids), Request.status == "open")
+            items = sorted(with_profile(q, self.loader_profile).all(), key=lambda r: rank[r.requestID])
+        return Pagination(items, page, per_page, total)
+
+    def searchRequestQuery(self, category: str, keyword: str = None):
+        """Builds the open-request query (newest first, or best match first for a keyword) without executing it."""
+        # Only open requests in active categories; the category filter is resolved
+        # to IDs from the cached catalog, so no join on categories is needed
+        catalog = category_catalog.snapshot()
+        category_ids = catalog.ids_matching(category, active_only=True) if category else catalog.active_ids()
+        q = Request.query.filter(Request.status == "open", Request.categoryID.in_(category_ids))
+
+        q = q.order_by(Request.requestID.desc())
+
+        # full-text match on title/description (see app/control/request_search.py)
+        if keyword:
+            q = search_backend().apply(q, keyword)
+
+        return with_profile(q, self.loader_profile)
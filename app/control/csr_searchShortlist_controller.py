@@ -7,15 +7,29 @@ so that I can quickly find saved opportunities related to specific services.
 from app.entity.shortlist import Shortlist
 from app.entity.request import Request
 from app.entity.category import Category
+from app.control.pagination import paginate
+from app.control.loader_profiles import with_profile
 
 class CsrSearchShortlistController:
+    def __init__(self, loader_profile: str = None):
+        # optional eager-loading profile (see app/control/loader_profiles.py)
+        self.loader_profile = loader_profile
+
     def searchShortlistByCategory(self, csr_id: int, category_id: int = None):
         """
         Returns all Shortlist entries for a CSR, optionally filtered by category.
         """
+        return self.searchShortlistQuery(csr_id, category_id).all()
+
+    def searchShortlistPage(self, csr_id: int, category_id: int = None, page: int = 1, per_page: int = 9):
+        """Returns one Pagination page of Shortlist entries for a CSR."""
+        return paginate(self.searchShortlistQuery(csr_id, category_id), page, per_page)
+
+    def searchShortlistQuery(self, csr_id: int, category_id: int = None):
+        """Builds the shortlist query (newest first) without executing it."""
         q = Shortlist.query.join(Request).filter(Shortlist.csrRepID == csr_id)
 
         if category_id:
             q = q.filter(Request.categoryID == category_id)
 
-        return q.order_by(Shortlist.shortlistID.desc()).all()
+        return with_profile(q.order_by(Shortlist.shortlistID.desc()), self.loader_profile)
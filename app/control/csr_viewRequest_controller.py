@@ -1,12 +1,11 @@
-from app import db
 from app.entity.request import Request
+from app.control.view_counter import view_counter
 
 class CsrViewRequestController:
     def viewRequestDetails(self, requestID: int):
-        """Returns a single Request entity and increments its viewCount."""
+        """Returns a single Request entity and records a view (buffered, flushed in batches)."""
         r = Request.query.get(requestID)
         if not r:
             raise ValueError("Request not found.")
-        r.viewCount = (r.viewCount or 0) + 1
-        db.session.commit()
+        view_counter.increment(r.requestID)
         return r
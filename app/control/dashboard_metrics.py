@@ -0,0 +1,120 @@
+"""
+Dashboard counter snapshots for the admin, CSR, PIN and PM dashboards.
+
+Each dashboard's numbers come from one statement (a grouped query or a row of
+scalar subqueries) and are cached per app for DASHBOARD_CACHE_TTL seconds,
+keyed by role (and user for the CSR/PIN dashboards). Controllers that change
+the underlying rows call the invalidate_* helpers after committing; the TTL
+covers writes made by other processes or outside the controllers.
+"""
+from flask import current_app
+from sqlalchemy import case, func, select
+from app import db
+from app.cache import TTLCache
+from app.entity.user_account import UserAccount
+from app.entity.user_profile import UserProfile
+from app.entity.category import Category
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.entity.match_record import MatchRecord
+from app.entity.report import Report
+
+
+def _count(model, *criteria):
+    return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+
+class DashboardMetrics:
+    """Flask extension; the cache lives in app.extensions["dashboard_metrics"]."""
+
+    def init_app(self, app):
+        app.extensions["dashboard_metrics"] = TTLCache(
+            maxsize=app.config.get("DASHBOARD_CACHE_SIZE", 1024),
+            ttl=app.config.get("DASHBOARD_CACHE_TTL", 30.0),
+        )
+
+    @staticmethod
+    def _cache() -> TTLCache:
+        return current_app.extensions["dashboard_metrics"]
+
+    # ---- snapshots ----
+    def admin(self) -> dict:
+        def load():
+            def flagged(value):
+                return func.coalesce(func.sum(case((UserAccount.isActive == value, 1), else_=0)), 0)
+            row = db.session.execute(
+                select(
+                    func.count(UserAccount.userID),
+                    flagged(True),
+                    flagged(False),
+                    _count(UserProfile),
+                ).select_from(UserAccount)
+            ).one()
+            return dict(zip(("total_users", "active_users", "suspended_users", "total_profiles"), row))
+        return self._cache().get_or_load(("admin",), load)
+
+    def csr(self, csr_id: int) -> dict:
+        def load():
+            row = db.session.execute(select(
+                _count(Request, Request.status == "open"),
+                _count(Shortlist, Shortlist.csrRepID == csr_id),
+                _count(MatchRecord, MatchRecord.csrRepID == csr_id),
+            )).one()
+            return dict(zip(("open_requests_count", "shortlist_count", "matches_count"), row))
+        return self._cache().get_or_load(("csr", csr_id), load)
+
+    def pin(self, pin_id: int) -> dict:
+        def load():
+            status = func.lower(Request.status)
+            rows = db.session.execute(
+                select(status, func.count()).where(Request.pinID == pin_id).group_by(status)
+            ).all()
+            by_status = {s: n for s, n in rows}
+            return {
+                "total": sum(by_status.values()),
+                "draft": by_status.get("draft", 0),
+                "open": by_status.get("open", 0),
+                "completed": by_status.get("completed", 0),
+            }
+        return self._cache().get_or_load(("pin", pin_id), load)
+
+    def pm(self) -> dict:
+        def load():
+            row = db.session.execute(select(
+                _count(Category),
+                _count(Request),
+                _count(Request, Request.status == "open"),
+                _count(Report),
+                _count(MatchRecord),
+            )).one()
+            keys = ("total_categories", "total_requests", "open_requests", "total_reports", "total_matches")
+            return dict(zip(keys, row))
+        return self._cache().get_or_load(("pm",), load)
+
+    # ---- invalidation ----
+    def invalidate_users(self):
+        """User accounts or profiles were created / suspended / activated."""
+        self._cache().pop(("admin",))
+
+    def invalidate_requests(self, pin_id: int = None):
+        """Requests were created, updated or deleted (open counts are global)."""
+        cache = self._cache()
+        cache.pop(("pm",))
+        cache.pop_where(lambda key, _: key[0] == "csr")
+        if pin_id is None:
+            cache.pop_where(lambda key, _: key[0] == "pin")
+        else:
+            cache.pop(("pin", pin_id))
+
+    def invalidate_shortlist(self, csr_id: int):
+        self._cache().pop(("csr", csr_id))
+
+    def invalidate_platform(self):
+        """Categories or reports were created."""
+        self._cache().pop(("pm",))
+
+    def clear(self):
+        self._cache().clear()
+
+
+dashboard_metrics = DashboardMetrics()
@@ -0,0 +1,25 @@
+"""
+Inclusive date filters -> half-open datetime bounds.
+
+Comparing the raw column (`completedAt >= start AND completedAt < end + 1 day`)
+keeps the filter sargable, so the (…, status, completedAt) indexes can serve it;
+wrapping the column in DATE() forces a scan of every candidate row.
+"""
+from datetime import datetime, timedelta
+
+
+def parse_day(value: str, label: str = "date") -> datetime:
+    """Parses 'YYYY-MM-DD' into midnight of that day."""
+    try:
+        return datetime.strptime(value.strip(), "%Y-%m-%d")
+    except (AttributeError, ValueError):
+        raise ValueError(f"Invalid {label} '{value}'. Use YYYY-MM-DD.")
+
+
+def apply_day_range(query, column, start_date: str = None, end_date: str = None):
+    """Filters `column` to the inclusive day range [start_date, end_date]; blanks are open ends."""
+    if start_date:
+        query = query.filter(column >= parse_day(start_date, "start date"))
+    if end_date:
+        query = query.filter(column < parse_day(end_date, "end date") + timedelta(days=1))
+    return query
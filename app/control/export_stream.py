@@ -0,0 +1,63 @@
+"""
+Streaming CSV / NDJSON encoders for the export endpoints.
+
+Export controllers return (header, rows) where rows is a lazy iterator over
+column tuples, normally a query run with yield_per so the database cursor is
+read in batches. encode_rows() turns that into text chunks of `batch` rows,
+which the boundary wraps in a streamed Flask response; memory stays flat no
+matter how many rows are exported.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+BATCH = 1000
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_chunks(header, rows, batch):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    pending = 0
+    for row in rows:
+        writer.writerow(["" if v is None else v.isoformat() if isinstance(v, (datetime, date)) else v
+                         for v in row])
+        pending += 1
+        if pending >= batch:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(header, rows, batch):
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(header, row)), default=_json_default, separators=(",", ":")))
+        if len(lines) >= batch:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def encode_rows(fmt: str, header, rows, batch: int = BATCH):
+    """Yields the export as text chunks of up to `batch` rows."""
+    if fmt == "csv":
+        return _csv_chunks(header, rows, batch)
+    if fmt == "ndjson":
+        return _ndjson_chunks(header, rows, batch)
+    raise ValueError(f"Unsupported export format '{fmt}'.")
@@ -0,0 +1,56 @@
+"""
+Named eager-loading profiles for the list views.
+
+Each profile is the set of relationship loader options a template needs, so a
+page renders in a fixed number of queries instead of one lazy SELECT per row.
+Many-to-one links use joinedload (safe with LIMIT/OFFSET: no row fan-out).
+Profiles are built lazily so importing this module never forces mapper
+configuration before every entity has been imported.
+"""
+from sqlalchemy.orm import joinedload
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.entity.match_record import MatchRecord
+from app.entity.user_account import UserAccount
+
+LOADER_PROFILES = {
+    # csr/requests.html: category badge + "Posted by"
+    "request_card": lambda: (
+        joinedload(Request.category),
+        joinedload(Request.person_in_need),
+    ),
+    # pin/requests.html: category badge only
+    "pin_request_row": lambda: (
+        joinedload(Request.category),
+    ),
+    # csr/shortlist.html renders the shortlisted Request as a request_card
+    "shortlist_card": lambda: (
+        joinedload(Shortlist.request).joinedload(Request.category),
+        joinedload(Shortlist.request).joinedload(Request.person_in_need),
+    ),
+    # csr/matches.html: request title, category, person-in-need
+    "csr_history_row": lambda: (
+        joinedload(MatchRecord.request),
+        joinedload(MatchRecord.category),
+        joinedload(MatchRecord.person_in_need),
+    ),
+    # pin/matches.html: request title, category, CSR representative
+    "pin_history_row": lambda: (
+        joinedload(MatchRecord.request),
+        joinedload(MatchRecord.category),
+        joinedload(MatchRecord.csr_representative),
+    ),
+    # admin/users.html: profile name badge
+    "admin_user_row": lambda: (
+        joinedload(UserAccount.profile),
+    ),
+}
+
+
+def with_profile(query, profile: str = None):
+    """Applies the named loader profile to a query (no-op when profile is None)."""
+    if not profile:
+        return query
+    if profile not in LOADER_PROFILES:
+        raise ValueError(f"Unknown loader profile '{profile}'.")
+    return query.options(*LOADER_PROFILES[profile]())
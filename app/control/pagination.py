@@ -0,0 +1,31 @@
+"""
+Database-side pagination shared by the search controllers.
+Replaces the per-route SimplePagination classes that sliced fully-loaded lists.
+"""
+
+
+class Pagination:
+    """One page of results plus the navigation attributes the list templates use."""
+
+    def __init__(self, items, page: int, per_page: int, total: int):
+        self.items = items
+        self.page = page
+        self.per_page = per_page
+        self.total = total
+        self.pages = (total + per_page - 1) // per_page
+        self.has_prev = page > 1
+        self.has_next = page < self.pages
+        self.prev_num = page - 1
+        self.next_num = page + 1
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+def paginate(query, page: int = 1, per_page: int = 10) -> Pagination:
+    """Runs LIMIT/OFFSET for the requested page and a COUNT without ORDER BY."""
+    page = max(page or 1, 1)
+    total = query.order_by(None).count()
+    items = query.limit(per_page).offset((page - 1) * per_page).all()
+    return Pagination(items, page, per_page, total)
+
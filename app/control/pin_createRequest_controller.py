@@ -4,6 +4,7 @@ As a PIN, I want to create a service request so that I can get assistance.
 """
 from app import db
 from app.entity.request import Request
+from app.control.dashboard_metrics import dashboard_metrics
 
 class PinCreateRequestController:
     def createRequest(self, requestID:int=None, userID:int=None, categoryID:int=None,
@@ -22,6 +23,7 @@ class PinCreateRequestController:
             )
             db.session.add(new_request)
             db.session.commit()
+            dashboard_metrics.invalidate_requests(userID)
             return True
         except Exception as e:
             db.session.rollback()
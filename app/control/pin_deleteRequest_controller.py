@@ -7,6 +7,7 @@ Hard delete: remove row from database.
 """
 from app import db
 from app.entity.request import Request
+from app.control.dashboard_metrics import dashboard_metrics
 
 class PinDeleteRequestController:
     def deleteRequest(self, requestID: int, userID: int) -> bool:
@@ -20,6 +21,7 @@ class PinDeleteRequestController:
         try:
             db.session.delete(r)
             db.session.commit()
+            dashboard_metrics.invalidate_requests(userID)
             return True
         except Exception as e:
             db.session.rollback()
@@ -1,35 +1,69 @@
 # app/control/pin_searchMatchRecord_controller.py
-from sqlalchemy import func
+from sqlalchemy.orm import aliased
 from app import db
 from app.entity.match_record import MatchRecord
-from app.entity.request import Request
 from app.entity.category import Category
+from app.entity.request import Request
+from app.entity.user_account import UserAccount
+from app.control.pagination import paginate
+from app.control.date_range import apply_day_range
+from app.control.loader_profiles import with_profile
+from app.control.export_stream import BATCH
+from app.control.category_catalog import category_catalog
 
 class PinSearchMatchRecordController:
+    def __init__(self, loader_profile: str = None):
+        # optional eager-loading profile (see app/control/loader_profiles.py)
+        self.loader_profile = loader_profile
+
     def searchMatchRecord(self, pin_id: int, category_query: str = "", start_date: str = "", end_date: str = ""):
         """
         Returns completed match records for a PIN, filtered by optional category text and an inclusive date range.
         """
+        return self.searchMatchRecordQuery(pin_id, category_query, start_date, end_date).all()
+
+    def searchMatchRecordPage(self, pin_id: int, category_query: str = "", start_date: str = "",
+                              end_date: str = "", page: int = 1, per_page: int = 10):
+        """Returns one Pagination page of the PIN's completed match records."""
+        return paginate(self.searchMatchRecordQuery(pin_id, category_query, start_date, end_date), page, per_page)
+
+    def searchMatchRecordQuery(self, pin_id: int, category_query: str = "", start_date: str = "", end_date: str = ""):
+        """Builds the completed-match query (most recent first) without executing it."""
         # Base: only this PIN's completed records
+        # (MatchRecord.pinID mirrors Request.pinID, so the (pinID, status, completedAt) index applies)
         q = (
             db.session.query(MatchRecord)
-            .join(Request, MatchRecord.requestID == Request.requestID)
-            .join(Category, Request.categoryID == Category.categoryID)
             .filter(
-                Request.pinID == pin_id,
+                MatchRecord.pinID == pin_id,
                 MatchRecord.status == "completed"   # ensure 'Completed Matches'
             )
         )
 
-        # Category free-text search
+        # Category free-text search, resolved to IDs from the cached catalog
         if category_query and category_query.strip():
-            like = f"%{category_query.strip()}%"
-            q = q.filter(Category.categoryName.ilike(like))
+            q = q.filter(MatchRecord.categoryID.in_(category_catalog.snapshot().ids_matching(category_query)))
 
-        # Inclusive date range (compare DATE only; ignores time)
-        if start_date:
-            q = q.filter(func.date(MatchRecord.completedAt) >= start_date)
-        if end_date:
-            q = q.filter(func.date(MatchRecord.completedAt) <= end_date)
+        # Inclusive date range (half-open bounds on the raw column; ignores time)
+        q = apply_day_range(q, MatchRecord.completedAt, start_date, end_date)
 
-        return q.order_by(MatchRecord.completedAt.desc()).all()
+        return with_profile(q.order_by(MatchRecord.completedAt.desc()), self.loader_profile)
+
+    def exportMatchRecords(self, pin_id: int, category_query: str = "", start_date: str = "",
+                           end_date: str = "", batch: int = BATCH):
+        """
+        Returns (header, rows) for exporting the filtered match records; rows is a
+        lazy iterator of column tuples read `batch` at a time. Invalid dates raise
+        ValueError here, before anything is streamed.
+        """
+        req, cat, csr = aliased(Request), aliased(Category), aliased(UserAccount)
+        q = (
+            PinSearchMatchRecordController().searchMatchRecordQuery(pin_id, category_query, start_date, end_date)
+            .outerjoin(req, req.requestID == MatchRecord.requestID)
+            .outerjoin(cat, cat.categoryID == MatchRecord.categoryID)
+            .outerjoin(csr, csr.userID == MatchRecord.csrRepID)
+            .with_entities(MatchRecord.matchRecordID, MatchRecord.requestID, req.title, cat.categoryName,
+                           csr.name, MatchRecord.matchedAt, MatchRecord.completedAt)
+            .yield_per(batch)
+        )
+        header = ("matchRecordID", "requestID", "title", "category", "csrRepresentative", "matchedAt", "completedAt")
+        return header, iter(q)
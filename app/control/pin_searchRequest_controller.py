@@ -3,10 +3,26 @@ User Story:
 As a PIN, I want to search my service requests so that I can locate them easily when I have many open service requests.
 """
 from app.entity.request import Request
+from app.control.pagination import paginate
+from app.control.loader_profiles import with_profile
+from app.control.request_search import search_backend
 
 class PinSearchRequestController:
+    def __init__(self, loader_profile:str=None):
+        # optional eager-loading profile (see app/control/loader_profiles.py)
+        self.loader_profile = loader_profile
+
     def searchRequests(self, pin_id:int, keyword:str=None, status:str=None):
+        return self.searchRequestsQuery(pin_id, keyword, status).all()
+
+    def searchRequestsPage(self, pin_id:int, keyword:str=None, status:str=None, page:int=1, per_page:int=9):
+        """Returns one Pagination page of this PIN's requests."""
+        return paginate(self.searchRequestsQuery(pin_id, keyword, status), page, per_page)
+
+    def searchRequestsQuery(self, pin_id:int, keyword:str=None, status:str=None):
+        """Builds the PIN request query (newest first) without executing it."""
         q = Request.query.filter_by(pinID=pin_id)
-        if keyword: q = q.filter(Request.title.ilike(f"%{keyword}%"))
+        # one PIN's requests are few (ix_requests_pinID_status), so test them directly
+        if keyword: q = search_backend().narrow(q, keyword)
         if status: q = q.filter_by(status=status)
-        return q.order_by(Request.requestID.desc()).all()
+        return with_profile(q.order_by(Request.requestID.desc()), self.loader_profile)
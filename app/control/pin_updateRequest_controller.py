@@ -6,6 +6,7 @@ UML: + updateRequest(requestID: int, newRequestID: int, userID: int,
 """
 from app import db
 from app.entity.request import Request
+from app.control.dashboard_metrics import dashboard_metrics
 
 class PinUpdateRequestController:
     def updateRequest(self,
@@ -43,4 +44,5 @@ class PinUpdateRequestController:
             r.status = status  # e.g. "Open", "Draft"
 
         db.session.commit()
+        dashboard_metrics.invalidate_requests(userID)
         return True
@@ -5,6 +5,7 @@ so that they can be used again for new requests.
 """
 from app import db
 from app.entity.category import Category
+from app.control.category_catalog import category_catalog
 
 class PlatformActivateCategoryController:
     def activateCategory(self, categoryID: int) -> bool:
@@ -14,4 +15,5 @@ class PlatformActivateCategoryController:
             raise ValueError("Category not found.")
         category.isActive = True
         db.session.commit()
+        category_catalog.invalidate()
         return True
@@ -4,8 +4,12 @@ As a Platform Manager, I want to create service categories (transport, health su
 """
 from app import db
 from app.entity.category import Category
+from app.control.dashboard_metrics import dashboard_metrics
+from app.control.category_catalog import category_catalog
 
 class PlatformCreateCategoryController:
     def create_category(self, name:str, description:str=None):
         c = Category(categoryName=name, description=description, isActive=True)
-        db.session.add(c); db.session.commit(); return c
+        db.session.add(c); db.session.commit()
+        category_catalog.invalidate()
+        dashboard_metrics.invalidate_platform(); return c
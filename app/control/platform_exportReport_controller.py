@@ -0,0 +1,42 @@
+"""
+User Story:
+As a Platform Manager, I want to export a report so that I can analyse it outside the platform.
++ exportReport(reportID: int): (header, rows)
+"""
+
+from sqlalchemy.orm import undefer_group
+from app import db
+from app.entity.report import Report
+
+
+class PlatformExportReportController:
+
+    HEADER = ("section", "name", "metric", "value")
+
+    def exportReport(self, report_id: int):
+        """
+        Returns (header, rows) for the report body in long format, one
+        (section, name, metric, value) row per figure, e.g.
+        ("summary", "", "total_requests", 42) or
+        ("category_breakdown", "Food", "open_requests", 3).
+        Raises ValueError when the report does not exist.
+        """
+        report = db.session.get(Report, report_id, options=[undefer_group("payload")])
+        if report is None:
+            raise ValueError("Report not found.")
+        return self.HEADER, self._rows(report.content)
+
+    @staticmethod
+    def _rows(content):
+        # sections decode one at a time as the export reaches them
+        for section in content:
+            value = content[section]
+            if not isinstance(value, dict):
+                yield section, "", "", value
+                continue
+            for name, inner in value.items():
+                if isinstance(inner, dict):
+                    for metric, figure in inner.items():
+                        yield section, name, metric, figure
+                else:
+                    yield section, "", name, inner
@@ -3,70 +3,58 @@ User Story:
 As a Platform Manager, I want to generate daily reports so that I can track daily usage.
 + generateDailyReport(date: date): Report
 """
-import json
 from datetime import datetime, timedelta
 from app import db
 from app.entity.report import Report
-from app.entity.user_account import UserAccount
-from app.entity.request import Request
-from app.entity.match_record import MatchRecord
-from app.entity.category import Category
+from app.report_payload import encode_report
+from app.control.report_aggregator import ReportAggregator
+from app.control.dashboard_metrics import dashboard_metrics
 
 class PlatformGenerateDailyReportController:
-    def generateDailyReport(self, manager_id: int, day_string: str):
+    def generateDailyReport(self, manager_id: int, day_string: str, title: str = None, progress=None):
         """
         day_string expected format: 'YYYY-MM-DD'
+        title, when given, replaces the default report title.
+        progress, when given, is called with "aggregate" and then "render" (background jobs).
         """
 
         # parse the day
         day_start = datetime.strptime(day_string, "%Y-%m-%d")
         next_day = day_start + timedelta(days=1)
 
-        # metrics
-        total_users = UserAccount.query.count()
-        total_requests = Request.query.count()
-        open_requests = Request.query.filter_by(status="open").count()
-        closed_requests = Request.query.filter_by(status="closed").count()
-
-        total_matches = MatchRecord.query.count()
-        recent_matches_30 = (
-            MatchRecord.query
-            .filter(MatchRecord.completedAt >= datetime.utcnow() - timedelta(days=30))
-            .count()
-        )
-
-        # category breakdown
-        breakdown = {}
-        cats = Category.query.all()
-        for c in cats:
-            cat_reqs = Request.query.filter_by(categoryID=c.categoryID).all()
-            breakdown[c.categoryName] = {
-                "total_requests": len(cat_reqs),
-                "open_requests": len([r for r in cat_reqs if r.status == "open"]),
-                "closed_requests": len([r for r in cat_reqs if r.status == "closed"]),
-            }
+        if progress:
+            progress("aggregate")
+        # platform totals + this day's category breakdown (daily rollups); matches over the 30 days
+        # up to the end of the reported day, so the figure does not drift while the report is cached
+        agg = ReportAggregator().aggregate(day_start, next_day,
+                                           match_from=next_day - timedelta(days=30), match_to=next_day)
+        summary = agg["summary"]
 
         data = {
             "summary": {
-                "total_users": total_users,
-                "total_requests": total_requests,
-                "open_requests": open_requests,
-                "closed_requests": closed_requests,
-                "total_matches": total_matches,
-                "recent_matches_30_days": recent_matches_30,
+                "total_users": summary["total_users"],
+                "total_requests": summary["total_requests"],
+                "open_requests": summary["open_requests"],
+                "closed_requests": summary["closed_requests"],
+                "total_matches": summary["total_matches"],
+                "recent_matches_30_days": summary["matches_in_window"],
             },
-            "category_breakdown": breakdown
+            "period": agg["period"],
+            "category_breakdown": agg["category_breakdown"]
         }
 
+        if progress:
+            progress("render")
         # persist Report row
         report = Report(
-            reportTitle=f"Daily Report - {day_string}",
+            reportTitle=title or f"Daily Report - {day_string}",
             reportType="daily",
             generatedBy=manager_id,
             period=day_string,
-            reportData=json.dumps(data)
+            payload=encode_report(data)
         )
 
         db.session.add(report)
         db.session.commit()
+        dashboard_metrics.invalidate_platform()
         return report
@@ -3,19 +3,19 @@ User Story:
 As a Platform Manager, I want to generate monthly reports so that I can track monthly usage.
 + generateMonthlyReport(month: int, year: int): Report
 """
-import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from app import db
 from app.entity.report import Report
-from app.entity.user_account import UserAccount
-from app.entity.request import Request
-from app.entity.match_record import MatchRecord
-from app.entity.category import Category
+from app.report_payload import encode_report
+from app.control.report_aggregator import ReportAggregator
+from app.control.dashboard_metrics import dashboard_metrics
 
 class PlatformGenerateMonthlyReportController:
-    def generateMonthlyReport(self, manager_id: int, month_string: str):
+    def generateMonthlyReport(self, manager_id: int, month_string: str, title: str = None, progress=None):
         """
         month_string expected format: 'YYYY-MM' (example: '2025-10')
+        title, when given, replaces the default report title.
+        progress, when given, is called with "aggregate" and then "render" (background jobs).
         """
 
         # parse start and end of month
@@ -27,49 +27,36 @@ class PlatformGenerateMonthlyReportController:
         else:
             month_end = datetime(year_val, month_val + 1, 1)
 
-        # metrics (same global stats again for simplicity)
-        total_users = UserAccount.query.count()
-        total_requests = Request.query.count()
-        open_requests = Request.query.filter_by(status="open").count()
-        closed_requests = Request.query.filter_by(status="closed").count()
-
-        total_matches = MatchRecord.query.count()
-        recent_matches_30 = (
-            MatchRecord.query
-            .filter(MatchRecord.completedAt >= datetime.utcnow() - timedelta(days=30))
-            .count()
-        )
-
-        breakdown = {}
-        cats = Category.query.all()
-        for c in cats:
-            cat_reqs = Request.query.filter_by(categoryID=c.categoryID).all()
-            breakdown[c.categoryName] = {
-                "total_requests": len(cat_reqs),
-                "open_requests": len([r for r in cat_reqs if r.status == "open"]),
-                "closed_requests": len([r for r in cat_reqs if r.status == "closed"]),
-            }
+        if progress:
+            progress("aggregate")
+        # platform totals; category breakdown and matches counted within the month
+        agg = ReportAggregator().aggregate(month_start, month_end)
+        summary = agg["summary"]
 
         data = {
             "summary": {
-                "total_users": total_users,
-                "total_requests": total_requests,
-                "open_requests": open_requests,
-                "closed_requests": closed_requests,
-                "total_matches": total_matches,
-                "recent_matches_30_days": recent_matches_30,
+                "total_users": summary["total_users"],
+                "total_requests": summary["total_requests"],
+                "open_requests": summary["open_requests"],
+                "closed_requests": summary["closed_requests"],
+                "total_matches": summary["total_matches"],
+                "matches_completed_this_month": summary["matches_in_window"],
             },
-            "category_breakdown": breakdown
+            "period": agg["period"],
+            "category_breakdown": agg["category_breakdown"]
         }
 
+        if progress:
+            progress("render")
         report = Report(
-            reportTitle=f"Monthly Report - {month_string}",
+            reportTitle=title or f"Monthly Report - {month_string}",
             reportType="monthly",
             generatedBy=manager_id,
             period=month_string,
-            reportData=json.dumps(data)
+            payload=encode_report(data)
         )
 
         db.session.add(report)
         db.session.commit()
+        dashboard_metrics.invalidate_platform()
         return report
@@ -4,6 +4,7 @@ As a Platform Manager, I want to suspend unused service categories so that inval
 """
 from app import db
 from app.entity.category import Category
+from app.control.category_catalog import category_catalog
 
 class PlatformSuspendCategoryController:
     def suspendCategory(self, categoryID: int) -> bool:
@@ -13,4 +14,5 @@ class PlatformSuspendCategoryController:
             raise ValueError("Category not found.")
         category.isActive = False
         db.session.commit()
+        category_catalog.invalidate()
         return True
@@ -4,6 +4,7 @@ As a Platform Manager, I want to update service categories so that they remain r
 """
 from app import db
 from app.entity.category import Category
+from app.control.category_catalog import category_catalog
 
 class PlatformUpdateCategoryController:
     def updateCategory(self, categoryID: int, categoryName: str, description: str):
@@ -16,4 +17,5 @@ class PlatformUpdateCategoryController:
         category.description = description
 
         db.session.commit()
+        category_catalog.invalidate()
         return True
@@ -2,10 +2,24 @@
 User Story:
 As a Platform Manager, I want to view service categories so that I can see the types of service categories.
 """
+from sqlalchemy import func
+from app import db
 from app.entity.category import Category
+from app.entity.request import Request
 
 class PlatformViewCategoryController:
     def view_categories(self, active_only:bool=False):
         q = Category.query
         if active_only: q = q.filter_by(isActive=True)
         return q.order_by(Category.categoryName).all()
+
+    def requestCounts(self, category_ids) -> dict:
+        """Number of requests per category for the given IDs, in one grouped query."""
+        if not category_ids:
+            return {}
+        rows = db.session.execute(
+            db.select(Request.categoryID, func.count())
+            .where(Request.categoryID.in_(category_ids))
+            .group_by(Request.categoryID)
+        ).all()
+        return dict(rows)
@@ -0,0 +1,102 @@
+"""
+Shared aggregation engine for the daily / weekly / monthly report controllers.
+Reads the pre-aggregated DailyRollup cells (app/control/rollups.py), so a
+report period costs a sum over at most one row per day, category and status
+instead of a scan of the requests and match_records tables. Every request and
+match figure, all-time totals included, comes from the rollups, so a report
+always agrees with itself.
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from app import db
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.control import rollups
+
+
+def _days(start: datetime = None, end: datetime = None):
+    """[start, end) as whole rollup days; an end past midnight includes that day."""
+    first = start.date() if start is not None else None
+    last = None
+    if end is not None:
+        last = end.date() if end == datetime.combine(end.date(), datetime.min.time()) else end.date() + timedelta(days=1)
+    return first, last
+
+
+class ReportAggregator:
+    def aggregate(self, period_start: datetime = None, period_end: datetime = None,
+                  match_from: datetime = None, match_to: datetime = None) -> dict:
+        """
+        Returns {"summary": {...}, "period": {...}, "category_breakdown": {...}}.
+
+        summary holds platform-wide totals (requests by current status, users,
+        completed matches); summary.matches_in_window counts matches completed in
+        [match_from, match_to), which defaults to the report period.
+        period and category_breakdown cover requests created (and closed, and
+        matches completed) in [period_start, period_end); either bound may be
+        None for an open-ended period.
+        """
+        start, end = _days(period_start, period_end)
+
+        # 1) category names only (column tuples, not Category objects)
+        categories = db.session.execute(
+            select(Category.categoryID, Category.categoryName).order_by(Category.categoryID)
+        ).all()
+
+        # 2) the only figure the rollups do not hold
+        total_users = db.session.execute(select(func.count()).select_from(UserAccount)).scalar()
+
+        # 3) rollup sums: all-time, the report period and (if different) the match window
+        all_time = rollups.totals()
+        in_period = rollups.window(start, end)
+        if match_from is None and match_to is None:
+            in_match_window = in_period
+        else:
+            in_match_window = rollups.window(*_days(match_from, match_to))
+
+        summary = {"total_requests": 0, "open_requests": 0, "closed_requests": 0, "total_matches": 0}
+        for (category_id, status), counts in all_time.items():
+            summary["total_requests"] += counts["created"]
+            summary["total_matches"] += counts["matched"]
+            if status in ("open", "closed"):
+                summary[f"{status}_requests"] += counts["created"]
+
+        per_category = {}
+        period = {"requests_created": 0, "requests_closed": 0, "matches_completed": 0}
+        for (category_id, status), counts in in_period.items():
+            stats = per_category.setdefault(category_id, {
+                "total_requests": 0,
+                "open_requests": 0,
+                "closed_requests": 0,
+            })
+            stats["total_requests"] += counts["created"]
+            if status in ("open", "closed"):
+                stats[f"{status}_requests"] += counts["created"]
+            period["requests_created"] += counts["created"]
+            period["requests_closed"] += counts["closed"]
+            period["matches_completed"] += counts["matched"]
+
+        breakdown = {}
+        for category_id, name in categories:
+            breakdown[name] = per_category.get(category_id, {
+                "total_requests": 0,
+                "open_requests": 0,
+                "closed_requests": 0,
+            })
+
+        return {
+            "summary": {
+                "total_users": total_users,
+                "total_requests": summary["total_requests"],
+                "open_requests": summary["open_requests"],
+                "closed_requests": summary["closed_requests"],
+                "total_matches": summary["total_matches"],
+                "matches_in_window": sum(c["matched"] for c in in_match_window.values()),
+            },
+            "period": {
+                "start": start.isoformat() if start else None,
+                "end": end.isoformat() if end else None,
+                **period,
+            },
+            "category_breakdown": breakdown,
+        }
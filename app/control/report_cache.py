@@ -0,0 +1,201 @@
+"""
+Report result cache in front of the daily / weekly / monthly report controllers.
+
+Reports are cached in the reports table itself, keyed by (reportType, period).
+The latest report for the key is reused while its dataVersion matches the
+current data version, i.e. no committed ORM write has touched the source
+tables since; otherwise it is recomputed and stamped with the version read
+before the aggregation started (a write racing the aggregation therefore only
+causes one extra recompute later, never a stale hit). This holds for closed
+periods too: besides the period sections every report carries platform-wide
+figures (users, requests by current status, all-time matches) that move on.
+
+The data version is the sum of TableVersion counters for SOURCE_TABLES. An
+after_flush hook notes which source tables each ORM flush writes, and
+before_commit bumps their counters once, in the committing transaction: the
+shared counter rows are locked only for the commit itself, not from the first
+flush on (on PostgreSQL the upsert's row lock lasts until commit).
+
+Core writes bypass the hook. seed.py replaces the reports table anyway; the
+view counter flush (requests.viewCount), shortlist_store (shortlists and
+requests.shortlistCount) and the login rehash (user_accounts.password) change
+columns no report reads. New Core writes to the source tables must call
+bump_versions themselves (see the user import). Hit/miss counters are per
+process and are served by /pm/reports/cache.
+"""
+import threading
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import event, func, select
+from app import db
+from app.entity.report import Report
+from app.entity.table_version import TableVersion
+from app.control.platform_generateDailyReport_controller import PlatformGenerateDailyReportController
+from app.control.platform_generateWeeklyReport_controller import PlatformGenerateWeeklyReportController
+from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
+
+# tables the report controllers read
+SOURCE_TABLES = ("user_accounts", "categories", "requests", "match_records")
+
+# reportType -> (period format, error message, generator(manager_id, period, title, progress))
+REPORT_KINDS = {
+    "daily": ("%Y-%m-%d", "Invalid date format. Use YYYY-MM-DD for daily reports.",
+              lambda uid, period, title, progress: PlatformGenerateDailyReportController().generateDailyReport(
+                  uid, period, title, progress)),
+    "weekly": ("%Y-%m-%d", "Invalid date format. Use YYYY-MM-DD for weekly reports.",
+               lambda uid, period, title, progress: PlatformGenerateWeeklyReportController().generateWeeklyReport(
+                   uid, period, title, progress)),
+    "monthly": ("%Y-%m", "Invalid month format. Use YYYY-MM for monthly reports.",
+                lambda uid, period, title, progress: PlatformGenerateMonthlyReportController().generateMonthlyReport(
+                    uid, period, title, progress)),
+}
+
+
+def normalise_period(kind: str, period: str) -> str:
+    """Checks the period up front (so bad input fails in the request) and returns its canonical form."""
+    if kind not in REPORT_KINDS:
+        raise ValueError("Invalid report type.")
+    fmt, message, _ = REPORT_KINDS[kind]
+    try:
+        return datetime.strptime((period or "").strip(), fmt).strftime(fmt)
+    except ValueError:
+        raise ValueError(message)
+
+
+def data_version() -> int:
+    return db.session.execute(
+        select(func.coalesce(func.sum(TableVersion.version), 0))
+        .where(TableVersion.tableName.in_(SOURCE_TABLES))
+    ).scalar()
+
+
+def bump_versions(conn, tables):
+    """Adds one to each table's write counter (INSERT ... ON CONFLICT)."""
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    table = TableVersion.__table__
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(index_elements=[table.c.tableName],
+                                      set_={"version": table.c.version + 1})
+    conn.execute(stmt, [{"tableName": name, "version": 1} for name in sorted(tables)])
+
+
+# session.info key: source tables written since the transaction began
+_TOUCHED = "report_cache.touched"
+
+
+def _note_flush(session, flush_context):
+    touched = {
+        obj.__table__.name
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if getattr(obj, "__table__", None) is not None and obj.__table__.name in SOURCE_TABLES
+    }
+    if touched:
+        session.info.setdefault(_TOUCHED, set()).update(touched)
+
+
+def _bump_before_commit(session):
+    # commit flushes after before_commit; flush first so its tables are counted
+    session.flush()
+    touched = session.info.pop(_TOUCHED, None)
+    if touched:
+        bump_versions(session.connection(), touched)
+
+
+def _forget_on_end(session, transaction):
+    # a rolled back or closed transaction wrote nothing; savepoints leave the outer set alone
+    if transaction.parent is None:
+        session.info.pop(_TOUCHED, None)
+
+
+event.listen(db.session, "after_flush", _note_flush)
+event.listen(db.session, "before_commit", _bump_before_commit)
+event.listen(db.session, "after_transaction_end", _forget_on_end)
+
+
+class _ReportCacheStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+
+    def count(self, name: str):
+        with self.lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "generated": self.generated,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+class ReportCache:
+    """Flask extension; hit/miss counters live in app.extensions["report_cache"]."""
+
+    def init_app(self, app):
+        app.extensions["report_cache"] = _ReportCacheStats()
+
+    @staticmethod
+    def _stats() -> _ReportCacheStats:
+        return current_app.extensions["report_cache"]
+
+    @staticmethod
+    def _latest(kind: str, period: str):
+        return db.session.scalars(
+            select(Report)
+            .where(Report.reportType == kind, Report.period == period)
+            .order_by(Report.generatedAt.desc(), Report.reportID.desc())
+            .limit(1)
+        ).first()
+
+    @staticmethod
+    def _usable(report) -> bool:
+        if report is None:
+            return False
+        return report.dataVersion is not None and report.dataVersion == data_version()
+
+    def lookup(self, kind: str, period: str):
+        """Returns a reusable Report for (kind, period) or None; counts a hit or a miss."""
+        period = normalise_period(kind, period)
+        report = self._latest(kind, period)
+        if self._usable(report):
+            self._stats().count("hits")
+            return report
+        self._stats().count("misses")
+        return None
+
+    def generate(self, kind: str, period: str, manager_id: int, title: str = None, progress=None):
+        """
+        Returns the cached report if it is still usable (another worker may
+        have produced it), else runs the report controller and stamps the
+        new Report with the data version it was computed from. progress, when
+        given, is called with each stage: "query", "aggregate", "render".
+        """
+        period = normalise_period(kind, period)
+        if progress:
+            progress("query")
+        report = self._latest(kind, period)
+        if self._usable(report):
+            self._stats().count("hits")
+            return report
+        version = data_version()
+        _, _, generate = REPORT_KINDS[kind]
+        report = generate(manager_id, period, title, progress)
+        report.dataVersion = version
+        db.session.commit()
+        self._stats().count("generated")
+        return report
+
+    def stats(self) -> dict:
+        return self._stats().snapshot()
+
+
+report_cache = ReportCache()
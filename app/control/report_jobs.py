@@ -0,0 +1,204 @@
+"""
+Background report generation.
+
+pm_generate_report used to run the report controllers inside the HTTP request.
+On a report cache miss (app/control/report_cache.py) it now calls
+report_jobs.enqueue(), which validates the period, records a
+ReportJob row and hands the job ID to a per-app thread pool
+(REPORT_JOB_WORKERS threads); the page polls the job's status endpoint until
+the worker has written the Report row.
+
+An identical (reportType, period) job that is still queued or running is
+reused instead of starting a second aggregation; the partial unique index on
+report_jobs makes that hold across processes too. Jobs whose worker died
+(process restart) stay active in the table, so active jobs older than
+REPORT_JOB_TIMEOUT seconds (running ones counted from when a worker picked
+them up, queued ones from when they were queued) are marked failed before new
+work is deduplicated against them. A job's progress follows the stages of
+report_cache.generate (STAGE_PROGRESS): query, aggregate, render, done. With REPORT_JOBS_EAGER set (or on an in-memory SQLite
+database) the job runs in the calling thread.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.entity.report_job import ReportJob, ACTIVE_STATUSES
+from app.control.report_cache import normalise_period, report_cache
+
+log = logging.getLogger(__name__)
+
+# percent reached when report_cache.generate enters each stage
+STAGE_PROGRESS = {"query": 10, "aggregate": 30, "render": 80}
+
+
+class _ReportJobState:
+    """Per-app executor (kept in app.extensions so workers use the right app and DB)."""
+
+    def __init__(self, app):
+        self.app = app
+        self.workers = app.config.get("REPORT_JOB_WORKERS", 2)
+        self.timeout = app.config.get("REPORT_JOB_TIMEOUT", 900)
+        # an in-memory SQLite database is one connection shared by every thread,
+        # so a worker would interleave with the request's transaction
+        uri = app.config.get("SQLALCHEMY_DATABASE_URI", "")
+        self.eager = app.config.get("REPORT_JOBS_EAGER", False) or uri in ("sqlite://", "sqlite:///:memory:")
+        self.lock = threading.Lock()
+        self.executor = None
+        self.futures = {}
+
+    def submit(self, job_id: int):
+        if self.eager:
+            self.run(job_id)
+            return
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="report-job")
+            future = self.executor.submit(self.run, job_id)
+            self.futures[job_id] = future
+        future.add_done_callback(lambda _: self.forget(job_id))
+
+    def forget(self, job_id: int):
+        with self.lock:
+            self.futures.pop(job_id, None)
+
+    def run(self, job_id: int):
+        with self.app.app_context():
+            job = db.session.get(ReportJob, job_id)
+            if job is None or job.status != "queued":
+                return
+            job.status, job.progress, job.startedAt = "running", 0, datetime.utcnow()
+            db.session.commit()
+            try:
+                report = report_cache.generate(job.reportType, job.period, job.requestedBy, job.title,
+                                               progress=lambda stage: self.advance(job_id, stage))
+            except Exception as e:
+                log.exception("Report job %s failed.", job_id)
+                db.session.rollback()
+                self.finish(job_id, "failed", error=str(e) or e.__class__.__name__)
+                return
+            self.finish(job_id, "done", report_id=report.reportID)
+
+    @staticmethod
+    def advance(job_id: int, stage: str):
+        # nothing has been written yet at a stage boundary, so committing here is safe
+        db.session.execute(
+            update(ReportJob).where(ReportJob.jobID == job_id).values(progress=STAGE_PROGRESS[stage])
+        )
+        db.session.commit()
+
+    @staticmethod
+    def finish(job_id: int, status: str, report_id: int = None, error: str = None):
+        job = db.session.get(ReportJob, job_id)
+        job.status, job.reportID, job.error = status, report_id, error
+        job.progress = 100
+        job.finishedAt = datetime.utcnow()
+        db.session.commit()
+
+
+class ReportJobs:
+    """Flask extension front-end; use the module-level `report_jobs` instance."""
+
+    def init_app(self, app):
+        app.extensions["report_jobs"] = _ReportJobState(app)
+
+    @staticmethod
+    def _state() -> _ReportJobState:
+        return current_app.extensions["report_jobs"]
+
+    def enqueue(self, kind: str, period: str, manager_id: int, title: str = None):
+        """
+        Queues a report and returns (job, created). created is False when an
+        identical job was already in flight and that job is returned instead.
+        Raises ValueError for an unknown type or malformed period.
+        """
+        period = normalise_period(kind, period)
+        self.expire_stale()
+
+        existing = self.active_job(kind, period)
+        if existing is not None:
+            return existing, False
+
+        job = ReportJob(reportType=kind, period=period, title=title or None,
+                        requestedBy=manager_id, status="queued", progress=0)
+        db.session.add(job)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # another request queued the same report between our check and insert
+            db.session.rollback()
+            existing = self.active_job(kind, period)
+            if existing is None:
+                raise
+            return existing, False
+
+        self._state().submit(job.jobID)
+        db.session.expire(job)  # the worker updates the row from its own session
+        return job, True
+
+    @staticmethod
+    def active_job(kind: str, period: str):
+        return db.session.scalars(
+            select(ReportJob).where(
+                ReportJob.reportType == kind,
+                ReportJob.period == period,
+                ReportJob.status.in_(ACTIVE_STATUSES),
+            )
+        ).first()
+
+    def expire_stale(self) -> int:
+        """
+        Fails jobs whose worker is gone: running for longer than
+        REPORT_JOB_TIMEOUT, or queued for longer than that. Returns how many.
+        """
+        timeout = self._state().timeout
+        if not timeout:
+            return 0
+        cutoff = datetime.utcnow() - timedelta(seconds=timeout)
+        result = db.session.execute(
+            update(ReportJob)
+            .where(or_(
+                # a job that waited in the queue is timed from when a worker picked it up
+                and_(ReportJob.status == "running",
+                     func.coalesce(ReportJob.startedAt, ReportJob.createdAt) < cutoff),
+                and_(ReportJob.status == "queued", ReportJob.createdAt < cutoff),
+            ))
+            .values(status="failed", error="Timed out.", finishedAt=datetime.utcnow())
+        )
+        if result.rowcount:
+            db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def get(job_id: int):
+        return db.session.get(ReportJob, job_id)
+
+    @staticmethod
+    def recent(manager_id: int, limit: int = 5):
+        """The manager's jobs from the last day that have not produced a report (active or failed)."""
+        return db.session.scalars(
+            select(ReportJob)
+            .where(
+                ReportJob.requestedBy == manager_id,
+                ReportJob.status != "done",
+                ReportJob.createdAt >= datetime.utcnow() - timedelta(days=1),
+            )
+            .order_by(ReportJob.createdAt.desc(), ReportJob.jobID.desc())
+            .limit(limit)
+        ).all()
+
+    def wait(self, job_id: int, timeout: float = None):
+        """Blocks until this process's worker has finished job_id (tests and CLI use)."""
+        state = self._state()
+        with state.lock:
+            future = state.futures.get(job_id)
+        if future is not None:
+            future.result(timeout)
+        db.session.expire_all()
+        return self.get(job_id)
+
+
+report_jobs = ReportJobs()
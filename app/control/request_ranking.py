@@ -0,0 +1,215 @@
+"""
+"Recommended" ordering of open requests for a CSR rep.
+
+Each open request is scored for the rep from three features:
+
+- category affinity: how often the rep completed matches (MatchRecord) or
+  shortlisted requests (Shortlist) in the request's category, scaled to 0..1;
+- recency: 0.5 ** (age in days / RANKING_HALF_LIFE_DAYS);
+- popularity: log1p(views + SHORTLIST_BOOST * shortlists), scaled to 0..1;
+
+combined with the RANKING_WEIGHTS. The per-request features live in a
+RankingMatrix of NumPy arrays over all open requests (sorted by requestID),
+kept per process in app.extensions["request_ranking"], so a page of the
+top-K is an argpartition over arrays instead of a query that scores every
+row. Only the rep's two grouped history queries run per call.
+
+Keeping the matrix current:
+- view and shortlist counts change on almost every click; view_counter and
+  shortlist_store report their writes here and the counts are patched in
+  place (no reload);
+- created / updated / closed / deleted requests bump the requests
+  TableVersion; it is read at most every RANKING_TTL seconds and a change
+  rebuilds the matrix with one narrow query;
+- counts written by other worker processes are picked up by a rebuild once
+  the matrix is RANKING_MAX_AGE seconds old.
+"""
+import threading
+import time
+from datetime import datetime
+import numpy as np
+from flask import current_app
+from sqlalchemy import func, select
+from app import db
+from app.entity.match_record import MatchRecord
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.entity.table_version import TableVersion
+
+# one shortlist says more about interest than one view
+SHORTLIST_BOOST = 5.0
+# a completed match says more about a rep's focus than a shortlist entry
+SHORTLIST_AFFINITY = 0.5
+DEFAULT_WEIGHTS = {"affinity": 0.6, "recency": 0.25, "popularity": 0.15}
+
+_DAY = np.timedelta64(1, "D")
+
+
+def _version(session) -> int:
+    return session.execute(
+        select(TableVersion.version).where(TableVersion.tableName == Request.__tablename__)
+    ).scalar() or 0
+
+
+class RankingMatrix:
+    """Feature arrays for the open requests at one requests-table version."""
+
+    def __init__(self, version: int, rows):
+        self.version = version
+        self.built_at = time.monotonic()
+        columns = list(zip(*rows)) or [(), (), (), (), ()]
+        self.ids = np.array(columns[0], dtype=np.int64)
+        self.categories = np.array(columns[1], dtype=np.int64)
+        self.created = np.array(columns[2], dtype="datetime64[s]")
+        self.views = np.array([v or 0 for v in columns[3]], dtype=np.float64)
+        self.shortlists = np.array([s or 0 for s in columns[4]], dtype=np.float64)
+
+    def __len__(self):
+        return self.ids.size
+
+    def positions(self, request_ids):
+        """Array positions of the given requestIDs that are in the matrix, and which of the inputs they are."""
+        keys = np.asarray(request_ids, dtype=np.int64)
+        pos = np.searchsorted(self.ids, keys)
+        found = pos < self.ids.size
+        found[found] = self.ids[pos[found]] == keys[found]
+        return pos[found], found
+
+    def add(self, column, request_ids, amounts):
+        pos, found = self.positions(request_ids)
+        target = getattr(self, column)
+        np.add.at(target, pos, np.asarray(amounts, dtype=np.float64)[found])
+        np.maximum(target, 0, out=target)
+
+    def scores(self, idx, affinity, weights, half_life_days: float, now: datetime):
+        """Scores of the requests at positions idx for one rep's affinity vector."""
+        cats = self.categories[idx]
+        aff = np.zeros(idx.size)
+        known = cats < affinity.size
+        aff[known] = affinity[cats[known]]
+
+        age = (np.datetime64(now, "s") - self.created[idx]) / _DAY
+        recency = 0.5 ** (np.maximum(age, 0) / half_life_days)
+
+        popularity = np.log1p(self.views[idx] + SHORTLIST_BOOST * self.shortlists[idx])
+        top = popularity.max(initial=0.0)
+        if top > 0:
+            popularity /= top
+
+        return (weights["affinity"] * aff + weights["recency"] * recency
+                + weights["popularity"] * popularity)
+
+
+class _RankingState:
+    def __init__(self, app):
+        self.ttl = app.config.get("RANKING_TTL", 10.0)
+        self.max_age = app.config.get("RANKING_MAX_AGE", 300.0)
+        self.half_life = app.config.get("RANKING_HALF_LIFE_DAYS", 14.0)
+        self.weights = {**DEFAULT_WEIGHTS, **app.config.get("RANKING_WEIGHTS", {})}
+        self.lock = threading.Lock()
+        self.matrix = None
+        self.checked_at = 0.0
+
+
+class RequestRanking:
+    """Flask extension; use the module-level `request_ranking` instance."""
+
+    def init_app(self, app):
+        app.extensions["request_ranking"] = _RankingState(app)
+
+    @staticmethod
+    def _state() -> _RankingState:
+        return current_app.extensions["request_ranking"]
+
+    def matrix(self) -> RankingMatrix:
+        state = self._state()
+        now = time.monotonic()
+        matrix = state.matrix
+        if matrix is not None and now - state.checked_at < state.ttl and now - matrix.built_at < state.max_age:
+            return matrix
+        with state.lock:
+            matrix = state.matrix
+            if matrix is None or now - matrix.built_at >= state.max_age or _version(db.session) != matrix.version:
+                state.matrix = self._build()
+            state.checked_at = now
+            return state.matrix
+
+    @staticmethod
+    def _build() -> RankingMatrix:
+        # version first: a write landing between the two reads only causes an extra rebuild later
+        version = _version(db.session)
+        rows = db.session.execute(
+            select(Request.requestID, Request.categoryID, Request.createdAt,
+                   Request.viewCount, Request.shortlistCount)
+            .where(Request.status == "open")
+            .order_by(Request.requestID)
+        ).all()
+        return RankingMatrix(version, rows)
+
+    @staticmethod
+    def affinity(csr_id: int) -> np.ndarray:
+        """The rep's category affinity, indexed by categoryID and scaled to 0..1 (all zero without history)."""
+        matches = db.session.execute(
+            select(MatchRecord.categoryID, func.count())
+            .where(MatchRecord.csrRepID == csr_id)
+            .group_by(MatchRecord.categoryID)
+        ).all()
+        shortlisted = db.session.execute(
+            select(Request.categoryID, func.count())
+            .select_from(Shortlist)
+            .join(Request, Request.requestID == Shortlist.requestID)
+            .where(Shortlist.csrRepID == csr_id)
+            .group_by(Request.categoryID)
+        ).all()
+        history = [(cat, float(n)) for cat, n in matches] + [(cat, SHORTLIST_AFFINITY * n) for cat, n in shortlisted]
+        if not history:
+            return np.zeros(0)
+        cats = np.array([cat for cat, _ in history], dtype=np.int64)
+        vector = np.zeros(cats.max() + 1)
+        np.add.at(vector, cats, [n for _, n in history])
+        return vector / vector.max()
+
+    def top(self, csr_id: int, category_ids, request_ids=None, page: int = 1, per_page: int = 9):
+        """
+        One page of the rep's ranking among open requests in category_ids
+        (and in request_ids, when given). Returns (requestIDs best first,
+        number of candidates); ties go to the newer request.
+        """
+        state = self._state()
+        matrix = self.matrix()
+        mask = np.isin(matrix.categories, np.asarray(list(category_ids), dtype=np.int64))
+        if request_ids is not None:
+            mask &= np.isin(matrix.ids, np.asarray(list(request_ids), dtype=np.int64))
+        candidates = np.flatnonzero(mask)
+        total = int(candidates.size)
+        start = (max(page, 1) - 1) * per_page
+        k = min(start + per_page, total)
+        if start >= k:
+            return [], total
+
+        scores = matrix.scores(candidates, self.affinity(csr_id), state.weights, state.half_life,
+                               datetime.utcnow())
+        best = np.arange(total) if k == total else np.argpartition(-scores, k - 1)[:k]
+        ids = matrix.ids[candidates[best]]
+        order = np.lexsort((-ids, -scores[best]))
+        return ids[order][start:k].tolist(), total
+
+    # ---- in-place updates from the write paths ----
+    def note_views(self, counts):
+        """view_counter wrote {requestID: views}."""
+        self._patch("views", list(counts), list(counts.values()))
+
+    def note_shortlists(self, request_ids, delta: int):
+        """shortlist_store added (+1) or removed (-1) one entry for each of request_ids."""
+        self._patch("shortlists", list(request_ids), [delta] * len(request_ids))
+
+    def _patch(self, column, request_ids, amounts):
+        state = current_app.extensions.get("request_ranking")
+        if state is None or not request_ids:
+            return
+        with state.lock:
+            if state.matrix is not None:
+                state.matrix.add(column, request_ids, amounts)
+
+
+request_ranking = RequestRanking()
@@ -0,0 +1,161 @@
+"""
+Keyword search over Request.title / Request.description.
+
+Search controllers call `search_backend().apply(query, keyword)` to restrict a
+Request query to the matching rows, ranked best-first. Queries that an index
+already narrows to a handful of rows (one PIN's own requests) use
+`narrow(query, keyword)` instead: testing those few rows directly is cheaper
+than running the full-text query over the whole table
+(see benchmarks/bench_search.py). Backends:
+
+- Fts5Backend (SQLite): an external-content FTS5 table `requests_fts` that
+  triggers on `requests` keep in sync. Keywords are matched as token
+  prefixes ("wheel chair" finds "wheelchair repair"), all terms must match,
+  and rows are ranked with bm25() with the title weighted above the
+  description.
+- LikeBackend: portable fallback (ILIKE per term on title or description,
+  newest first) for other databases or when FTS5 is not compiled in.
+
+The FTS table and triggers are installed by app.migrations (install_search_index),
+which also back-fills rows that existed before the index.
+SEARCH_BACKEND config: "auto" (default), "fts5" or "like".
+"""
+import re
+from abc import ABC, abstractmethod
+from flask import current_app
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+from app import db
+from app.entity.request import Request
+
+FTS_TABLE = "requests_fts"
+fts_rows = table(FTS_TABLE, column("rowid"))
+# WITH ... AS MATERIALIZED needs SQLite 3.35 (FTS5 itself is much older)
+MATERIALIZED_SINCE = (3, 35, 0)
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def keyword_terms(keyword: str) -> list:
+    """Splits free text into search terms (punctuation and FTS syntax are dropped)."""
+    return _TOKEN.findall(keyword or "")[:16]
+
+
+class SearchBackend(ABC):
+    name = "base"
+
+    @abstractmethod
+    def apply(self, query, keyword: str):
+        """Returns `query` restricted to requests matching keyword, ordered by relevance."""
+
+    def narrow(self, query, keyword: str):
+        """Filters an already index-bounded query row by row; keeps its ordering."""
+        for term in keyword_terms(keyword):
+            pattern = f"%{term}%"
+            query = query.filter(or_(Request.title.ilike(pattern), Request.description.ilike(pattern)))
+        return query
+
+
+class LikeBackend(SearchBackend):
+    name = "like"
+
+    def apply(self, query, keyword):
+        return self.narrow(query, keyword)
+
+
+class Fts5Backend(SearchBackend):
+    name = "fts5"
+    # bm25 column weights: title, description
+    WEIGHTS = (10.0, 1.0)
+
+    DDL = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        " title, description, content='requests', content_rowid='requestID',"
+        " tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS requests_fts_ai AFTER INSERT ON requests BEGIN"
+        f" INSERT INTO {FTS_TABLE}(rowid, title, description)"
+        " VALUES (new.\"requestID\", new.title, new.description); END",
+        f"CREATE TRIGGER IF NOT EXISTS requests_fts_ad AFTER DELETE ON requests BEGIN"
+        f" INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)"
+        " VALUES ('delete', old.\"requestID\", old.title, old.description); END",
+        f"CREATE TRIGGER IF NOT EXISTS requests_fts_au AFTER UPDATE OF \"requestID\", title, description"
+        f" ON requests BEGIN"
+        f" INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)"
+        " VALUES ('delete', old.\"requestID\", old.title, old.description);"
+        f" INSERT INTO {FTS_TABLE}(rowid, title, description)"
+        " VALUES (new.\"requestID\", new.title, new.description); END",
+    ]
+
+    @staticmethod
+    def supported(conn) -> bool:
+        if conn.dialect.name != "sqlite":
+            return False
+        options = {row[0] for row in conn.exec_driver_sql("PRAGMA compile_options")}
+        return "ENABLE_FTS5" in options
+
+    @staticmethod
+    def installed(conn) -> bool:
+        return conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :n"), {"n": FTS_TABLE}
+        ).first() is not None
+
+    def install(self, conn) -> bool:
+        """Creates the FTS table + triggers if missing and indexes existing rows."""
+        if not self.supported(conn) or self.installed(conn):
+            return False
+        for ddl in self.DDL:
+            conn.exec_driver_sql(ddl)
+        conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        return True
+
+    @staticmethod
+    def match_expression(keyword: str) -> str:
+        # every term quoted (no FTS operators from user input) and prefix-matched
+        return " ".join(f'"{term}"*' for term in keyword_terms(keyword))
+
+    def apply(self, query, keyword):
+        expr = self.match_expression(keyword)
+        if not expr:
+            return query
+        fts = literal_column(FTS_TABLE)
+        # Run the MATCH once, up front: joined directly, SQLite drives the join
+        # from `requests` and re-runs the full-text query for every row.
+        hits = (
+            select(fts_rows.c.rowid.label("requestID"), func.bm25(fts, *self.WEIGHTS).label("rank"))
+            .where(fts.op("MATCH")(expr))
+            .cte("fts_hits")
+        )
+        if db.session.get_bind().dialect.dbapi.sqlite_version_info >= MATERIALIZED_SINCE:
+            hits = hits.prefix_with("MATERIALIZED")
+        return (
+            query.join(hits, hits.c.requestID == Request.requestID)
+            .order_by(None)
+            .order_by(hits.c.rank, Request.requestID.desc())
+        )
+
+
+BACKENDS = {"fts5": Fts5Backend, "like": LikeBackend}
+
+
+def search_backend() -> SearchBackend:
+    """Returns the configured backend for the current app (cached in app.extensions)."""
+    backend = current_app.extensions.get("request_search")
+    if backend is None:
+        choice = current_app.config.get("SEARCH_BACKEND", "auto")
+        if choice == "auto":
+            with db.engine.connect() as conn:
+                choice = "fts5" if Fts5Backend.supported(conn) and Fts5Backend.installed(conn) else "like"
+        backend = current_app.extensions["request_search"] = BACKENDS[choice]()
+    return backend
+
+
+def install_search_index(conn):
+    """Migration step: installs the FTS5 index where the database supports it."""
+    return Fts5Backend().install(conn)
+
+
+def drop_search_index(conn):
+    """Removes the FTS table and its triggers (e.g. before a bulk reload; upgrade() rebuilds it)."""
+    if conn.dialect.name != "sqlite":
+        return
+    for trigger in ("requests_fts_ai", "requests_fts_ad", "requests_fts_au"):
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE}")
@@ -0,0 +1,234 @@
+"""
+Incremental daily rollups for the report controllers.
+
+DailyRollup keeps, per (day, category, status), how many requests were
+created and closed and how many matches were completed that day, so a
+daily/weekly/monthly report sums at most 31 rows per category and status
+instead of scanning the requests table.
+
+The counts follow the ORM write paths: before each flush the contribution of
+every new, changed and deleted Request / MatchRecord is turned into +1/-1
+deltas (old values come from attribute history), and after the flush the
+deltas are applied as upserts on the same connection, so they commit or roll
+back with the rows they describe. Deleting a Request also deletes its match
+records through the ORM (instead of leaving them to ON DELETE CASCADE), so
+their matches are retracted too. Core bulk loads (seed.py, the benchmark
+datagen) bypass the ORM; rebuild() recomputes the table from the base tables
+and migrations backfill it when it is empty.
+"""
+from collections import Counter
+from datetime import date, datetime
+from sqlalchemy import event, func, inspect, select
+from app import db
+from app.entity.daily_rollup import DailyRollup
+from app.entity.request import Request
+from app.entity.match_record import MatchRecord
+
+COUNTERS = ("created", "closed", "matched")
+
+# attributes whose old value is needed to retract a row's previous contribution
+TRACKED = {
+    Request: ("createdAt", "closedAt", "categoryID", "status"),
+    MatchRecord: ("completedAt", "categoryID", "status"),
+}
+
+
+def _day(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return None
+
+
+def _contributions(model, values: dict):
+    """Yields ((day, categoryID, status), counter) cells the row counts towards."""
+    status = values["status"] or ""
+    if model is Request:
+        yield (_day(values["createdAt"]), values["categoryID"], status), "created"
+        if values["closedAt"] is not None:
+            yield (_day(values["closedAt"]), values["categoryID"], status), "closed"
+    elif values["completedAt"] is not None:
+        yield (_day(values["completedAt"]), values["categoryID"], status), "matched"
+
+
+def _apply_defaults(obj, names):
+    """Fills column defaults the INSERT would apply, so new rows land in the right cell."""
+    table = type(obj).__table__
+    for name in names:
+        if getattr(obj, name) is not None:
+            continue
+        default = table.c[name].default
+        if default is not None and default.is_scalar:
+            setattr(obj, name, default.arg)
+        elif name == "createdAt":
+            # func.now() runs in the database; stamp in Python so row and rollup agree on the day
+            setattr(obj, name, datetime.utcnow())
+
+
+def _current(obj, names):
+    return {name: getattr(obj, name) for name in names}
+
+
+def _previous(obj, names):
+    state = inspect(obj)
+    values = {}
+    for name in names:
+        history = state.attrs[name].history
+        values[name] = history.deleted[0] if history.deleted else getattr(obj, name)
+    return values
+
+
+def _cascade_matches(session):
+    """Marks the match records of deleted requests deleted (passive_deletes never loads them)."""
+    ids = [obj.requestID for obj in session.deleted if isinstance(obj, Request) and obj.requestID is not None]
+    if not ids:
+        return
+    for record in session.scalars(select(MatchRecord).where(MatchRecord.requestID.in_(ids))):
+        if record not in session.deleted:
+            session.delete(record)
+
+
+def _collect(session, flush_context, instances):
+    _cascade_matches(session)
+    deltas = session.info.setdefault("rollup_deltas", Counter())
+    for obj in session.new:
+        names = TRACKED.get(type(obj))
+        if names is None:
+            continue
+        _apply_defaults(obj, names)
+        for cell, counter in _contributions(type(obj), _current(obj, names)):
+            deltas[cell + (counter,)] += 1
+    for obj in session.deleted:
+        names = TRACKED.get(type(obj))
+        if names is None:
+            continue
+        for cell, counter in _contributions(type(obj), _previous(obj, names)):
+            deltas[cell + (counter,)] -= 1
+    for obj in session.dirty:
+        names = TRACKED.get(type(obj))
+        if names is None or obj in session.deleted or not session.is_modified(obj):
+            continue
+        for cell, counter in _contributions(type(obj), _previous(obj, names)):
+            deltas[cell + (counter,)] -= 1
+        for cell, counter in _contributions(type(obj), _current(obj, names)):
+            deltas[cell + (counter,)] += 1
+
+
+def _apply(session, flush_context):
+    deltas = session.info.pop("rollup_deltas", None)
+    if deltas:
+        apply_deltas(session.connection(), deltas)
+
+
+def _discard(session, *args):
+    session.info.pop("rollup_deltas", None)
+
+
+def _upsert(conn):
+    """INSERT ... ON CONFLICT that adds the new counts to an existing cell."""
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    stmt = insert(DailyRollup.__table__)
+    table = DailyRollup.__table__
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.day, table.c.categoryID, table.c.status],
+        set_={name: table.c[name] + stmt.excluded[name] for name in COUNTERS},
+    )
+
+
+def apply_deltas(conn, deltas: Counter):
+    """Adds {(day, categoryID, status, counter): n} to the rollup table."""
+    cells = {}
+    for (day, category_id, status, counter), n in deltas.items():
+        if n:
+            row = cells.setdefault((day, category_id, status), dict.fromkeys(COUNTERS, 0))
+            row[counter] += n
+    if not cells:
+        return 0
+    conn.execute(_upsert(conn), [
+        {"day": day, "categoryID": category_id, "status": status, **counts}
+        for (day, category_id, status), counts in cells.items()
+    ])
+    return len(cells)
+
+
+def rebuild(conn=None) -> int:
+    """Recomputes every rollup cell from requests and match_records; returns cells written."""
+    conn = conn if conn is not None else db.session.connection()
+    deltas = Counter()
+    status = func.coalesce(Request.status, "")
+    for column, counter in ((Request.createdAt, "created"), (Request.closedAt, "closed")):
+        rows = conn.execute(
+            select(func.date(column), Request.categoryID, status, func.count())
+            .where(column.isnot(None))
+            .group_by(func.date(column), Request.categoryID, status)
+        )
+        for day, category_id, st, n in rows:
+            deltas[(_day(day), category_id, st, counter)] += n
+    status = func.coalesce(MatchRecord.status, "")
+    rows = conn.execute(
+        select(func.date(MatchRecord.completedAt), MatchRecord.categoryID, status, func.count())
+        .where(MatchRecord.completedAt.isnot(None))
+        .group_by(func.date(MatchRecord.completedAt), MatchRecord.categoryID, status)
+    )
+    for day, category_id, st, n in rows:
+        deltas[(_day(day), category_id, st, "matched")] += n
+
+    conn.execute(DailyRollup.__table__.delete())
+    return apply_deltas(conn, deltas)
+
+
+def backfill_rollups(conn):
+    """Migration step: builds the rollups for a database that has requests but no rollup rows."""
+    if conn.execute(select(DailyRollup.day).limit(1)).first() is not None:
+        return False
+    if conn.execute(select(Request.requestID).limit(1)).first() is None:
+        return False
+    rebuild(conn)
+    return True
+
+
+def window(start: date = None, end: date = None):
+    """
+    Sums the rollups for days in [start, end) (either side open when None).
+    Returns {(categoryID, status): {"created": n, "closed": n, "matched": n}}.
+    """
+    criteria = []
+    if start is not None:
+        criteria.append(DailyRollup.day >= start)
+    if end is not None:
+        criteria.append(DailyRollup.day < end)
+    rows = db.session.execute(
+        select(
+            DailyRollup.categoryID, DailyRollup.status,
+            *(func.sum(DailyRollup.__table__.c[name]) for name in COUNTERS),
+        )
+        .where(*criteria)
+        .group_by(DailyRollup.categoryID, DailyRollup.status)
+    ).all()
+    return {(category_id, status): dict(zip(COUNTERS, counts)) for category_id, status, *counts in rows}
+
+
+def totals():
+    """All-time sums per (categoryID, status), same shape as window()."""
+    return window()
+
+
+# set-listeners with active_history make the ORM load the old value on assignment,
+# so the previous contribution can always be retracted
+def _noop(target, value, oldvalue, initiator):
+    return value
+
+
+for _model, _names in TRACKED.items():
+    for _name in _names:
+        event.listen(getattr(_model, _name), "set", _noop, active_history=True, retval=True)
+
+event.listen(db.session, "before_flush", _collect)
+event.listen(db.session, "after_flush", _apply)
+event.listen(db.session, "after_rollback", _discard)
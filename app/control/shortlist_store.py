@@ -0,0 +1,154 @@
+"""
+Atomic shortlist mutations shared by the save/remove shortlist controllers.
+
+Each mutation is one transaction: an insert-or-ignore (or delete) keyed on the
+unique (csrRepID, requestID) index that RETURNs the affected requestIDs,
+followed by a SQL-side shortlistCount update for exactly those rows. Databases
+without ON CONFLICT ... RETURNING (SQLite before 3.35, MySQL, ...) select the
+candidate rows first and insert / delete them one at a time, keeping only the
+ones their own statement changed (a duplicate insert only rolls back its
+SAVEPOINT). No
+check-then-insert, no Python-side counter arithmetic, so concurrent clicks
+cannot create duplicates or make the counter drift. A change also bumps the
+CSR's own TableVersion row ("shortlists:<csrRepID>") in the same transaction;
+pages showing one CSR's shortlist validate against it.
+"""
+from sqlalchemy import case, func, insert, literal, select, update, delete
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.control.request_ranking import request_ranking
+from app.control.report_cache import bump_versions
+
+shortlists = Shortlist.__table__
+requests = Request.__table__
+
+
+# SQLite gained INSERT / DELETE ... RETURNING in 3.35 (ON CONFLICT in 3.24)
+SQLITE_RETURNING_SINCE = (3, 35, 0)
+
+
+def _set_based() -> bool:
+    """True when the database runs INSERT ... ON CONFLICT DO NOTHING ... RETURNING."""
+    dialect = db.session.get_bind().dialect
+    if dialect.name == "postgresql":
+        return True
+    return dialect.name == "sqlite" and dialect.dbapi.sqlite_version_info >= SQLITE_RETURNING_SINCE
+
+
+def _insert_new(csr_id: int, request_ids: list) -> list:
+    """Inserts the missing shortlist rows for existing requests; returns their requestIDs."""
+    if _set_based():
+        if db.session.get_bind().dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        source = select(requests.c.requestID, literal(csr_id)).where(requests.c.requestID.in_(request_ids))
+        stmt = (
+            dialect_insert(shortlists)
+            .from_select(["requestID", "csrRepID"], source)
+            .on_conflict_do_nothing()
+            .returning(shortlists.c.requestID)
+        )
+        return db.session.execute(stmt).scalars().all()
+
+    existing = db.session.execute(
+        select(requests.c.requestID).where(requests.c.requestID.in_(request_ids))
+    ).scalars().all()
+    added = []
+    for request_id in existing:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(shortlists).values(csrRepID=csr_id, requestID=request_id))
+        except IntegrityError:
+            continue
+        added.append(request_id)
+    return added
+
+
+def _delete_existing(csr_id: int, request_ids: list) -> list:
+    """Deletes the CSR's shortlist rows for request_ids; returns their requestIDs."""
+    where = (shortlists.c.csrRepID == csr_id, shortlists.c.requestID.in_(request_ids))
+    if _set_based():
+        return db.session.execute(delete(shortlists).where(*where).returning(shortlists.c.requestID)).scalars().all()
+
+    candidates = db.session.execute(select(shortlists.c.requestID).where(*where)).scalars().all()
+    removed = []
+    for request_id in candidates:
+        # a concurrent remove may have deleted the row since the SELECT
+        result = db.session.execute(
+            delete(shortlists).where(shortlists.c.csrRepID == csr_id, shortlists.c.requestID == request_id)
+        )
+        if result.rowcount:
+            removed.append(request_id)
+    return removed
+
+
+def _bump(request_ids, delta: int):
+    if not request_ids:
+        return
+    count = func.coalesce(requests.c.shortlistCount, 0)
+    new_value = count + delta if delta > 0 else case((count + delta > 0, count + delta), else_=0)
+    db.session.execute(
+        update(requests).where(requests.c.requestID.in_(request_ids)).values(shortlistCount=new_value)
+    )
+
+
+def add_many(csr_id: int, request_ids) -> list:
+    """Shortlists every existing request in request_ids; returns the newly added requestIDs."""
+    request_ids = sorted(set(request_ids))
+    if not request_ids:
+        return []
+    try:
+        added = _insert_new(csr_id, request_ids)
+        _bump(added, +1)
+        if added:
+            bump_versions(db.session.connection(), {version_name(csr_id)})
+        db.session.commit()
+        request_ranking.note_shortlists(added, +1)
+        return added
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def remove_many(csr_id: int, request_ids) -> list:
+    """Removes the CSR's shortlist entries for request_ids; returns the removed requestIDs."""
+    request_ids = sorted(set(request_ids))
+    if not request_ids:
+        return []
+    try:
+        removed = _delete_existing(csr_id, request_ids)
+        _bump(removed, -1)
+        if removed:
+            bump_versions(db.session.connection(), {version_name(csr_id)})
+        db.session.commit()
+        request_ranking.note_shortlists(removed, -1)
+        return removed
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def version_name(csr_id: int) -> str:
+    """TableVersion row counting one CSR's shortlist changes (ordinary table rows use the table name)."""
+    return f"{shortlists.name}:{csr_id}"
+
+
+def reconcile_counts() -> int:
+    """
+    Recomputes Request.shortlistCount from the shortlists table in one
+    correlated UPDATE that rewrites only the rows that drifted. Returns the
+    number of rows fixed.
+    """
+    actual = (
+        select(func.count()).select_from(shortlists)
+        .where(shortlists.c.requestID == requests.c.requestID)
+        .scalar_subquery()
+    )
+    result = db.session.execute(
+        update(requests).where(requests.c.shortlistCount.is_distinct_from(actual)).values(shortlistCount=actual)
+    )
+    db.session.commit()
+    return result.rowcount
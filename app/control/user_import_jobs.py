@@ -0,0 +1,158 @@
+"""
+Background CSV user imports for the admin upload page.
+
+Hashing thousands of passwords at full scrypt cost takes minutes, far past a
+web worker's request timeout, so admin_import_users no longer imports inside
+the request. user_import_jobs.enqueue() checks the CSV header, stores the
+upload on an ImportJob row and hands the job ID to a per-app single-thread
+executor; the worker runs the import controller with a spawned hashing pool
+(USER_IMPORT_HASH_WORKERS processes) and records the counts and the first
+rejected rows on the job, which the import page polls. Running jobs older
+than USER_IMPORT_JOB_TIMEOUT seconds (their worker is gone) are marked
+failed. With USER_IMPORT_JOBS_EAGER set (or on an in-memory SQLite database)
+the job runs in the calling thread and hashes in-process.
+"""
+import csv
+import io
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import and_, or_, update
+from app import db
+from app.entity.import_job import ImportJob, MAX_STORED_ERRORS
+from app.control.useradmin_importUserAccounts_controller import (
+    UserAdminImportUserAccountsController,
+    missing_columns,
+)
+
+log = logging.getLogger(__name__)
+
+
+class _ImportJobState:
+    """Per-app executor (kept in app.extensions so the worker uses the right app and DB)."""
+
+    def __init__(self, app):
+        self.app = app
+        self.hash_workers = app.config.get("USER_IMPORT_HASH_WORKERS", 1)
+        self.timeout = app.config.get("USER_IMPORT_JOB_TIMEOUT", 3600)
+        # an in-memory SQLite database is one connection shared by every thread
+        uri = app.config.get("SQLALCHEMY_DATABASE_URI", "")
+        self.eager = app.config.get("USER_IMPORT_JOBS_EAGER", False) or uri in ("sqlite://", "sqlite:///:memory:")
+        self.lock = threading.Lock()
+        self.executor = None
+        self.futures = {}
+
+    def submit(self, job_id: int):
+        if self.eager:
+            self.run(job_id)
+            return
+        with self.lock:
+            if self.executor is None:
+                # one import at a time per process; each one already fans out to the hashing pool
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="user-import")
+            future = self.executor.submit(self.run, job_id)
+            self.futures[job_id] = future
+        future.add_done_callback(lambda _: self.forget(job_id))
+
+    def forget(self, job_id: int):
+        with self.lock:
+            self.futures.pop(job_id, None)
+
+    def run(self, job_id: int):
+        with self.app.app_context():
+            job = db.session.get(ImportJob, job_id)
+            if job is None or job.status != "queued":
+                return
+            job.status, job.startedAt = "running", datetime.utcnow()
+            data, profile_id = job.upload, job.defaultProfileID
+            db.session.commit()
+            try:
+                result = UserAdminImportUserAccountsController().importUserAccounts(
+                    io.TextIOWrapper(io.BytesIO(data), encoding="utf-8-sig", newline=""), profile_id,
+                    hash_workers=1 if self.eager else self.hash_workers,
+                )
+            except Exception as e:
+                log.exception("User import job %s failed.", job_id)
+                db.session.rollback()
+                self.finish(job_id, "failed", error=str(e) or e.__class__.__name__)
+                return
+            self.finish(job_id, "done", created=result.created, rejected=result.rejected,
+                        errors=result.errors[:MAX_STORED_ERRORS])
+
+    @staticmethod
+    def finish(job_id: int, status: str, created: int = 0, rejected: int = 0, errors=(), error: str = None):
+        job = db.session.get(ImportJob, job_id)
+        job.status, job.created, job.rejected, job.error = status, created, rejected, error
+        job.errors = json.dumps(list(errors)) if errors else None
+        job.upload = None   # the passwords in the file are not kept
+        job.finishedAt = datetime.utcnow()
+        db.session.commit()
+
+
+class UserImportJobs:
+    """Flask extension front-end; use the module-level `user_import_jobs` instance."""
+
+    def init_app(self, app):
+        app.extensions["user_import_jobs"] = _ImportJobState(app)
+
+    @staticmethod
+    def _state() -> _ImportJobState:
+        return current_app.extensions["user_import_jobs"]
+
+    def enqueue(self, data: bytes, filename: str, default_profile_id: int, admin_id: int) -> ImportJob:
+        """
+        Queues an import of the CSV bytes and returns the job. Raises
+        ValueError when the header lacks a required column, so a wrong file
+        is reported in the request.
+        """
+        header = next(csv.reader(io.StringIO(data[:64 * 1024].decode("utf-8-sig", errors="replace"))), [])
+        missing = missing_columns(header)
+        if missing:
+            raise ValueError(f"CSV is missing required column(s): {', '.join(missing)}.")
+        self.expire_stale()
+
+        job = ImportJob(requestedBy=admin_id, filename=(filename or "")[:255] or None,
+                        defaultProfileID=default_profile_id, status="queued", upload=data)
+        db.session.add(job)
+        db.session.commit()
+        self._state().submit(job.jobID)
+        db.session.expire(job)  # the worker updates the row from its own session
+        return job
+
+    def expire_stale(self) -> int:
+        """Fails jobs whose worker is gone (running, or still queued, past USER_IMPORT_JOB_TIMEOUT)."""
+        timeout = self._state().timeout
+        if not timeout:
+            return 0
+        cutoff = datetime.utcnow() - timedelta(seconds=timeout)
+        result = db.session.execute(
+            update(ImportJob)
+            .where(or_(
+                and_(ImportJob.status == "running", ImportJob.startedAt < cutoff),
+                and_(ImportJob.status == "queued", ImportJob.createdAt < cutoff),
+            ))
+            .values(status="failed", error="Timed out.", upload=None, finishedAt=datetime.utcnow())
+        )
+        if result.rowcount:
+            db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def get(job_id: int):
+        return db.session.get(ImportJob, job_id)
+
+    def wait(self, job_id: int, timeout: float = None):
+        """Blocks until this process's worker has finished job_id (tests use)."""
+        state = self._state()
+        with state.lock:
+            future = state.futures.get(job_id)
+        if future is not None:
+            future.result(timeout)
+        db.session.expire_all()
+        return self.get(job_id)
+
+
+user_import_jobs = UserImportJobs()
@@ -0,0 +1,159 @@
+"""
+User directory search over UserAccount.name / UserAccount.email.
+
+The admin user list calls `user_search_backend().apply(query, search)` to
+restrict a UserAccount query to matching accounts; ordering and pagination
+stay with the caller. Every whitespace-separated term must match the name
+or the email. Backends:
+
+- TrigramBackend (SQLite): an external-content FTS5 table `user_accounts_fts`
+  using the trigram tokenizer, kept in sync by triggers on `user_accounts`.
+  Terms of three or more characters are substring matches answered from the
+  trigram index. Shorter terms have no trigram and are checked with LIKE
+  '%term%', like LikeBackend does: on the (few) trigram hits alongside a longer
+  term, by a scan when the search is made only of short terms.
+- LikeBackend: portable fallback (ILIKE '%term%' on name or email) for other
+  databases or SQLite builds without FTS5 / the trigram tokenizer.
+
+The FTS table and its triggers are installed by app.migrations
+(install_user_search_index), which also back-fills existing accounts.
+USER_SEARCH_BACKEND config: "auto" (default), "trigram" or "like".
+"""
+from abc import ABC, abstractmethod
+from flask import current_app
+from sqlalchemy import column, literal_column, or_, select, table, text
+from app import db
+from app.entity.user_account import UserAccount
+
+FTS_TABLE = "user_accounts_fts"
+fts_rows = table(FTS_TABLE, column("rowid"))
+MIN_TRIGRAM = 3
+# WITH ... AS MATERIALIZED needs SQLite 3.35; the trigram tokenizer only 3.34
+MATERIALIZED_SINCE = (3, 35, 0)
+
+
+def search_terms(search: str) -> list:
+    return (search or "").split()[:8]
+
+
+class UserSearchBackend(ABC):
+    name = "base"
+
+    @abstractmethod
+    def apply(self, query, search: str):
+        """Returns `query` restricted to accounts whose name or email matches every term."""
+
+
+class LikeBackend(UserSearchBackend):
+    name = "like"
+
+    def apply(self, query, search):
+        for term in search_terms(search):
+            pattern = f"%{term}%"
+            query = query.filter(or_(UserAccount.name.ilike(pattern), UserAccount.email.ilike(pattern)))
+        return query
+
+
+class TrigramBackend(UserSearchBackend):
+    name = "trigram"
+
+    DDL = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        " name, email, content='user_accounts', content_rowid='userID', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS user_accounts_fts_ai AFTER INSERT ON user_accounts BEGIN"
+        f" INSERT INTO {FTS_TABLE}(rowid, name, email) VALUES (new.\"userID\", new.name, new.email); END",
+        f"CREATE TRIGGER IF NOT EXISTS user_accounts_fts_ad AFTER DELETE ON user_accounts BEGIN"
+        f" INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, email)"
+        " VALUES ('delete', old.\"userID\", old.name, old.email); END",
+        f"CREATE TRIGGER IF NOT EXISTS user_accounts_fts_au AFTER UPDATE OF \"userID\", name, email"
+        f" ON user_accounts BEGIN"
+        f" INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, email)"
+        " VALUES ('delete', old.\"userID\", old.name, old.email);"
+        f" INSERT INTO {FTS_TABLE}(rowid, name, email) VALUES (new.\"userID\", new.name, new.email); END",
+    ]
+    # served the old prefix match for short-only searches; dropped by the migration step
+    OBSOLETE_INDEXES = ("ix_user_accounts_name_nocase", "ix_user_accounts_email_nocase")
+
+    @staticmethod
+    def supported(conn) -> bool:
+        if conn.dialect.name != "sqlite":
+            return False
+        options = {row[0] for row in conn.exec_driver_sql("PRAGMA compile_options")}
+        return "ENABLE_FTS5" in options and conn.dialect.dbapi.sqlite_version_info >= (3, 34, 0)
+
+    @staticmethod
+    def installed(conn) -> bool:
+        return conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :n"), {"n": FTS_TABLE}
+        ).first() is not None
+
+    def install(self, conn) -> bool:
+        """Creates the FTS table and triggers if missing and indexes existing rows."""
+        if not self.supported(conn) or self.installed(conn):
+            return False
+        for ddl in self.DDL:
+            conn.exec_driver_sql(ddl)
+        conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        return True
+
+    @staticmethod
+    def match_expression(terms) -> str:
+        # each term a quoted phrase: trigram phrases match as substrings, all must match
+        return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+    def apply(self, query, search):
+        terms = search_terms(search)
+        long_terms = [t for t in terms if len(t) >= MIN_TRIGRAM]
+        if long_terms:
+            fts = literal_column(FTS_TABLE)
+            hits = (
+                select(fts_rows.c.rowid.label("userID"))
+                .where(fts.op("MATCH")(self.match_expression(long_terms)))
+                .cte("user_hits")
+            )
+            if db.session.get_bind().dialect.dbapi.sqlite_version_info >= MATERIALIZED_SINCE:
+                hits = hits.prefix_with("MATERIALIZED")
+            query = query.join(hits, hits.c.userID == UserAccount.userID)
+        for term in terms:
+            if len(term) >= MIN_TRIGRAM:
+                continue
+            # same substring semantics as LikeBackend (SQLite's LIKE is case-insensitive)
+            pattern = f"%{term}%"
+            query = query.filter(or_(UserAccount.name.like(pattern), UserAccount.email.like(pattern)))
+        return query
+
+
+BACKENDS = {"trigram": TrigramBackend, "like": LikeBackend}
+
+
+def user_search_backend() -> UserSearchBackend:
+    """Returns the configured backend for the current app (cached in app.extensions)."""
+    backend = current_app.extensions.get("user_search")
+    if backend is None:
+        choice = current_app.config.get("USER_SEARCH_BACKEND", "auto")
+        if choice == "auto":
+            with db.engine.connect() as conn:
+                choice = "trigram" if TrigramBackend.supported(conn) and TrigramBackend.installed(conn) else "like"
+        backend = current_app.extensions["user_search"] = BACKENDS[choice]()
+    return backend
+
+
+def install_user_search_index(conn):
+    """Migration step: installs the trigram index where the database supports it."""
+    dropped = False
+    if conn.dialect.name == "sqlite":
+        for index in TrigramBackend.OBSOLETE_INDEXES:
+            if conn.execute(text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :n"),
+                            {"n": index}).first() is not None:
+                conn.exec_driver_sql(f"DROP INDEX {index}")
+                dropped = True
+    return TrigramBackend().install(conn) or dropped
+
+
+def drop_user_search_index(conn):
+    """Removes the FTS table and its triggers (e.g. before a bulk reload; upgrade() rebuilds it)."""
+    if conn.dialect.name != "sqlite":
+        return
+    for trigger in ("user_accounts_fts_ai", "user_accounts_fts_ad", "user_accounts_fts_au"):
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE}")
@@ -4,6 +4,8 @@ As a user admin, I want to activate suspended user account so that users can reg
 """
 from app import db
 from app.entity.user_account import UserAccount
+from app.entity.principal import principal_cache
+from app.control.dashboard_metrics import dashboard_metrics
 
 class UserAdminActivateUserAccountController:
     def activateUserAccount(self, userID: int) -> bool:
@@ -15,6 +17,8 @@ class UserAdminActivateUserAccountController:
         user.isActive = True
         try:
             db.session.commit()
+            principal_cache.invalidate_user(userID)
+            dashboard_metrics.invalidate_users()
             return True
         except Exception as e:
             db.session.rollback()
@@ -4,9 +4,11 @@ As a user admin, I want to activate suspended user profiles so that valid user p
 """
 from app import db
 from app.entity.user_profile import UserProfile
+from app.entity.principal import principal_cache
 
 class UserAdminActivateUserProfileController:
     def activateUserProfile(self, profile_id:int):
         p = UserProfile.query.get(profile_id)
         if not p: raise ValueError("Profile not found.")
-        p.isActive = True; db.session.commit(); return p
+        p.isActive = True; db.session.commit()
+        principal_cache.invalidate_profile(profile_id); return p
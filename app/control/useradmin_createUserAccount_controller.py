@@ -5,6 +5,7 @@ As a user admin, I want to create user account so that new users can access the
 from app import db
 from app.entity.user_account import UserAccount
 from app.entity.user_profile import UserProfile
+from app.control.dashboard_metrics import dashboard_metrics
 
 
 class UserAdminCreateUserAccountController:
@@ -35,6 +36,7 @@ class UserAdminCreateUserAccountController:
 
             db.session.add(user)
             db.session.commit()
+            dashboard_metrics.invalidate_users()
             return True
         except Exception as e:
             db.session.rollback()
@@ -0,0 +1,171 @@
+"""
+User Story:
+As a user admin, I want to import user accounts from a CSV file so that I can onboard a whole organisation at once.
++ importUserAccounts(csvFile, defaultProfileID: int): ImportResult
+"""
+import csv
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+from flask import current_app
+from werkzeug.security import generate_password_hash
+from app import db
+from app.passwords import hash_method
+from app.entity.user_account import UserAccount
+from app.entity.user_profile import UserProfile
+from app.control.dashboard_metrics import dashboard_metrics
+from app.control.report_cache import bump_versions
+
+REQUIRED_COLUMNS = ("name", "email", "password")
+# below this many passwords in a chunk, starting worker processes costs more than it saves
+POOL_MIN_ROWS = 32
+
+
+def missing_columns(fieldnames) -> list:
+    """Required columns absent from a CSV header."""
+    columns = {(c or "").strip() for c in fieldnames or []}
+    return [c for c in REQUIRED_COLUMNS if c not in columns]
+
+
+class ImportResult:
+    """Outcome of one import: rows created and (line, message) for every rejected row."""
+
+    def __init__(self):
+        self.created = 0
+        self.errors = []
+
+    @property
+    def rejected(self) -> int:
+        return len(self.errors)
+
+
+class UserAdminImportUserAccountsController:
+
+    def importUserAccounts(self, csv_file, default_profile_id: int = None, hash_workers: int = 1) -> ImportResult:
+        """
+        Creates one account per CSV row (columns: name, email, password and
+        optionally age, phoneNumber, profile). `profile` holds a profile name
+        or ID; rows without one use default_profile_id.
+
+        Rows are read and written USER_IMPORT_CHUNK at a time: one query checks
+        the chunk's emails against existing accounts, passwords are hashed and
+        valid rows are inserted with a single executemany.
+
+        With hash_workers > 1 the hashing runs in a process pool. The pool is
+        spawned, not forked, because the callers (`flask import-users` and
+        the web upload's background job, app/control/user_import_jobs.py)
+        may have other threads running.
+
+        Invalid rows are skipped and reported in the result; a file without
+        the required columns raises ValueError.
+        """
+        reader = csv.DictReader(csv_file)
+        columns = [c.strip() for c in reader.fieldnames or []]
+        missing = missing_columns(columns)
+        if missing:
+            raise ValueError(f"CSV is missing required column(s): {', '.join(missing)}.")
+        reader.fieldnames = columns
+
+        profiles = {}
+        for profile in UserProfile.query.filter_by(isActive=True):
+            profiles[str(profile.profileID)] = profile.profileID
+            profiles[profile.profileName.lower()] = profile.profileID
+        if default_profile_id is not None and str(default_profile_id) not in profiles:
+            raise ValueError(f"Profile ID '{default_profile_id}' not found or inactive.")
+
+        chunk_size = current_app.config.get("USER_IMPORT_CHUNK", 1000)
+        workers = max(int(hash_workers or 1), 1)
+        result, seen, chunk = ImportResult(), set(), []
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) if workers > 1 else None
+        try:
+            for row in reader:
+                parsed = self._parse(row, profiles, default_profile_id, seen)
+                if isinstance(parsed, str):
+                    result.errors.append((reader.line_num, parsed))
+                    continue
+                chunk.append((reader.line_num, parsed))
+                if len(chunk) >= chunk_size:
+                    self._write(chunk, pool, workers, result)
+                    chunk = []
+            if chunk:
+                self._write(chunk, pool, workers, result)
+            if result.created:
+                # Core inserts skip the ORM flush hook that versions source tables
+                bump_versions(db.session.connection(), {UserAccount.__tablename__})
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise RuntimeError(f"Failed to import user accounts: {e}")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        if result.created:
+            dashboard_metrics.invalidate_users()
+        result.errors.sort()
+        return result
+
+    @staticmethod
+    def _parse(row, profiles, default_profile_id, seen):
+        """Returns the insert dict for a row, or an error message."""
+        name = (row.get("name") or "").strip()
+        email = (row.get("email") or "").strip()
+        password = row.get("password") or ""
+        phone = (row.get("phoneNumber") or "").strip() or None
+        age = (row.get("age") or "").strip()
+        profile = (row.get("profile") or "").strip()
+
+        if not name or len(name) > 100:
+            return "Name is required (at most 100 characters)."
+        if "@" not in email or len(email) > 120:
+            return f"Invalid email '{email}'."
+        if email in seen:
+            return f"Email '{email}' appears more than once in the file."
+        if not password:
+            return "Password is required."
+        if phone and len(phone) > 20:
+            return "Phone number must be at most 20 characters."
+        if age and (not age.isdigit() or not 1 <= int(age) <= 120):
+            return f"Invalid age '{age}'."
+        if profile:
+            profile_id = profiles.get(profile.lower())
+            if profile_id is None:
+                return f"Profile '{profile}' not found or inactive."
+        elif default_profile_id is not None:
+            profile_id = int(default_profile_id)
+        else:
+            return "Profile is required."
+
+        seen.add(email)
+        return {"name": name, "email": email, "password": password, "age": int(age) if age else None,
+                "phoneNumber": phone, "isActive": True, "profileID": profile_id}
+
+    @staticmethod
+    def _write(chunk, pool, workers, result):
+        """Drops rows whose email is taken, hashes the rest and inserts them."""
+        emails = [row["email"] for _, row in chunk]
+        taken = set(db.session.execute(
+            db.select(UserAccount.email).where(UserAccount.email.in_(emails))
+        ).scalars())
+
+        rows = []
+        for line, row in chunk:
+            if row["email"] in taken:
+                result.errors.append((line, f"Email '{row['email']}' already exists."))
+            else:
+                rows.append(row)
+        if not rows:
+            return
+
+        passwords = [row["password"] for row in rows]
+        hasher = partial(generate_password_hash, method=hash_method())   # picklable for the pool
+        if pool is not None and len(rows) >= POOL_MIN_ROWS:
+            per_task = max(1, len(passwords) // (workers * 4))
+            hashes = pool.map(hasher, passwords, chunksize=per_task)
+        else:
+            hashes = map(hasher, passwords)
+        for row, hashed in zip(rows, hashes):
+            row["password"] = hashed
+
+        db.session.execute(UserAccount.__table__.insert(), rows)
+        result.created += len(rows)
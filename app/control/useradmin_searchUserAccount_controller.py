@@ -3,14 +3,40 @@ User Story:
 As a user admin, I want to search user account by name so that I can find the user quickly.
 """
 from app.entity.user_account import UserAccount
+from app.entity.user_profile import UserProfile
+from app.control.export_stream import BATCH
+from app.control.pagination import paginate
+from app.control.loader_profiles import with_profile
+from app.control.user_search import user_search_backend
 
 class UserAdminSearchUserAccountController:
+    def __init__(self, loader_profile: str = None):
+        # optional eager-loading profile (see app/control/loader_profiles.py)
+        self.loader_profile = loader_profile
+
     def searchUserAccountByName(self, userName: str):
-        """Searches for user accounts by name (case-insensitive). Returns a list."""
-        like_pattern = f"%{userName.strip()}%" if userName else "%"
-        return (
-            UserAccount.query
-            .filter(UserAccount.name.ilike(like_pattern))
-            .order_by(UserAccount.userID)
-            .all()
+        """Searches for user accounts by name or email (case-insensitive). Returns a list."""
+        return self.searchUserAccountQuery(userName).all()
+
+    def searchUserAccountPage(self, userName: str, page: int = 1, per_page: int = 10):
+        """Returns one Pagination page of matching accounts (all accounts when userName is blank)."""
+        return paginate(self.searchUserAccountQuery(userName), page, per_page)
+
+    def searchUserAccountQuery(self, userName: str):
+        """Builds the account query (by userID) without executing it; see app/control/user_search.py."""
+        q = UserAccount.query
+        if userName and userName.strip():
+            q = user_search_backend().apply(q, userName)
+        return with_profile(q.order_by(UserAccount.userID), self.loader_profile)
+
+    def exportUserAccounts(self, userName: str = None, batch: int = BATCH):
+        """Returns (header, rows) for exporting accounts matching userName (all when blank), read `batch` at a time."""
+        q = (
+            UserAdminSearchUserAccountController().searchUserAccountQuery(userName)
+            .outerjoin(UserProfile, UserProfile.profileID == UserAccount.profileID)
+            .with_entities(UserAccount.userID, UserAccount.name, UserAccount.email, UserAccount.phoneNumber,
+                           UserProfile.profileName, UserAccount.isActive)
+            .yield_per(batch)
         )
+        header = ("userID", "name", "email", "phoneNumber", "profile", "isActive")
+        return header, iter(q)
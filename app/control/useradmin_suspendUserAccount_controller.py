@@ -4,6 +4,8 @@ As a user admin, I want to suspend user account so that I can maintain user acce
 """
 from app import db
 from app.entity.user_account import UserAccount
+from app.entity.principal import principal_cache
+from app.control.dashboard_metrics import dashboard_metrics
 
 class UserAdminSuspendUserAccountController:
     def suspendUserAccount(self, userID: int) -> bool:
@@ -15,6 +17,8 @@ class UserAdminSuspendUserAccountController:
         user.isActive = False
         try:
             db.session.commit()
+            principal_cache.invalidate_user(userID)
+            dashboard_metrics.invalidate_users()
             return True
         except Exception as e:
             db.session.rollback()
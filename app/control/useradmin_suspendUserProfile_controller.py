@@ -4,9 +4,11 @@ As a user admin, I want to suspend user profiles so that invalid user profiles a
 """
 from app import db
 from app.entity.user_profile import UserProfile
+from app.entity.principal import principal_cache
 
 class UserAdminSuspendUserProfileController:
     def suspendUserProfile(self, profile_id:int):
         p = UserProfile.query.get(profile_id)
         if not p: raise ValueError("Profile not found.")
-        p.isActive = False; db.session.commit(); return p
+        p.isActive = False; db.session.commit()
+        principal_cache.invalidate_profile(profile_id); return p
@@ -5,6 +5,7 @@ As a user admin, I want to update user account so that I can ensure information
 from app import db
 from app.entity.user_account import UserAccount
 from app.entity.user_profile import UserProfile
+from app.entity.principal import principal_cache
 
 class UserAdminUpdateUserAccountController:
     def updateUserAccount(self, userID: int, name: str = None, email: str = None,
@@ -38,6 +39,7 @@ class UserAdminUpdateUserAccountController:
 
         try:
             db.session.commit()
+            principal_cache.invalidate_user(userID)
             return True
         except Exception as e:
             db.session.rollback()
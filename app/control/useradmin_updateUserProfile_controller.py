@@ -4,6 +4,7 @@ As a user admin, I want to update user profile so that I can ensure information
 """
 from app import db
 from app.entity.user_profile import UserProfile
+from app.entity.principal import principal_cache
 from app.control.useradmin_activateUserProfile_controller import UserAdminActivateUserProfileController
 from app.control.useradmin_suspendUserProfile_controller import UserAdminSuspendUserProfileController
 
@@ -29,6 +30,8 @@ class UserAdminUpdateUserProfileController:
 
         try:
             db.session.commit()
+            # cached principals carry profileName (and the old profileID)
+            principal_cache.invalidate_profile(profileID)
             return True
         except Exception as e:
             db.session.rollback()
@@ -0,0 +1,130 @@
+"""
+Write-behind buffer for Request.viewCount.
+
+CSR detail views add to an in-process counter instead of doing a
+read-modify-write + commit per page view. Buffered increments are flushed as
+one batched `UPDATE requests SET viewCount = viewCount + :n` statement when
+VIEW_COUNT_FLUSH_THRESHOLD views are pending or VIEW_COUNT_FLUSH_INTERVAL
+seconds have passed, so concurrent workers never overwrite each other's counts.
+A single atexit hook flushes every live app's buffer at shutdown, so counts
+still in the buffer are lost only if the process is killed hard.
+"""
+import atexit
+import logging
+import threading
+import weakref
+from collections import Counter
+from flask import current_app
+from sqlalchemy import bindparam, func, update
+from app import db
+from app.entity.request import Request
+from app.control.request_ranking import request_ranking
+
+log = logging.getLogger(__name__)
+
+# buffers flushed at interpreter exit; weak so a discarded app can be collected
+_live_states = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for state in list(_live_states):
+        state.flush_in_app()
+
+
+class _ViewCountState:
+    """Per-app buffer (kept in app.extensions so each app flushes to its own DB)."""
+
+    def __init__(self, app):
+        self.app = app
+        self.threshold = app.config.get("VIEW_COUNT_FLUSH_THRESHOLD", 50)
+        self.interval = app.config.get("VIEW_COUNT_FLUSH_INTERVAL", 5.0)
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()   # one writer per process; SQLite has one anyway
+        self.pending = Counter()
+        self.total = 0
+        self.timer = None
+
+    def add(self, request_id: int, n: int):
+        with self.lock:
+            self.pending[request_id] += n
+            self.total += n
+            due = self.total >= self.threshold
+            if not due and self.interval and self.timer is None:
+                self.timer = threading.Timer(self.interval, self.flush_in_app)
+                self.timer.daemon = True
+                self.timer.start()
+        if due:
+            # counting is best-effort: a failed flush must not fail the page view
+            try:
+                self.flush()
+            except Exception:
+                log.exception("View count flush failed; increments kept in buffer.")
+
+    def take(self) -> Counter:
+        with self.lock:
+            batch, self.pending, self.total = self.pending, Counter(), 0
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        return batch
+
+    def restore(self, batch: Counter):
+        with self.lock:
+            self.pending.update(batch)
+            self.total += sum(batch.values())
+
+    def flush(self) -> int:
+        """Writes buffered increments in one executemany UPDATE; returns views written."""
+        with self.flush_lock:
+            batch = self.take()
+            if not batch:
+                return 0
+            stmt = (
+                update(Request.__table__)
+                .where(Request.__table__.c.requestID == bindparam("rid"))
+                .values(viewCount=func.coalesce(Request.__table__.c.viewCount, 0) + bindparam("n"))
+            )
+            try:
+                with db.engine.begin() as conn:
+                    conn.execute(stmt, [{"rid": rid, "n": n} for rid, n in batch.items()])
+            except Exception:
+                self.restore(batch)  # keep the views for the next attempt
+                raise
+            request_ranking.note_views(batch)
+            return sum(batch.values())
+
+    def flush_in_app(self):
+        with self.app.app_context():
+            try:
+                self.flush()
+            except Exception:
+                log.exception("View count flush failed; increments kept in buffer.")
+
+
+class ViewCounter:
+    """Flask extension front-end; use the module-level `view_counter` instance."""
+
+    def init_app(self, app):
+        state = _ViewCountState(app)
+        app.extensions["view_counter"] = state
+        _live_states.add(state)
+
+    @staticmethod
+    def _state() -> _ViewCountState:
+        return current_app.extensions["view_counter"]
+
+    def increment(self, request_id: int, n: int = 1):
+        self._state().add(request_id, n)
+
+    def pending(self, request_id: int) -> int:
+        """Views recorded for request_id but not yet written to the database."""
+        state = self._state()
+        with state.lock:
+            return state.pending.get(request_id, 0)
+
+    def flush(self) -> int:
+        return self._state().flush()
+
+
+view_counter = ViewCounter()
@@ -0,0 +1,22 @@
+# app/entity/daily_rollup.py
+from app import db
+
+
+class DailyRollup(db.Model):
+    """
+    Pre-aggregated report counts for one (day, category, status) cell,
+    maintained by app/control/rollups.py.
+
+    created: requests created on `day` that are now in `status`
+    closed:  requests closed (closedAt) on `day` that are now in `status`
+    matched: match records completed on `day` with this match `status`
+    """
+    __tablename__ = "daily_rollups"
+
+    # primary key order serves the day-range scans of the report window
+    day        = db.Column(db.Date, primary_key=True)
+    categoryID = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    status     = db.Column(db.String(30), primary_key=True)
+    created    = db.Column(db.Integer, default=0, nullable=False)
+    closed     = db.Column(db.Integer, default=0, nullable=False)
+    matched    = db.Column(db.Integer, default=0, nullable=False)
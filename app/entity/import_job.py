@@ -0,0 +1,47 @@
+# app/entity/import_job.py
+import json
+from app import db
+from app.entity.report_job import ACTIVE_STATUSES
+
+# rejected rows kept on the job for the import page
+MAX_STORED_ERRORS = 200
+
+
+class ImportJob(db.Model):
+    __tablename__ = "import_jobs"
+
+    jobID            = db.Column(db.Integer, primary_key=True)
+    requestedBy      = db.Column(db.Integer, db.ForeignKey("user_accounts.userID"), nullable=False)
+    filename         = db.Column(db.String(255))
+    defaultProfileID = db.Column(db.Integer)
+    status           = db.Column(db.String(20), default="queued", nullable=False)   # queued | running | done | failed
+    created          = db.Column(db.Integer, default=0, nullable=False)
+    rejected         = db.Column(db.Integer, default=0, nullable=False)
+    errors           = db.Column(db.Text)      # JSON [[line, message], ...], the first MAX_STORED_ERRORS
+    error            = db.Column(db.Text)      # why the whole import failed
+    createdAt        = db.Column(db.DateTime, default=db.func.now(), nullable=False)
+    startedAt        = db.Column(db.DateTime)
+    finishedAt       = db.Column(db.DateTime)
+    # the uploaded CSV until a worker has imported it; deferred so status polls never read it
+    upload           = db.deferred(db.Column(db.LargeBinary))
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    @property
+    def row_errors(self) -> list:
+        return json.loads(self.errors) if self.errors else []
+
+    def to_dict(self) -> dict:
+        return {
+            "jobID": self.jobID,
+            "filename": self.filename,
+            "status": self.status,
+            "created": self.created,
+            "rejected": self.rejected,
+            "error": self.error,
+            "createdAt": self.createdAt.isoformat() if self.createdAt else None,
+            "startedAt": self.startedAt.isoformat() if self.startedAt else None,
+            "finishedAt": self.finishedAt.isoformat() if self.finishedAt else None,
+        }
@@ -3,6 +3,14 @@ from app import db
 
 class MatchRecord(db.Model):
     __tablename__ = "match_records"
+    __table_args__ = (
+        # CSR history: csrRepID + status, range/order on completedAt
+        db.Index("ix_match_records_csrRepID_status_completedAt", "csrRepID", "status", "completedAt"),
+        # PIN history: same shape keyed by pinID
+        db.Index("ix_match_records_pinID_status_completedAt", "pinID", "status", "completedAt"),
+        db.Index("ix_match_records_categoryID", "categoryID"),
+        db.Index("ix_match_records_requestID", "requestID"),
+    )
 
     matchRecordID = db.Column(db.Integer, primary_key=True)
     requestID = db.Column(db.Integer, db.ForeignKey("requests.requestID", ondelete="CASCADE"), nullable=False)
@@ -0,0 +1,92 @@
+"""
+Cached identity for Flask-Login.
+
+The user loader runs on every authenticated request; instead of querying
+UserAccount (and lazily its UserProfile) each time, it returns a Principal
+snapshot from a per-app TTL/LRU cache. Controllers that change an account or
+profile call invalidate_user / invalidate_profile so the next request reloads
+it; the TTL (PRINCIPAL_CACHE_TTL) bounds staleness across worker processes.
+"""
+from collections import namedtuple
+from flask import current_app
+from flask_login import UserMixin
+from app import db
+from app.cache import TTLCache
+
+ProfileRef = namedtuple("ProfileRef", "profileID profileName")
+
+
+class Principal(UserMixin):
+    """Read-only snapshot of the fields pages read from current_user."""
+
+    def __init__(self, userID, name, email, phoneNumber, isActive, profileID, profileName):
+        self.userID = userID
+        self.name = name
+        self.email = email
+        self.phoneNumber = phoneNumber
+        self.isActive = isActive
+        self.profileID = profileID
+        self.profile = ProfileRef(profileID, profileName) if profileName is not None else None
+
+    def get_id(self):
+        return str(self.userID)
+
+    @property
+    def role(self) -> str:
+        return (self.profile.profileName if self.profile else "").lower()
+
+    @classmethod
+    def from_user(cls, user):
+        profile = user.profile
+        return cls(user.userID, user.name, user.email, user.phoneNumber, user.isActive,
+                   user.profileID, profile.profileName if profile else None)
+
+
+class PrincipalCache:
+    """Flask extension holding one TTLCache of principals per app."""
+
+    def init_app(self, app):
+        app.extensions["principal_cache"] = TTLCache(
+            maxsize=app.config.get("PRINCIPAL_CACHE_SIZE", 4096),
+            ttl=app.config.get("PRINCIPAL_CACHE_TTL", 60.0),
+        )
+
+    @staticmethod
+    def _cache() -> TTLCache:
+        return current_app.extensions["principal_cache"]
+
+    def load(self, user_id: int):
+        """Returns the cached Principal for user_id, loading it in one query on a miss."""
+        return self._cache().get_or_load(user_id, lambda: self._fetch(user_id))
+
+    def remember(self, user):
+        """Caches a principal built from an already-loaded UserAccount (e.g. at login)."""
+        principal = Principal.from_user(user)
+        self._cache().set(principal.userID, principal)
+        return principal
+
+    def invalidate_user(self, user_id: int):
+        self._cache().pop(int(user_id))
+
+    def invalidate_profile(self, profile_id: int):
+        self._cache().pop_where(lambda _, p: p.profileID == int(profile_id))
+
+    def clear(self):
+        self._cache().clear()
+
+    @staticmethod
+    def _fetch(user_id: int):
+        from app.entity.user_account import UserAccount
+        from app.entity.user_profile import UserProfile
+        row = db.session.execute(
+            db.select(
+                UserAccount.userID, UserAccount.name, UserAccount.email, UserAccount.phoneNumber,
+                UserAccount.isActive, UserAccount.profileID, UserProfile.profileName,
+            )
+            .outerjoin(UserProfile, UserAccount.profileID == UserProfile.profileID)
+            .where(UserAccount.userID == user_id)
+        ).first()
+        return Principal(*row) if row else None
+
+
+principal_cache = PrincipalCache()
@@ -1,11 +1,31 @@
+import json
 from app import db
+from app.report_payload import ReportPayload
 
 class Report(db.Model):
     __tablename__ = "reports"
+    __table_args__ = (
+        # report cache lookup: latest report for a (reportType, period)
+        db.Index("ix_reports_reportType_period", "reportType", "period"),
+        # reports list page: newest first
+        db.Index("ix_reports_generatedAt", "generatedAt"),
+    )
     reportID    = db.Column(db.Integer, primary_key=True)
     reportTitle = db.Column(db.String(255), nullable=False)
     reportType  = db.Column(db.String(50), nullable=False)
     generatedBy = db.Column(db.Integer, db.ForeignKey("user_accounts.userID"), nullable=False)
-    reportData  = db.Column(db.Text)
     period      = db.Column(db.String(50))
     generatedAt = db.Column(db.DateTime, default=db.func.now(), nullable=False)
+    # sum of the source tables' TableVersion counters the data was computed from
+    dataVersion = db.Column(db.Integer)
+    # report body, declared last so SQLite reads the listing columns without walking
+    # its overflow pages; deferred so listings never fetch it (undefer_group("payload"))
+    reportData  = db.deferred(db.Column(db.Text), group="payload")          # legacy plain JSON rows
+    payload     = db.deferred(db.Column(db.LargeBinary), group="payload")   # app/report_payload.py format
+
+    @property
+    def content(self):
+        """The report body as a mapping; sections of a compressed payload decode on access."""
+        if self.payload is not None:
+            return ReportPayload(self.payload)
+        return json.loads(self.reportData) if self.reportData else {}
@@ -0,0 +1,50 @@
+# app/entity/report_job.py
+from app import db
+
+# a job is "active" while it is waiting for or holding a worker
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class ReportJob(db.Model):
+    __tablename__ = "report_jobs"
+    __table_args__ = (
+        # at most one active job per (reportType, period); duplicates join the running one
+        db.Index(
+            "uq_report_jobs_active", "reportType", "period", unique=True,
+            sqlite_where=db.text("status IN ('queued', 'running')"),
+            postgresql_where=db.text("status IN ('queued', 'running')"),
+        ),
+        # "my recent jobs" on the reports page
+        db.Index("ix_report_jobs_requestedBy_createdAt", "requestedBy", "createdAt"),
+    )
+
+    jobID       = db.Column(db.Integer, primary_key=True)
+    reportType  = db.Column(db.String(50), nullable=False)
+    period      = db.Column(db.String(50), nullable=False)
+    title       = db.Column(db.String(255))
+    requestedBy = db.Column(db.Integer, db.ForeignKey("user_accounts.userID"), nullable=False)
+    status      = db.Column(db.String(20), default="queued", nullable=False)   # queued | running | done | failed
+    progress    = db.Column(db.Integer, default=0, nullable=False)            # percent
+    reportID    = db.Column(db.Integer, db.ForeignKey("reports.reportID", ondelete="SET NULL"))
+    error       = db.Column(db.Text)
+    createdAt   = db.Column(db.DateTime, default=db.func.now(), nullable=False)
+    startedAt   = db.Column(db.DateTime)
+    finishedAt  = db.Column(db.DateTime)
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    def to_dict(self) -> dict:
+        return {
+            "jobID": self.jobID,
+            "reportType": self.reportType,
+            "period": self.period,
+            "status": self.status,
+            "progress": self.progress,
+            "reportID": self.reportID,
+            "error": self.error,
+            "createdAt": self.createdAt.isoformat() if self.createdAt else None,
+            "startedAt": self.startedAt.isoformat() if self.startedAt else None,
+            "finishedAt": self.finishedAt.isoformat() if self.finishedAt else None,
+        }
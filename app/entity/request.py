@@ -3,6 +3,14 @@ from app import db
 
 class Request(db.Model):
     __tablename__ = "requests"
+    __table_args__ = (
+        # PIN "my requests" + dashboard: pinID (+ status), ordered by requestID (rowid)
+        db.Index("ix_requests_pinID_status", "pinID", "status"),
+        # CSR browse: open requests (optionally per category), ordered by requestID
+        db.Index("ix_requests_status_categoryID", "status", "categoryID"),
+        # report breakdown GROUP BY (categoryID, status) is answered from the index alone
+        db.Index("ix_requests_categoryID_status", "categoryID", "status"),
+    )
 
     requestID = db.Column(db.Integer, primary_key=True)
     pinID = db.Column(db.Integer, db.ForeignKey("user_accounts.userID"), nullable=False)
@@ -3,6 +3,11 @@ from app import db
 
 class Shortlist(db.Model):
     __tablename__ = "shortlists"
+    __table_args__ = (
+        # one shortlist entry per (CSR, request); also serves the per-CSR lookups
+        db.Index("uq_shortlists_csrRepID_requestID", "csrRepID", "requestID", unique=True),
+        db.Index("ix_shortlists_requestID", "requestID"),
+    )
 
     shortlistID = db.Column(db.Integer, primary_key=True)
     requestID = db.Column(db.Integer, db.ForeignKey("requests.requestID", ondelete="CASCADE"), nullable=False)
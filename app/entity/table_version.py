@@ -0,0 +1,14 @@
+# app/entity/table_version.py
+from app import db
+
+
+class TableVersion(db.Model):
+    """
+    Write counter per table, bumped in the same transaction as every ORM flush
+    that touches the table (app/control/report_cache.py). Readers compare
+    versions to tell whether data changed since they last looked.
+    """
+    __tablename__ = "table_versions"
+
+    tableName = db.Column(db.String(64), primary_key=True)
+    version   = db.Column(db.Integer, default=0, nullable=False)
@@ -1,6 +1,6 @@
 from app import db, login_manager
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from app.passwords import hash_password, verify_password
 
 
 class UserAccount(UserMixin, db.Model):
@@ -28,12 +28,15 @@ class UserAccount(UserMixin, db.Model):
 
     @password.setter
     def password(self, raw):
-        self._password = generate_password_hash(raw)
+        # hashed with the configured policy (app/passwords.py)
+        self._password = hash_password(raw)
 
     def check_password(self, raw):
-        return check_password_hash(self._password, raw)
+        return verify_password(self._password, raw)
 
 
 @login_manager.user_loader
 def load_user(user_id):
-    return UserAccount.query.get(int(user_id))
+    # served from the per-app principal cache; see app/entity/principal.py
+    from app.entity.principal import principal_cache
+    return principal_cache.load(int(user_id))
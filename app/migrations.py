@@ -0,0 +1,121 @@
+"""
+In-place upgrades for existing csr_system.db files.
+
+db.create_all() only creates missing tables, so schema objects added to the
+entities later (columns, indexes, constraints) never reach a database
+created before them, the full-text indexes (app/control/request_search.py,
+app/control/user_search.py) are not entities at all, the report rollups (app/control/rollups.py) start empty, and
+reports written as plain JSON text predate the compressed payload column.
+upgrade() applies those additions idempotently; create_app() runs it on
+every start-up, and it can be run by hand with `python -m app.migrations`.
+"""
+import json
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.schema import CreateColumn
+from app import db
+from app.report_payload import encode_report
+from app.control.request_search import install_search_index
+from app.control.user_search import install_user_search_index
+from app.control.rollups import backfill_rollups
+
+
+def _dedupe_shortlists(conn):
+    """Keeps the oldest row per (csrRepID, requestID) so the unique index can be built."""
+    conn.execute(text(
+        'DELETE FROM shortlists WHERE "shortlistID" NOT IN ('
+        ' SELECT MIN("shortlistID") FROM shortlists GROUP BY "csrRepID", "requestID")'
+    ))
+
+
+# run before creating the named index on an existing table
+BEFORE_INDEX = {
+    "uq_shortlists_csrRepID_requestID": _dedupe_shortlists,
+}
+
+
+def add_missing_columns(conn):
+    """Adds nullable columns declared on the entities that an existing table lacks."""
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {col["name"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            # NOT NULL columns would need a backfill value; none are added this way
+            if column.name in present or not column.nullable:
+                continue
+            ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(text(f'ALTER TABLE {conn.dialect.identifier_preparer.quote(table.name)} ADD COLUMN {ddl}'))
+            added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def create_missing_indexes(conn):
+    """Creates every index declared on the entities that the database lacks."""
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name in present:
+                continue
+            if index.name in BEFORE_INDEX:
+                BEFORE_INDEX[index.name](conn)
+            index.create(conn)
+            created.append(index.name)
+    return created
+
+
+def compact_report_payloads(conn, batch: int = 500):
+    """Moves reports stored as plain JSON text into the compressed payload column."""
+    reports = db.metadata.tables["reports"]
+    moved = 0
+    while True:
+        rows = conn.execute(
+            select(reports.c.reportID, reports.c.reportData)
+            .where(reports.c.payload.is_(None), reports.c.reportData.isnot(None))
+            .limit(batch)
+        ).all()
+        if not rows:
+            return moved
+        conn.execute(
+            update(reports).where(reports.c.reportID == bindparam("rid"))
+            .values(payload=bindparam("blob"), reportData=None),
+            [{"rid": rid, "blob": encode_report(json.loads(text_))} for rid, text_ in rows],
+        )
+        moved += len(rows)
+
+
+# each step takes a connection and returns a truthy value when it changed the schema
+STEPS = [
+    add_missing_columns,
+    create_missing_indexes,
+    install_search_index,
+    install_user_search_index,
+    backfill_rollups,
+    compact_report_payloads,
+]
+
+
+def upgrade(engine=None):
+    """Applies every migration step in one transaction. Safe to run repeatedly."""
+    engine = engine or db.engine
+    changed = False
+    with engine.begin() as conn:
+        for step in STEPS:
+            changed = bool(step(conn)) or changed
+        # refresh planner statistics only when the schema actually changed
+        if changed and conn.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+    return changed
+
+
+if __name__ == "__main__":
+    from app import create_app
+    create_app()  # create_app() runs upgrade()
+    print("Database schema is up to date.")
@@ -0,0 +1,47 @@
+"""
+Password hashing policy.
+
+PASSWORD_HASH_ALGORITHM ("scrypt" or "pbkdf2") and PASSWORD_HASH_COST (the
+scrypt N work factor, or the PBKDF2 iteration count) select the werkzeug
+method used for new hashes. Stored hashes start with the method that made
+them ("scrypt:32768:8:1$salt$hash"), so a hash made under another policy is
+recognised by its prefix; AuthController re-hashes those on the next
+successful login, which moves accounts to a new policy without a reset.
+"""
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# werkzeug 3.0 defaults, used outside an app context
+DEFAULT_ALGORITHM = "scrypt"
+DEFAULT_COSTS = {"scrypt": 32768, "pbkdf2": 600000}
+
+
+def hash_method(algorithm: str = None, cost: int = None) -> str:
+    """The werkzeug method string for a policy; defaults to the current app's config."""
+    if algorithm is None:
+        config = _config()
+        algorithm = config.get("PASSWORD_HASH_ALGORITHM", DEFAULT_ALGORITHM)
+        cost = config.get("PASSWORD_HASH_COST")
+    if algorithm not in DEFAULT_COSTS:
+        raise ValueError(f"Unknown password hash algorithm: {algorithm!r}")
+    cost = int(cost or DEFAULT_COSTS[algorithm])
+    if algorithm == "scrypt":
+        return f"scrypt:{cost}:8:1"
+    return f"pbkdf2:sha256:{cost}"
+
+
+def hash_password(raw: str, method: str = None) -> str:
+    return generate_password_hash(raw, method or hash_method())
+
+
+def verify_password(stored: str, raw: str) -> bool:
+    return check_password_hash(stored, raw)
+
+
+def needs_rehash(stored: str, method: str = None) -> bool:
+    """True when `stored` was not made with the current policy."""
+    return stored.split("$", 1)[0] != (method or hash_method())
+
+
+def _config():
+    from flask import current_app, has_app_context
+    return current_app.config if has_app_context() else {}
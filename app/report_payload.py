@@ -0,0 +1,99 @@
+"""
+Compact, sectioned storage format for Report payloads.
+
+A payload is the report dict split into top-level sections ("summary",
+"period", "category_breakdown", ...), each serialised as compact JSON and
+compressed on its own with a registered codec:
+
+    b"RPT1" | header length (4 bytes, big-endian) | header JSON | section blobs...
+
+The header names the codec and lists (section, byte length) in order, so a
+reader parses only the header and decompresses a section the first time it
+is accessed. "zlib" is always available, "zstd" is registered when the
+optional `zstandard` package is installed, and "none" stores plain JSON.
+REPORT_PAYLOAD_CODEC selects the codec for new reports; readers accept any
+registered codec, so the setting can change without rewriting old rows.
+"""
+import json
+import struct
+import zlib
+from collections.abc import Mapping
+
+MAGIC = b"RPT1"
+_LENGTH = struct.Struct(">I")
+
+# name -> (compress(bytes) -> bytes, decompress(bytes) -> bytes)
+CODECS = {}
+
+
+def register_codec(name: str, compress, decompress):
+    CODECS[name] = (compress, decompress)
+
+
+register_codec("none", bytes, bytes)
+register_codec("zlib", lambda raw: zlib.compress(raw, 6), zlib.decompress)
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+else:
+    register_codec("zstd", zstandard.ZstdCompressor(level=3).compress,
+                   lambda blob: zstandard.ZstdDecompressor().decompress(blob))
+
+
+def encode(data: dict, codec: str = "zlib") -> bytes:
+    """Serialises a report dict into the sectioned payload format."""
+    if codec not in CODECS:
+        raise ValueError(f"Unknown report payload codec: {codec!r}")
+    compress = CODECS[codec][0]
+    blobs, sections = [], []
+    for name, value in data.items():
+        blob = compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+        blobs.append(blob)
+        sections.append([name, len(blob)])
+    header = json.dumps({"codec": codec, "sections": sections}, separators=(",", ":")).encode("utf-8")
+    return b"".join([MAGIC, _LENGTH.pack(len(header)), header, *blobs])
+
+
+def encode_report(data: dict) -> bytes:
+    """encode() with the current app's REPORT_PAYLOAD_CODEC."""
+    from flask import current_app
+    return encode(data, current_app.config.get("REPORT_PAYLOAD_CODEC", "zlib"))
+
+
+class ReportPayload(Mapping):
+    """Read-only mapping over an encoded payload; sections decode on first access."""
+
+    def __init__(self, blob: bytes):
+        view = memoryview(blob)
+        if bytes(view[:4]) != MAGIC:
+            raise ValueError("Not a report payload.")
+        (header_len,) = _LENGTH.unpack_from(view, 4)
+        start = 4 + _LENGTH.size
+        header = json.loads(bytes(view[start:start + header_len]))
+        if header["codec"] not in CODECS:
+            raise ValueError(f"Report payload needs the {header['codec']!r} codec, which is not installed.")
+        self.codec = header["codec"]
+        self._decompress = CODECS[self.codec][1]
+        self._spans = {}
+        offset = start + header_len
+        for name, length in header["sections"]:
+            self._spans[name] = view[offset:offset + length]
+            offset += length
+        self._decoded = {}
+
+    def __getitem__(self, name):
+        if name not in self._decoded:
+            span = self._spans[name]    # KeyError for unknown sections, as a dict would
+            self._decoded[name] = json.loads(self._decompress(bytes(span)))
+        return self._decoded[name]
+
+    def __iter__(self):
+        return iter(self._spans)
+
+    def __len__(self):
+        return len(self._spans)
+
+    def to_dict(self) -> dict:
+        return {name: self[name] for name in self}
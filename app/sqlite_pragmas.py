@@ -0,0 +1,34 @@
+"""
+Per-connection SQLite pragmas.
+
+SQLite settings such as busy_timeout, cache_size and mmap_size belong to a
+connection, so they are issued from a "connect" event on the app's engine
+and every pooled connection gets them. The values come from SQLITE_PRAGMAS
+(see the deployment profiles in app/config.py); other databases are left
+untouched.
+"""
+from sqlalchemy import event
+from app import db
+
+
+def init_app(app):
+    pragmas = app.config.get("SQLITE_PRAGMAS") or {}
+    for name, value in pragmas.items():
+        if not name.isidentifier() or not str(value).lstrip("-").isalnum():
+            raise ValueError(f"Invalid SQLite pragma {name}={value!r}")
+    with app.app_context():
+        engine = db.engine
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def current(conn, names) -> dict:
+    """Reads pragma values back from a connection (for checks and the benchmark)."""
+    return {name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in names}
@@ -0,0 +1,107 @@
+"""
+Read latency while view counts are being written, per deployment profile.
+
+Builds a --requests dataset for each profile (dev: rollback journal,
+sqlite-prod: WAL + tuned pragmas), then runs --readers threads loading the
+CSR request list page from the database while a writer thread flushes
+view-count batches of --batch requests through the view counter back to
+back. Reports reader latency percentiles, reader throughput and how many
+reads failed with "database is locked".
+
+Usage:
+    python -m benchmarks.bench_concurrency
+    python -m benchmarks.bench_concurrency --requests 100000 --readers 8 --seconds 10
+"""
+import argparse
+import os
+import random
+import statistics
+import threading
+import time
+from sqlalchemy.exc import OperationalError
+from app import db
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+from app.control.view_counter import view_counter
+from app.sqlite_pragmas import current
+from benchmarks.datagen import make_app, populate
+
+
+def run_profile(profile, args):
+    os.environ["APP_PROFILE"] = profile
+    app, path = make_app()
+    try:
+        with app.app_context():
+            populate(args.requests)
+            with db.engine.connect() as conn:
+                pragmas = current(conn, ["journal_mode", "synchronous", "busy_timeout"])
+        # the writer flushes explicitly, one --batch at a time
+        state = app.extensions["view_counter"]
+        state.threshold, state.interval = args.batch + 1, 0
+        stop = threading.Event()
+        latencies, failures, writes = [], [], [0]
+        lock = threading.Lock()
+
+        def reader(seed):
+            rng = random.Random(seed)
+            with app.app_context():
+                while not stop.is_set():
+                    page = rng.randrange(1, 50)
+                    t0 = time.perf_counter()
+                    try:
+                        CsrSearchRequestController().searchRequestPage("", page=page)
+                    except OperationalError:
+                        with lock:
+                            failures.append(1)
+                    else:
+                        with lock:
+                            latencies.append(time.perf_counter() - t0)
+                    db.session.remove()
+
+        def writer():
+            rng = random.Random(0)
+            with app.app_context():
+                while not stop.is_set():
+                    for rid in rng.sample(range(1, args.requests + 1), args.batch):
+                        view_counter.increment(rid)
+                    try:
+                        writes[0] += view_counter.flush()
+                    except OperationalError:
+                        pass
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        ms = sorted(x * 1000 for x in latencies)
+        p95 = ms[int(len(ms) * 0.95)] if ms else float("nan")
+        print(f"{profile:<12} {pragmas['journal_mode']:<7} reads {len(ms) / args.seconds:8.1f}/s  "
+              f"p50 {statistics.median(ms) if ms else float('nan'):7.1f} ms  p95 {p95:7.1f} ms  "
+              f"max {ms[-1] if ms else float('nan'):8.1f} ms  locked {len(failures):4d}  "
+              f"views written {writes[0]:,}")
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=20_000, help="requests per view-count flush")
+    parser.add_argument("--seconds", type=float, default=8.0)
+    args = parser.parse_args()
+    for profile in ("dev", "sqlite-prod"):
+        run_profile(profile, args)
+
+
+if __name__ == "__main__":
+    main()
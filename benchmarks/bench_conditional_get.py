@@ -0,0 +1,77 @@
+"""
+Conditional GET: full render vs 304 Not Modified.
+
+Fills a database with populate() and add_staff(), generates a daily report,
+then times pages through the test client twice: a plain GET (controllers and
+template run) and a revalidation carrying the ETag of the previous response
+(validators only).
+
+Usage:
+    python -m benchmarks.bench_conditional_get
+    python -m benchmarks.bench_conditional_get --requests 200000
+"""
+import argparse
+import os
+import statistics
+import time
+from datetime import datetime
+from app import db
+from app.entity.shortlist import Shortlist
+from app.control.report_cache import report_cache
+from benchmarks.datagen import add_staff, make_app, populate
+
+
+def timed(client, url, repeat, headers=None):
+    samples, status = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        resp = client.get(url, headers=headers or {})
+        samples.append(time.perf_counter() - t0)
+        status = resp.status_code
+    return statistics.median(samples) * 1000, status, resp
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app, path = make_app()
+    try:
+        with app.app_context():
+            populate(args.requests, users=1_000)
+            staff = add_staff()
+            report = report_cache.generate("daily", datetime.utcnow().strftime("%Y-%m-%d"), staff["pm"])
+            report_id = report.reportID
+            # the CSR with the most shortlist entries
+            csr_id = db.session.execute(
+                db.select(Shortlist.csrRepID).group_by(Shortlist.csrRepID)
+                .order_by(db.func.count().desc()).limit(1)
+            ).scalar()
+            db.session.remove()
+
+        pages = {
+            "pm@bench.test": [f"/pm/reports/{report_id}", "/pm/reports", "/pm/categories"],
+            f"bench{csr_id}@test.com": ["/csr/shortlist", "/csr/matches"],
+        }
+        print(f"{args.requests:,} requests; median of {args.repeat} GETs")
+        print(f"{'page':<22} {'full render':>12} {'304':>12}")
+        client = app.test_client()
+        for email, urls in pages.items():
+            client.post("/login", data={"email": email, "password": "bench"})
+            for url in urls:
+                full_ms, status, resp = timed(client, url, args.repeat)
+                assert status == 200, (url, status)
+                cond_ms, status, _ = timed(client, url, args.repeat, {"If-None-Match": resp.headers["ETag"]})
+                assert status == 304, (url, status)
+                print(f"{url:<22} {full_ms:9.2f} ms {cond_ms:9.2f} ms")
+            client.get("/logout")
+        with app.app_context():
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Match history export: building the whole list vs streaming with yield_per.
+
+Gives one CSR --matches completed match records and exports them as CSV
+twice: the list way (searchHistory().all(), then one big CSV string) and
+through CsrSearchHistoryController.exportHistory + encode_rows, which reads
+the cursor in batches. Reports wall time and peak traced Python memory.
+
+Usage:
+    python -m benchmarks.bench_exports
+    python -m benchmarks.bench_exports --matches 300000
+"""
+import argparse
+import csv
+import io
+import os
+import time
+import tracemalloc
+from app import db
+from app.control.csr_searchHistory_controller import CsrSearchHistoryController
+from app.control.export_stream import encode_rows
+from benchmarks.datagen import make_app, populate
+
+
+def measure(fn):
+    db.session.expunge_all()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    size = fn()
+    elapsed = (time.perf_counter() - t0) * 1000
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size, elapsed, peak / 1_048_576
+
+
+def as_list(csr_id):
+    records = CsrSearchHistoryController("csr_history_row").searchHistory(csr_id)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for m in records:
+        writer.writerow([m.matchRecordID, m.requestID, m.request.title, m.category.categoryName,
+                         m.person_in_need.name, m.matchedAt.isoformat(), m.completedAt.isoformat()])
+    return len(buffer.getvalue())
+
+
+def streamed(csr_id):
+    header, rows = CsrSearchHistoryController().exportHistory(csr_id)
+    return sum(len(chunk) for chunk in encode_rows("csv", header, rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--matches", type=int, default=100_000)
+    args = parser.parse_args()
+
+    app, path = make_app()
+    try:
+        with app.app_context():
+            # two users: account 1 is the only CSR, every request is matched
+            populate(args.matches, users=2, shortlist_every=0, match_every=1)
+            for label, fn in (("list + .all()", as_list), ("streamed", streamed)):
+                size, elapsed, peak = measure(lambda: fn(1))
+                print(f"{label:<14} {size:>12,} bytes  {elapsed:9.1f} ms  peak {peak:8.1f} MiB")
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+htmx list swaps: full page vs #results fragment.
+
+Fills a database with populate() (plus extra categories, so the dropdowns
+are realistic) and times page 2 of each list page through the test client,
+once as a normal GET and once with HX-Request, reporting median time and
+response size.
+
+Usage:
+    python -m benchmarks.bench_fragments
+    python -m benchmarks.bench_fragments --requests 200000 --categories 60
+"""
+import argparse
+import os
+import statistics
+import time
+from app import db
+from app.entity.shortlist import Shortlist
+from benchmarks.datagen import add_staff, make_app, populate
+
+
+def timed(client, url, repeat, headers=None):
+    samples, size = [], 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        resp = client.get(url, headers=headers or {})
+        samples.append(time.perf_counter() - t0)
+        assert resp.status_code == 200, (url, resp.status_code)
+        size = len(resp.data)
+    return statistics.median(samples) * 1000, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--categories", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app, path = make_app()
+    try:
+        with app.app_context():
+            populate(args.requests, users=1_000, categories=args.categories)
+            add_staff()
+            csr_id = db.session.execute(
+                db.select(Shortlist.csrRepID).group_by(Shortlist.csrRepID)
+                .order_by(db.func.count().desc()).limit(1)
+            ).scalar()
+            db.session.remove()
+
+        pages = {
+            f"bench{csr_id}@test.com": ["/csr/requests?page=2", "/csr/shortlist?page=2", "/csr/matches?page=2"],
+            "bench2@test.com": ["/pin/requests?page=2"],
+            "pm@bench.test": ["/pm/categories?page=2"],
+        }
+        print(f"{args.requests:,} requests, {args.categories} categories; median of {args.repeat} GETs")
+        print(f"{'page':<24} {'full page':>20} {'htmx fragment':>20}")
+        client = app.test_client()
+        for email, urls in pages.items():
+            client.post("/login", data={"email": email, "password": "bench"})
+            for url in urls:
+                full_ms, full_size = timed(client, url, args.repeat)
+                frag_ms, frag_size = timed(client, url, args.repeat, {"HX-Request": "true"})
+                print(f"{url:<24} {full_ms:7.2f} ms {full_size:>7,} B {frag_ms:7.2f} ms {frag_size:>7,} B")
+            client.get("/logout")
+        with app.app_context():
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
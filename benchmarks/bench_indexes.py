@@ -0,0 +1,104 @@
+"""
+EXPLAIN QUERY PLAN + latency for the hot controller queries, before and after
+app.migrations.upgrade() adds the declared index set to an index-less database.
+
+Usage:
+    python -m benchmarks.bench_indexes --requests 200000
+"""
+import argparse
+import os
+import statistics
+import time
+from datetime import date, timedelta
+from sqlalchemy import text, select, func
+from app import db
+from app.migrations import upgrade
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.control.pin_searchRequest_controller import PinSearchRequestController
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+from app.control.csr_searchHistory_controller import CsrSearchHistoryController
+from app.control.csr_searchShortlist_controller import CsrSearchShortlistController
+from app.control.pin_searchMatchRecord_controller import PinSearchMatchRecordController
+from benchmarks.datagen import make_app, populate
+
+CSR_ID, PIN_ID = 1, 2
+DAY_FROM = (date.today() - timedelta(days=90)).isoformat()
+DAY_TO = (date.today() - timedelta(days=60)).isoformat()
+
+
+def hot_queries():
+    """(label, SQLAlchemy statement) pairs taken from the controllers' query builders."""
+    return [
+        ("pin requests", PinSearchRequestController().searchRequestsQuery(PIN_ID).limit(9).statement),
+        ("pin requests by status",
+         PinSearchRequestController().searchRequestsQuery(PIN_ID, status="open").limit(9).statement),
+        ("csr browse one category",
+         CsrSearchRequestController().searchRequestQuery("Category 3").limit(9).statement),
+        ("csr history", CsrSearchHistoryController().searchHistoryQuery(CSR_ID).limit(10).statement),
+        ("csr history date range", CsrSearchHistoryController().searchHistoryQuery(
+            CSR_ID, None, DAY_FROM, DAY_TO).limit(10).statement),
+        ("pin history date range", PinSearchMatchRecordController().searchMatchRecordQuery(
+            PIN_ID, "", DAY_FROM, DAY_TO).limit(10).statement),
+        ("csr shortlist", CsrSearchShortlistController().searchShortlistQuery(CSR_ID).limit(9).statement),
+        ("shortlist exists", Shortlist.query.filter_by(csrRepID=CSR_ID, requestID=2).statement),
+        ("report breakdown",
+         select(Request.categoryID, Request.status, func.count()).group_by(Request.categoryID, Request.status)),
+    ]
+
+
+def compile_sql(stmt):
+    return str(stmt.compile(dialect=db.engine.dialect, compile_kwargs={"literal_binds": True}))
+
+
+def measure(label_stmts, repeat):
+    results = {}
+    with db.engine.connect() as conn:
+        for label, stmt in label_stmts:
+            sql = compile_sql(stmt)
+            plan = [row[-1] for row in conn.execute(text("EXPLAIN QUERY PLAN " + sql))]
+            samples = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                conn.execute(text(sql)).fetchall()
+                samples.append(time.perf_counter() - t0)
+            results[label] = (plan, statistics.median(samples))
+    return results
+
+
+def drop_declared_indexes():
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name != "ix_user_accounts_email":
+                    conn.execute(text(f'DROP INDEX IF EXISTS "{index.name}"'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app, path = make_app()
+    try:
+        with app.app_context():
+            populate(args.requests)
+            drop_declared_indexes()
+            before = measure(hot_queries(), args.repeat)
+            upgrade()
+            after = measure(hot_queries(), args.repeat)
+
+            for label in before:
+                (plan_b, t_b), (plan_a, t_a) = before[label], after[label]
+                print(f"== {label}: {t_b * 1000:.2f} ms -> {t_a * 1000:.2f} ms")
+                print("   before: " + " | ".join(plan_b))
+                print("   after:  " + " | ".join(plan_a))
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
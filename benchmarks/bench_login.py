@@ -0,0 +1,93 @@
+"""
+Login throughput per password hashing policy.
+
+For each --policy (ALGORITHM:COST) builds a database whose accounts are
+hashed under that policy and times full POST /login requests through the
+test client, one at a time, so the rate is what one worker process can
+serve on one core. A final row times the first login of accounts hashed
+under the first policy while the app is configured for the last one, which
+includes the transparent re-hash.
+
+Usage:
+    python -m benchmarks.bench_login
+    python -m benchmarks.bench_login --logins 50 --policy scrypt:32768 --policy pbkdf2:100000
+"""
+import argparse
+import os
+import statistics
+import time
+from app import db
+from app.passwords import hash_method
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from benchmarks.datagen import make_app
+
+DEFAULT_POLICIES = ["scrypt:32768", "scrypt:16384", "pbkdf2:600000", "pbkdf2:100000"]
+
+
+def configure(app, policy):
+    algorithm, cost = policy.split(":")
+    app.config.update(PASSWORD_HASH_ALGORITHM=algorithm, PASSWORD_HASH_COST=int(cost))
+
+
+def build(policy, logins):
+    app, path = make_app()
+    configure(app, policy)
+    with app.app_context():
+        db.session.add(UserProfile(profileID=1, profileName="CSRRep"))
+        for i in range(logins):
+            user = UserAccount(name=f"User {i}", email=f"user{i}@bench.test", profileID=1)
+            user.password = "bench"
+            db.session.add(user)
+        db.session.commit()
+    return app, path
+
+
+def time_logins(app, logins):
+    samples = []
+    for i in range(logins):
+        client = app.test_client()
+        t0 = time.perf_counter()
+        resp = client.post("/login", data={"email": f"user{i}@bench.test", "password": "bench"})
+        samples.append(time.perf_counter() - t0)
+        assert resp.status_code == 302, resp.status_code
+    return statistics.median(samples) * 1000
+
+
+def report(label, ms):
+    print(f"{label:<44} {ms:8.1f} ms/login  {1000 / ms:8.1f} logins/s per core")
+
+
+def cleanup(app, path):
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+    os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--policy", action="append", help="ALGORITHM:COST, repeatable")
+    args = parser.parse_args()
+    policies = args.policy or DEFAULT_POLICIES
+
+    for policy in policies:
+        app, path = build(policy, args.logins)
+        try:
+            with app.app_context():
+                label = hash_method()
+            report(label, time_logins(app, args.logins))
+        finally:
+            cleanup(app, path)
+
+    app, path = build(policies[0], args.logins)
+    try:
+        configure(app, policies[-1])
+        report(f"first login, {policies[0]} -> {policies[-1]}", time_logins(app, args.logins))
+    finally:
+        cleanup(app, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+"Recommended" sort on /csr/requests: scoring in Python per request vs the
+NumPy ranking matrix.
+
+Fills a database with populate() and, for one CSR rep with match and
+shortlist history, times one 9-card page of recommendations three ways:
+loading every open request and scoring it in Python (the straightforward
+implementation), the NumPy matrix including its build (first call in a
+process, or after a structural write), and the warm NumPy path. The
+newest-first page is shown for reference, along with the cost of patching
+the matrix for a batch of view counts.
+
+Usage:
+    python -m benchmarks.bench_ranking
+    python -m benchmarks.bench_ranking --requests 300000
+"""
+import argparse
+import math
+import os
+import statistics
+import time
+from datetime import datetime
+from app import db
+from app.entity.request import Request
+from app.control.request_ranking import SHORTLIST_BOOST, request_ranking
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+from benchmarks.datagen import make_app, populate
+
+
+def python_ranking(csr_id, page, per_page):
+    """Every open request loaded and scored in Python with the same formula."""
+    state = request_ranking._state()
+    affinity = request_ranking.affinity(csr_id)
+    now = datetime.utcnow()
+    rows = db.session.execute(
+        db.select(Request.requestID, Request.categoryID, Request.createdAt,
+                  Request.viewCount, Request.shortlistCount).where(Request.status == "open")
+    ).all()
+    pops = [math.log1p((v or 0) + SHORTLIST_BOOST * (s or 0)) for _, _, _, v, s in rows]
+    top = max(pops, default=0) or 1.0
+    w = state.weights
+    scored = []
+    for (rid, cat, created, _, _), pop in zip(rows, pops):
+        aff = affinity[cat] if cat < affinity.size else 0.0
+        age = max((now - created).total_seconds() / 86400, 0)
+        score = w["affinity"] * aff + w["recency"] * 0.5 ** (age / state.half_life) + w["popularity"] * pop / top
+        scored.append((-score, -rid))
+    scored.sort()
+    start = (page - 1) * per_page
+    return [-rid for _, rid in scored[start:start + per_page]]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app, path = make_app()
+    try:
+        with app.app_context():
+            populate(args.requests, users=2_000, categories=12)
+            csr = 1
+            controller = CsrSearchRequestController("request_card")
+            state = app.extensions["request_ranking"]
+            open_ids = db.session.execute(
+                db.select(Request.requestID).where(Request.status == "open").limit(500)
+            ).scalars().all()
+
+            assert python_ranking(csr, 1, 9) == request_ranking.top(csr, range(1, 13), None, 1, 9)[0]
+
+            def cold():
+                state.matrix = None
+                controller.recommendRequestPage(csr, None, 1, 9)
+
+            results = [
+                ("newest first (reference)", timed(lambda: controller.searchRequestPage(None, 1, 9), args.repeat)),
+                ("Python scoring, page 1", timed(lambda: python_ranking(csr, 1, 9), args.repeat)),
+                ("NumPy, cold (build + page 1)", timed(cold, args.repeat)),
+                ("NumPy, warm page 1", timed(lambda: controller.recommendRequestPage(csr, None, 1, 9), args.repeat)),
+                ("NumPy, warm page 50", timed(lambda: controller.recommendRequestPage(csr, None, 50, 9), args.repeat)),
+                ("NumPy, warm page 1, one category",
+                 timed(lambda: controller.recommendRequestPage(csr, "Category 3", 1, 9), args.repeat)),
+                ("patch 500 view counts",
+                 timed(lambda: request_ranking.note_views({rid: 1 for rid in open_ids}), args.repeat)),
+            ]
+            print(f"{len(state.matrix):,} open requests of {args.requests:,}; one 9-card page (median of {args.repeat})")
+            for label, ms in results:
+                print(f"{label:<36} {ms:9.2f} ms")
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
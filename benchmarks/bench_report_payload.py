@@ -0,0 +1,93 @@
+"""
+Report payload storage: plain JSON text vs the sectioned, compressed format.
+
+Stores --reports copies of a synthetic report (--categories categories with a
+per-day series each) and times the reports list page query with the body
+loaded vs deferred, and reading the summary of one report by parsing the
+whole JSON text vs decoding one payload section.
+
+Usage:
+    python -m benchmarks.bench_report_payload
+    python -m benchmarks.bench_report_payload --reports 500 --categories 2000
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from sqlalchemy.orm import undefer_group
+from app import db
+from app.entity.report import Report
+from app.report_payload import CODECS, ReportPayload, encode
+from benchmarks.datagen import make_app, add_staff
+
+
+def synthetic_report(categories: int) -> dict:
+    return {
+        "summary": {"total_users": 1000, "total_requests": 100_000, "open_requests": 60_000,
+                    "closed_requests": 40_000, "total_matches": 30_000, "recent_matches_30_days": 900},
+        "period": {"start": "2025-10-01", "end": "2025-11-01", "requests_created": 3000,
+                   "requests_closed": 1000, "matches_completed": 900},
+        "category_breakdown": {
+            f"Category {i}": {"total_requests": i, "open_requests": i // 2, "closed_requests": i - i // 2,
+                              "per_day": [(i * d) % 97 for d in range(31)]}
+            for i in range(categories)
+        },
+    }
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reports", type=int, default=200)
+    parser.add_argument("--categories", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    data = synthetic_report(args.categories)
+    text = json.dumps(data)
+    print(f"report body: {len(text):,} bytes of JSON text")
+    for codec in CODECS:
+        t0 = time.perf_counter()
+        blob = encode(data, codec)
+        print(f"  {codec:<5} {len(blob):>10,} bytes  encode {(time.perf_counter() - t0) * 1000:7.2f} ms")
+
+    app, path = make_app()
+    try:
+        with app.app_context():
+            manager = add_staff()["pm"]
+            blob = encode(data, "zlib")
+            db.session.execute(Report.__table__.insert(), [
+                {"reportTitle": f"Report {i}", "reportType": "monthly", "generatedBy": manager,
+                 "period": "2025-10", "reportData": text if i % 2 else None, "payload": None if i % 2 else blob}
+                for i in range(args.reports)
+            ])
+            db.session.commit()
+
+            def page(*options):
+                return lambda: Report.query.options(*options).order_by(Report.generatedAt.desc()).limit(10).all()
+
+            loaded = timed(page(undefer_group("payload")), args.repeat)
+            deferred = timed(page(), args.repeat)
+            print(f"list page (10 rows):    body loaded {loaded:8.2f} ms   deferred {deferred:8.2f} ms")
+
+            whole = timed(lambda: json.loads(text)["summary"], args.repeat)
+            section = timed(lambda: ReportPayload(blob)["summary"], args.repeat)
+            print(f"read summary:           json.loads  {whole:8.2f} ms   one section {section:8.2f} ms")
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
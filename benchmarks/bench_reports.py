@@ -0,0 +1,120 @@
+"""
+Report generation latency: legacy per-category hydration vs ReportAggregator,
+and a period-correct month breakdown scanned from requests vs summed from the
+daily rollups.
+
+Usage:
+    python -m benchmarks.bench_reports                 # 10k / 100k / 1M requests
+    python -m benchmarks.bench_reports --sizes 10000 100000 --legacy-max 100000
+"""
+import argparse
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from app import db
+from app.entity.user_account import UserAccount
+from app.entity.request import Request
+from app.entity.match_record import MatchRecord
+from app.entity.category import Category
+from app.control.report_aggregator import ReportAggregator
+from benchmarks.datagen import make_app, populate
+
+
+def legacy_metrics():
+    """The pre-aggregator algorithm: 5 COUNTs + all Request rows per category."""
+    summary = {
+        "total_users": UserAccount.query.count(),
+        "total_requests": Request.query.count(),
+        "open_requests": Request.query.filter_by(status="open").count(),
+        "closed_requests": Request.query.filter_by(status="closed").count(),
+        "total_matches": MatchRecord.query.count(),
+        "matches_in_window": MatchRecord.query.filter(
+            MatchRecord.completedAt >= datetime.utcnow() - timedelta(days=30)
+        ).count(),
+    }
+    breakdown = {}
+    for c in Category.query.all():
+        cat_reqs = Request.query.filter_by(categoryID=c.categoryID).all()
+        breakdown[c.categoryName] = {
+            "total_requests": len(cat_reqs),
+            "open_requests": len([r for r in cat_reqs if r.status == "open"]),
+            "closed_requests": len([r for r in cat_reqs if r.status == "closed"]),
+        }
+    return {"summary": summary, "category_breakdown": breakdown}
+
+
+def aggregated_metrics():
+    return ReportAggregator().aggregate(match_from=datetime.utcnow() - timedelta(days=30))
+
+
+def month_bounds():
+    end = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    return end - timedelta(days=30), end
+
+
+def scanned_month():
+    """Period-correct breakdown without rollups: GROUP BY over the month's requests."""
+    start, end = month_bounds()
+    return db.session.execute(
+        select(Request.categoryID, Request.status, func.count())
+        .where(Request.createdAt >= start, Request.createdAt < end)
+        .group_by(Request.categoryID, Request.status)
+    ).all()
+
+
+def rollup_month():
+    return ReportAggregator().aggregate(*month_bounds())
+
+
+def comparable(report):
+    """Drops the 30-day match count: rollups bucket it by day, legacy by timestamp."""
+    summary = {k: v for k, v in report["summary"].items() if k != "matches_in_window"}
+    return summary, report["category_breakdown"]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy-max", type=int, default=1_000_000,
+                        help="skip the legacy path above this many requests")
+    args = parser.parse_args()
+
+    print(f"{'requests':>10} {'legacy (s)':>12} {'aggregator (s)':>15} {'speedup':>9}"
+          f" {'month scan (s)':>15} {'month rollup (s)':>17} {'speedup':>9}")
+    for size in args.sizes:
+        app, path = make_app()
+        try:
+            with app.app_context():
+                populate(size)
+                new = timed(aggregated_metrics, args.repeat)
+                scan = timed(scanned_month, args.repeat)
+                rolled = timed(rollup_month, args.repeat)
+                assert sum(n for _, _, n in scanned_month()) == rollup_month()["period"]["requests_created"]
+                month = f" {scan:>15.4f} {rolled:>17.4f} {scan / rolled:>8.1f}x"
+                if size <= args.legacy_max:
+                    assert comparable(legacy_metrics()) == comparable(aggregated_metrics())
+                    old = timed(legacy_metrics, args.repeat)
+                    print(f"{size:>10} {old:>12.4f} {new:>15.4f} {old / new:>8.1f}x" + month)
+                else:
+                    print(f"{size:>10} {'skipped':>12} {new:>15.4f} {'-':>9}" + month)
+                db.session.remove()
+                db.engine.dispose()
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
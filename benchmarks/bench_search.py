@@ -0,0 +1,68 @@
+"""
+Keyword search latency: ILIKE '%kw%' scans vs the FTS5 index.
+
+Runs the CSR browse query (all open requests + keyword, first page) with each
+backend from app/control/request_search.py, for whole words, typed-so-far
+prefixes, a term present in every row and a term with no hits. Hit counts can
+differ: ILIKE matches substrings anywhere, FTS5 matches word prefixes.
+
+Usage:
+    python -m benchmarks.bench_search                  # 10k / 100k requests
+    python -m benchmarks.bench_search --sizes 10000 100000 1000000 --repeat 7
+"""
+import argparse
+import os
+import statistics
+import time
+from flask import current_app
+from app import db
+from app.control.request_search import Fts5Backend, LikeBackend
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+from benchmarks.datagen import make_app, populate
+
+KEYWORDS = ["Request 4242", "requ 4242", "Synthetic", "nomatch"]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def run_with(backend, fn):
+    current_app.extensions["request_search"] = backend
+    return fn()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    like, fts = LikeBackend(), Fts5Backend()
+    print(f"{'requests':>10} {'keyword':<16} {'hits':>13} {'ILIKE (ms)':>11} {'FTS5 (ms)':>10} {'speedup':>8}")
+    for size in args.sizes:
+        app, path = make_app()
+        try:
+            with app.app_context():
+                populate(size)
+                for kw in KEYWORDS:
+                    def fn():
+                        return CsrSearchRequestController("request_card").searchRequestPage(None, 1, 9, kw)
+                    hits = f"{run_with(like, fn).total}/{run_with(fts, fn).total}"
+                    old = timed(lambda: run_with(like, fn), args.repeat) * 1000
+                    new = timed(lambda: run_with(fts, fn), args.repeat) * 1000
+                    print(f"{size:>10} {kw:<16} {hits:>13} {old:>11.2f} {new:>10.2f} {old / new:>7.1f}x")
+                db.session.remove()
+                db.engine.dispose()
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+Controller and route benchmark suite on a synthetic dataset.
+
+Builds a throwaway database with benchmarks.datagen, then times every
+controller in app/control and every page in app/boundary/routes.py, recording
+the median/min/max latency and the number of SQL statements per call. Results
+are written as JSON (and optionally CSV) so runs can be compared.
+
+Usage:
+    python -m benchmarks.bench_suite --requests 100000 --out results.json
+    python -m benchmarks.bench_suite --requests 10000 --csv results.csv
+    python -m benchmarks.bench_suite --out new.json --compare old.json
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+import sqlalchemy
+from sqlalchemy import event
+from app import db
+from app.entity.request import Request
+from app.control.view_counter import view_counter
+from benchmarks.datagen import make_app, populate, add_staff
+
+from app.control.auth_controller import AuthController
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+from app.control.csr_viewRequest_controller import CsrViewRequestController
+from app.control.csr_saveToShortlist_controller import CsrSaveToShortlistController
+from app.control.csr_removeShortlist_controller import CsrRemoveShortlistController
+from app.control.csr_searchShortlist_controller import CsrSearchShortlistController
+from app.control.csr_viewShortlist_controller import CsrViewShortlistController
+from app.control.csr_searchHistory_controller import CsrSearchHistoryController
+from app.control.csr_viewHistory_controller import CsrViewHistoryController
+from app.control.pin_createRequest_controller import PinCreateRequestController
+from app.control.pin_viewRequest_controller import PinViewRequestController
+from app.control.pin_updateRequest_controller import PinUpdateRequestController
+from app.control.pin_deleteRequest_controller import PinDeleteRequestController
+from app.control.pin_searchRequest_controller import PinSearchRequestController
+from app.control.pin_searchMatchRecord_controller import PinSearchMatchRecordController
+from app.control.pin_viewMatchRecord_controller import PinViewMatchRecordController
+from app.control.pin_trackViews_controller import PinTrackViewsController
+from app.control.pin_trackShortlists_controller import PinTrackShortlistsController
+from app.control.platform_viewCategory_controller import PlatformViewCategoryController
+from app.control.platform_searchCategory_controller import PlatformSearchCategoryController
+from app.control.platform_updateCategory_controller import PlatformUpdateCategoryController
+from app.control.platform_suspendCategory_controller import PlatformSuspendCategoryController
+from app.control.platform_activateCategory_controller import PlatformActivateCategoryController
+from app.control.platform_generateDailyReport_controller import PlatformGenerateDailyReportController
+from app.control.platform_generateWeeklyReport_controller import PlatformGenerateWeeklyReportController
+from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
+from app.control.useradmin_viewUserAccount_controller import UserAdminViewUserAccountController
+from app.control.useradmin_searchUserAccount_controller import UserAdminSearchUserAccountController
+from app.control.useradmin_updateUserAccount_controller import UserAdminUpdateUserAccountController
+from app.control.useradmin_suspendUserAccount_controller import UserAdminSuspendUserAccountController
+from app.control.useradmin_activateUserAccount_controller import UserAdminActivateUserAccountController
+from app.control.useradmin_viewUserProfile_controller import UserAdminViewUserProfileController
+from app.control.useradmin_searchUserProfile_controller import UserAdminSearchUserProfileController
+
+# app.extensions entries that hold in-process caches; cleared before each
+# timed call unless --warm is given, so runs measure database work
+CACHES = ("principal_cache", "dashboard_metrics")
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _record(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+def _materialize(result):
+    """Forces results returned as un-executed queries so their SQL is timed."""
+    return result.all() if hasattr(result, "all") else result
+
+
+def build_fixture(ids):
+    """Looks up a representative request (owned by the benchmark PIN) for the cases."""
+    pin = ids["pin"]
+    req = db.session.execute(
+        db.select(Request.requestID, Request.categoryID).where(Request.pinID == pin).limit(1)
+    ).first()
+    ids.update(request=req.requestID, category=req.categoryID)
+    return ids
+
+
+def controller_cases(ids):
+    csr, pin, pm = ids["csr"], ids["pin"], ids["pm"]
+    rid, cat = ids["request"], ids["category"]
+    today = date.today()
+    day = today.isoformat()
+    month = today.strftime("%Y-%m")
+    year_ago = (today - timedelta(days=365)).isoformat()
+
+    def create_then_delete():
+        PinCreateRequestController().createRequest(userID=pin, categoryID=cat, title="bench", description="bench")
+        new_id = db.session.execute(db.select(db.func.max(Request.requestID))).scalar()
+        PinDeleteRequestController().deleteRequest(new_id, pin)
+
+    def save_then_remove():
+        CsrSaveToShortlistController().saveToShortlist(rid, csr)
+        CsrRemoveShortlistController().removeFromShortlist(csr, rid)
+
+    def suspend_then_activate():
+        UserAdminSuspendUserAccountController().suspendUserAccount(pin)
+        UserAdminActivateUserAccountController().activateUserAccount(pin)
+
+    def category_suspend_then_activate():
+        PlatformSuspendCategoryController().suspendCategory(cat)
+        PlatformActivateCategoryController().activateCategory(cat)
+
+    return [
+        ("auth.login", lambda: AuthController().login(f"bench{csr}@test.com", "bench")),
+        ("csr.searchRequestPage", lambda: CsrSearchRequestController("request_card").searchRequestPage("", 1)),
+        ("csr.searchRequestPage[category]",
+         lambda: CsrSearchRequestController("request_card").searchRequestPage("Category 1", 2)),
+        ("csr.viewRequestDetails", lambda: CsrViewRequestController().viewRequestDetails(rid)),
+        ("csr.saveToShortlist+removeFromShortlist", save_then_remove),
+        ("csr.searchShortlistPage", lambda: CsrSearchShortlistController("shortlist_card").searchShortlistPage(csr)),
+        ("csr.viewShortlist", lambda: CsrViewShortlistController().viewShortlist(csr)),
+        ("csr.searchHistoryPage", lambda: CsrSearchHistoryController("csr_history_row").searchHistoryPage(csr)),
+        ("csr.searchHistoryPage[dates]",
+         lambda: CsrSearchHistoryController("csr_history_row").searchHistoryPage(csr, None, year_ago, day)),
+        ("csr.viewHistoryByService", lambda: CsrViewHistoryController().viewHistoryByService(csr, cat)),
+        ("pin.createRequest+deleteRequest", create_then_delete),
+        ("pin.viewRequests", lambda: PinViewRequestController().viewRequests(pin)),
+        ("pin.viewRequestDetails", lambda: PinViewRequestController().viewRequestDetails(rid)),
+        ("pin.updateRequest", lambda: PinUpdateRequestController().updateRequest(rid, None, pin, None, "bench", None)),
+        ("pin.searchRequestsPage", lambda: PinSearchRequestController("pin_request_row").searchRequestsPage(pin, "Request")),
+        ("pin.searchMatchRecordPage",
+         lambda: PinSearchMatchRecordController("pin_history_row").searchMatchRecordPage(pin, "Category", year_ago, day)),
+        ("pin.viewCompletedRecords", lambda: PinViewMatchRecordController().viewCompletedRecords(pin)),
+        ("pin.trackViews", lambda: PinTrackViewsController().trackViews(rid)),
+        ("pin.trackShortlists", lambda: PinTrackShortlistsController().trackShortlists(rid)),
+        ("pm.view_categories", lambda: PlatformViewCategoryController().view_categories()),
+        ("pm.searchCategoryByName", lambda: PlatformSearchCategoryController().searchCategoryByName("Category")),
+        ("pm.updateCategory", lambda: PlatformUpdateCategoryController().updateCategory(cat, f"Category {cat}", "bench")),
+        ("pm.suspendCategory+activateCategory", category_suspend_then_activate),
+        ("pm.generateDailyReport", lambda: PlatformGenerateDailyReportController().generateDailyReport(pm, day)),
+        ("pm.generateWeeklyReport", lambda: PlatformGenerateWeeklyReportController().generateWeeklyReport(pm, day)),
+        ("pm.generateMonthlyReport", lambda: PlatformGenerateMonthlyReportController().generateMonthlyReport(pm, month)),
+        ("admin.viewUserAccount", lambda: UserAdminViewUserAccountController().viewUserAccount(pin)),
+        ("admin.list_all", lambda: UserAdminViewUserAccountController().list_all()),
+        ("admin.searchUserAccountByName", lambda: UserAdminSearchUserAccountController().searchUserAccountByName("Bench User 1")),
+        ("admin.updateUserAccount", lambda: UserAdminUpdateUserAccountController().updateUserAccount(pin, name=f"Bench User {pin}")),
+        ("admin.suspendUserAccount+activateUserAccount", suspend_then_activate),
+        ("admin.viewUserProfile", lambda: UserAdminViewUserProfileController().viewUserProfile(2)),
+        ("admin.searchUserByProfile", lambda: UserAdminSearchUserProfileController().searchUserByProfile(2)),
+    ]
+
+
+def route_cases(ids):
+    rid = ids["request"]
+    today = date.today().isoformat()
+    return {
+        f"bench{ids['csr']}@test.com": [
+            "/csr/dashboard", "/csr/requests", "/csr/requests?category=Category 1&page=2",
+            f"/csr/requests/{rid}", "/csr/shortlist", "/csr/matches",
+            f"/csr/matches?start_date=2000-01-01&end_date={today}",
+        ],
+        f"bench{ids['pin']}@test.com": [
+            "/pin/dashboard", "/pin/requests", "/pin/requests?search=Request&page=2",
+            f"/pin/requests/{rid}", "/pin/requests/create", f"/pin/requests/{rid}/edit",
+            "/pin/match-records", "/pin/match-records?category=Category&start_date=2000-01-01",
+        ],
+        "admin@bench.test": [
+            "/admin/dashboard", "/admin/users", "/admin/users?search=Bench User 1",
+            f"/admin/users/{ids['pin']}", f"/admin/users/{ids['pin']}/edit", "/admin/users/create",
+            "/admin/profiles", "/admin/profiles/2", "/admin/profiles/2/edit",
+            "/admin/search/users-by-profile?profile_id=2",
+        ],
+        "pm@bench.test": [
+            "/pm/dashboard", "/pm/categories", "/pm/categories?search=Category",
+            f"/pm/categories/{ids['category']}/edit", "/pm/reports", "/pm/reports/generate",
+            "/pm/reports/1",
+        ],
+    }
+
+
+def measure(app, engine, fn, repeat, warm, reset=None):
+    counter = StatementCounter(engine)
+    samples, statements, outcome = [], 0, None
+    for i in range(repeat + 1):           # first call is an untimed warm-up
+        if not warm:
+            for name in CACHES:
+                app.extensions[name].clear()
+        if reset:
+            reset()
+        with counter:
+            t0 = time.perf_counter()
+            outcome = fn()
+            elapsed = time.perf_counter() - t0
+        if i:
+            samples.append(elapsed * 1000)
+            statements = counter.count
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "queries": statements,
+    }, outcome
+
+
+def run(args):
+    app, path = make_app()
+    results = []
+    try:
+        # a request context so AuthController.login can call login_user
+        with app.test_request_context():
+            t0 = time.perf_counter()
+            populate(args.requests, users=args.users, categories=args.categories,
+                     shortlist_every=args.shortlist_every, match_every=args.match_every)
+            ids = build_fixture({"csr": 1, "pin": 2, **add_staff()})
+            engine = db.engine
+            # one report so /pm/reports/1 has something to show
+            PlatformGenerateDailyReportController().generateDailyReport(ids["pm"], date.today().isoformat())
+            print(f"dataset ready in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+            for name, fn in controller_cases(ids):
+                if args.only and args.only not in name:
+                    continue
+                stats, _ = measure(app, engine, lambda: _materialize(fn()), args.repeat, args.warm,
+                                   reset=db.session.expunge_all)
+                results.append({"kind": "controller", "name": name, **stats})
+                _echo(results[-1])
+
+        for email, urls in route_cases(ids).items():
+            client = app.test_client()
+            resp = client.post("/login", data={"email": email, "password": "bench"})
+            assert resp.status_code == 302, f"login failed for {email}"
+            for url in urls:
+                if args.only and args.only not in url:
+                    continue
+                # no outer app context here: it would share `g` (and Flask-Login's
+                # per-request user) across the timed requests
+                stats, resp = measure(app, engine, lambda: client.get(url), args.repeat, args.warm)
+                results.append({"kind": "route", "name": f"GET {url}", "status": resp.status_code, **stats})
+                _echo(results[-1])
+        with app.app_context():
+            view_counter.flush()          # before the database file goes away
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+    return results
+
+
+def _echo(row):
+    print(f"{row['kind']:<10} {row['name']:<58} {row['median_ms']:>10.2f} ms {row['queries']:>4} q",
+          file=sys.stderr)
+
+
+def metadata(args):
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        rev = None
+    return {
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "git_rev": rev,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "sqlite": sqlite3.sqlite_version,
+        "scale": {
+            "requests": args.requests, "users": args.users, "categories": args.categories,
+            "shortlist_every": args.shortlist_every, "match_every": args.match_every,
+        },
+        "repeat": args.repeat,
+        "warm_caches": args.warm,
+    }
+
+
+def compare(results, baseline_path, threshold):
+    """Prints cases that got slower by more than `threshold`x or issue more queries; returns their count."""
+    with open(baseline_path) as fh:
+        baseline = {(r["kind"], r["name"]): r for r in json.load(fh)["results"]}
+    regressions = 0
+    for row in results:
+        old = baseline.get((row["kind"], row["name"]))
+        if not old:
+            continue
+        ratio = row["median_ms"] / old["median_ms"] if old["median_ms"] else 1.0
+        if ratio > threshold or row["queries"] > old["queries"]:
+            regressions += 1
+            print(f"REGRESSION {row['kind']} {row['name']}: {old['median_ms']:.2f} -> {row['median_ms']:.2f} ms "
+                  f"({ratio:.2f}x), {old['queries']} -> {row['queries']} queries")
+    print(f"{regressions} regression(s) against {baseline_path}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--categories", type=int, default=12)
+    parser.add_argument("--shortlist-every", type=int, default=2, help="shortlist every Nth request (0 = none)")
+    parser.add_argument("--match-every", type=int, default=3, help="close + match every Nth request (0 = none)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warm", action="store_true", help="keep in-process caches between calls")
+    parser.add_argument("--only", help="run only cases whose name contains this text")
+    parser.add_argument("--out", default="bench_results.json", help="JSON results file")
+    parser.add_argument("--csv", help="also write results as CSV")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    results = run(args)
+    with open(args.out, "w") as fh:
+        json.dump({"meta": metadata(args), "results": results}, fh, indent=2)
+    print(f"wrote {len(results)} results to {args.out}", file=sys.stderr)
+    if args.csv:
+        fields = ["kind", "name", "status", "median_ms", "min_ms", "max_ms", "queries"]
+        with open(args.csv, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(results)
+    if args.compare:
+        sys.exit(1 if compare(results, args.compare, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
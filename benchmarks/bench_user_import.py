@@ -0,0 +1,73 @@
+"""
+User onboarding throughput: one createUserAccount call per row vs the bulk
+CSV import.
+
+Creates --rows accounts three ways on fresh databases: the per-row
+controller (two lookups, one hash and one commit per account), the bulk
+import hashing in-process, and the bulk import hashing in a pool of
+--workers processes. Password hashing dominates, so the pool scales with
+the cores available.
+
+Usage:
+    python -m benchmarks.bench_user_import
+    python -m benchmarks.bench_user_import --rows 2000 --workers 8
+"""
+import argparse
+import io
+import os
+import time
+from app import db
+from app.entity.user_profile import UserProfile
+from app.control.useradmin_createUserAccount_controller import UserAdminCreateUserAccountController
+from app.control.useradmin_importUserAccounts_controller import UserAdminImportUserAccountsController
+from benchmarks.datagen import make_app
+
+
+def csv_rows(rows):
+    return [(f"Partner Rep {i}", f"rep{i}@partner.test", f"pw-{i}") for i in range(rows)]
+
+
+def per_row(rows, workers):
+    controller = UserAdminCreateUserAccountController()
+    for name, email, password in rows:
+        controller.createUserAccount(name, email, password, None, None, 1)
+
+
+def bulk(rows, workers):
+    text = "name,email,password\n" + "\n".join(",".join(r) for r in rows)
+    result = UserAdminImportUserAccountsController().importUserAccounts(io.StringIO(text), 1, hash_workers=workers)
+    assert result.created == len(rows), result.errors[:3]
+
+
+def run(label, fn, rows, workers):
+    app, path = make_app()
+    try:
+        with app.app_context():
+            db.session.add(UserProfile(profileID=1, profileName="CSRRep"))
+            db.session.commit()
+            t0 = time.perf_counter()
+            fn(rows, workers)
+            elapsed = time.perf_counter() - t0
+            print(f"{label:<28} {elapsed:8.2f} s  {len(rows) / elapsed:8.1f} rows/s")
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rows = csv_rows(args.rows)
+    print(f"{args.rows} accounts, {os.cpu_count()} CPU(s)")
+    run("per-row createUserAccount", per_row, rows, 1)
+    run("bulk import, in-process", bulk, rows, 1)
+    if args.workers > 1:
+        run(f"bulk import, {args.workers} workers", bulk, rows, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Admin user search: ILIKE scan vs the trigram FTS5 index.
+
+Loads --users accounts with varied names and emails and times one page of
+the admin user list for several searches three ways: the old path (ILIKE on
+name, every match loaded and sliced in Python), the LIKE backend with
+database pagination, and the trigram backend with database pagination.
+
+Usage:
+    python -m benchmarks.bench_user_search
+    python -m benchmarks.bench_user_search --users 300000
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+from app import db
+from app.entity.user_account import UserAccount
+from app.control.user_search import BACKENDS, drop_user_search_index, install_user_search_index
+from app.control.useradmin_searchUserAccount_controller import UserAdminSearchUserAccountController
+from benchmarks.datagen import make_app, _insert
+from seed import CSR_NAMES, PIN_NAMES
+
+DOMAINS = ["partner.org", "mail.com", "volunteer.sg", "example.net"]
+SEARCHES = ["Tan", "quentin soh", "volunteer", "rahman 4", "Ka", "12345"]
+
+
+def load_users(count):
+    rng = random.Random(7)
+    names = CSR_NAMES + PIN_NAMES
+    rows = []
+    for i in range(1, count + 1):
+        name = f"{rng.choice(names)} {i}"
+        local = name.lower().replace(" ", ".")
+        rows.append({"userID": i, "name": name, "email": f"{local}@{rng.choice(DOMAINS)}",
+                     "password": "x", "isActive": True, "profileID": 1})
+    # per-row trigger writes make a bulk load I/O bound; index once afterwards instead
+    drop_user_search_index(db.session.connection())
+    _insert(UserAccount.__table__, rows)
+    install_user_search_index(db.session.connection())
+    db.session.commit()
+
+
+def old_path(search):
+    users = (UserAccount.query.filter(UserAccount.name.ilike(f"%{search}%"))
+             .order_by(UserAccount.userID).all())
+    return len(users), users[:10]
+
+
+def paged(search):
+    page = UserAdminSearchUserAccountController().searchUserAccountPage(search, 1, 10)
+    return page.total, page.items
+
+
+def timed(fn, search, repeat):
+    samples = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        t0 = time.perf_counter()
+        total, _ = fn(search)
+        samples.append(time.perf_counter() - t0)
+    return total, statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app, path = make_app()
+    try:
+        with app.app_context():
+            from app.entity.user_profile import UserProfile
+            db.session.add(UserProfile(profileID=1, profileName="CSRRep"))
+            db.session.commit()
+            load_users(args.users)
+            db.session.execute(db.text("ANALYZE"))
+            print(f"{args.users:,} accounts; one 10-row page per search")
+            print(f"{'search':<14} {'ILIKE + slice':>22} {'LIKE, paged':>22} {'trigram, paged':>22}")
+            for search in SEARCHES:
+                cells = []
+                old_total, old_ms = timed(old_path, search, args.repeat)
+                cells.append(f"{old_ms:8.1f} ms ({old_total:>6,})")
+                for name in ("like", "trigram"):
+                    app.extensions["user_search"] = BACKENDS[name]()
+                    total, ms = timed(paged, search, args.repeat)
+                    cells.append(f"{ms:8.1f} ms ({total:>6,})")
+                print(f"{search!r:<14} " + " ".join(f"{c:>22}" for c in cells))
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
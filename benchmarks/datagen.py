@@ -0,0 +1,138 @@
+"""
+Synthetic dataset builder for the benchmark scripts.
+
+Creates a throwaway SQLite database and fills it with Core bulk inserts
+(no ORM unit of work), so 1M-row datasets can be built in reasonable time.
+"""
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+from app import create_app, db
+from app.passwords import hash_password
+from seed import bulk_insert
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.entity.match_record import MatchRecord
+from app.control import rollups
+
+CHUNK = 10_000
+
+
+def make_app(db_path: str = None):
+    """Returns (app, db_path) bound to a fresh SQLite file."""
+    if db_path is None:
+        fd, db_path = tempfile.mkstemp(suffix=".db", prefix="csr_bench_")
+        os.close(fd)
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
+    })
+    return app, db_path
+
+
+def _insert(table, rows):
+    bulk_insert(table, rows, CHUNK)
+
+
+def populate(requests: int, users: int = 1_000, categories: int = 12, seed: int = 42,
+             shortlist_every: int = 2, match_every: int = 3):
+    """
+    Fills the bound database (inside an app context) with `requests` requests,
+    spread over `users` CSR/PIN accounts and `categories` categories.
+    Every `match_every`-th request is closed with a completed MatchRecord and
+    every `shortlist_every`-th request is shortlisted by one CSR (0 = none).
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    password = hash_password("bench")
+
+    _insert(UserProfile.__table__, [
+        {"profileID": 1, "profileName": "CSRRep", "isActive": True},
+        {"profileID": 2, "profileName": "PersonInNeed", "isActive": True},
+    ])
+    _insert(UserAccount.__table__, [
+        {
+            "userID": i,
+            "name": f"Bench User {i}",
+            "email": f"bench{i}@test.com",
+            "password": password,
+            "isActive": True,
+            "profileID": 1 if i % 2 else 2,
+        }
+        for i in range(1, users + 1)
+    ])
+    _insert(Category.__table__, [
+        {"categoryID": i, "categoryName": f"Category {i}", "isActive": True}
+        for i in range(1, categories + 1)
+    ])
+
+    csr_ids = list(range(1, users + 1, 2))
+    pin_ids = list(range(2, users + 1, 2))
+    for start in range(0, requests, CHUNK):
+        req_rows, match_rows, shortlist_rows = [], [], []
+        for rid in range(start + 1, min(start + CHUNK, requests) + 1):
+            created = now - timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+            closed = bool(match_every) and rid % match_every == 0
+            category_id = rng.randrange(1, categories + 1)
+            pin_id = rng.choice(pin_ids)
+            shortlisted = bool(shortlist_every) and rid % shortlist_every == 0
+            req_rows.append({
+                "requestID": rid,
+                "pinID": pin_id,
+                "categoryID": category_id,
+                "title": f"Request {rid}",
+                "description": f"Synthetic request {rid}",
+                "status": "closed" if closed else "open",
+                "viewCount": 0,
+                "shortlistCount": 1 if shortlisted else 0,
+                "createdAt": created,
+                "closedAt": created + timedelta(days=1) if closed else None,
+            })
+            if shortlisted:
+                shortlist_rows.append({
+                    "requestID": rid,
+                    "csrRepID": rng.choice(csr_ids),
+                    "createdAt": created,
+                })
+            if closed:
+                match_rows.append({
+                    "requestID": rid,
+                    "csrRepID": rng.choice(csr_ids),
+                    "pinID": pin_id,
+                    "categoryID": category_id,
+                    "status": "completed",
+                    "matchedAt": created + timedelta(hours=3),
+                    "completedAt": created + timedelta(days=1),
+                })
+        _insert(Request.__table__, req_rows)
+        _insert(MatchRecord.__table__, match_rows)
+        _insert(Shortlist.__table__, shortlist_rows)
+    # Core inserts bypass the ORM hooks that maintain the report rollups
+    rollups.rebuild()
+    db.session.commit()
+
+
+def add_staff(password: str = "bench"):
+    """
+    Adds a UserAdmin and a PlatformManager account (profiles 3 and 4) after
+    populate(); returns {"admin": userID, "pm": userID}. Emails are
+    admin@bench.test and pm@bench.test.
+    """
+    start = db.session.execute(db.select(db.func.max(UserAccount.userID))).scalar() or 0
+    hashed = hash_password(password)
+    _insert(UserProfile.__table__, [
+        {"profileID": 3, "profileName": "UserAdmin", "isActive": True},
+        {"profileID": 4, "profileName": "PlatformManager", "isActive": True},
+    ])
+    staff = {"admin": start + 1, "pm": start + 2}
+    _insert(UserAccount.__table__, [
+        {"userID": uid, "name": f"Bench {role}", "email": f"{role}@bench.test",
+         "password": hashed, "isActive": True, "profileID": 3 if role == "admin" else 4}
+        for role, uid in staff.items()
+    ])
+    db.session.commit()
+    return staff
@@ -1,30 +1,47 @@
 """
 Realistic database seeding for demo and system demonstration.
 
-Creates:
+Creates (default volumes):
 - 1 UserAdmin, 1 CSRRep, 1 PersonInNeed, 1 PlatformManager
 - 100 CSR Reps
 - 100 PIN Users
 - 3 Categories
 - 100 Requests per Category (300 total)
 - Shortlists + Completed Matches
-- Additional clean demo data for core accounts 
+- Additional clean demo data for core accounts
 
 All passwords: testing123!
+
+Every volume is configurable, so the same script stands up load-test
+databases:
+
+    python seed.py --csr-users 5000 --pin-users 50000 --categories 12 \\
+                   --requests-per-category 100000 --seed 7
+
+Rows are written with chunked Core INSERTs (no ORM unit of work), the password
+is hashed once and reused for every synthetic user, and all randomness comes
+from one seeded RNG, so a given set of options always produces the same data
+(relative to the current time).
 """
 
+import argparse
+import random
+import sys
+import time
 from datetime import datetime, timedelta
-from random import choice
 from app import create_app, db
+from app.passwords import hash_password
 from app.entity.user_profile import UserProfile
 from app.entity.user_account import UserAccount
 from app.entity.category import Category
 from app.entity.request import Request
 from app.entity.shortlist import Shortlist
 from app.entity.match_record import MatchRecord
-from app.entity.report import Report
 
 
+PASSWORD = "testing123!"
+CHUNK = 10_000
+
 # ------------------ NAME LISTS ------------------
 CSR_NAMES = [
     "Aaron Tan", "Brandon Lee", "Caleb Lim", "Daniel Wong", "Ethan Koh",
@@ -44,197 +61,267 @@ PIN_NAMES = [
     "Zoe Lim"
 ]
 
+CATEGORIES = [
+    ("Transportation", "Transport help"),
+    ("Medical Aid", "Medical assistance"),
+    ("Food Support", "Food support & groceries"),
+]
+
+DEMO_TITLES = [
+    "Wheelchair-accessible transport needed",
+    "Groceries delivery support",
+    "Medical appointment follow-up transport",
+    "Assistance with weekly food run",
+    "Support for clinic visit transportation"
+]
+
+DEMO_DESCRIPTIONS = [
+    "Requesting assistance due to mobility issues.",
+    "Regular grocery support needed for 4 weeks.",
+    "Follow-up appointment scheduled, require lift assistance.",
+    "Need weekly help to collect groceries from NTUC.",
+    "Transportation support required for medical visit."
+]
+
 
 # ------------------ Helper Functions ------------------
 def sequential_phone(i: int) -> str:
     return str(81230000 + i)
 
 
-def make_user(name, email, profile, idx):
-    u = UserAccount(
-        name=name,
-        email=email,
-        profileID=profile.profileID,
-        phoneNumber=sequential_phone(idx),
-        age=25 + (idx % 40),
-        isActive=True
-    )
-    u.password = "testing123!"
-    db.session.add(u)
-    return u
+def user_row(user_id, name, email, profile_id, idx, password_hash):
+    return {
+        "userID": user_id,
+        "name": name,
+        "email": email,
+        "password": password_hash,
+        "profileID": profile_id,
+        "phoneNumber": sequential_phone(idx),
+        "age": 25 + (idx % 40),
+        "isActive": True,
+    }
+
+
+class Progress:
+    """Reports rows written per entity and overall throughput on stderr."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.live = enabled and sys.stderr.isatty()   # redraw one status line on terminals
+        self.started = time.perf_counter()
+        self.totals = {}
+
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return sum(self.totals.values()) / elapsed if elapsed else 0.0
+
+    def update(self, label: str, rows: int):
+        self.totals[label] = self.totals.get(label, 0) + rows
+        if self.live:
+            print(f"\r  {label:<14} {self.totals[label]:>12,} rows  {self.rate():>10,.0f} rows/s",
+                  end="", file=sys.stderr)
+
+    def summary(self):
+        if self.enabled:
+            if self.live:
+                print(file=sys.stderr)
+            for label, rows in self.totals.items():
+                print(f"  {label:<14} {rows:>12,} rows", file=sys.stderr)
+            elapsed = time.perf_counter() - self.started
+            print(f"  {sum(self.totals.values()):,} rows in {elapsed:.1f}s ({self.rate():,.0f} rows/s)",
+                  file=sys.stderr)
+
+
+def bulk_insert(table, rows, chunk: int = CHUNK, progress: Progress = None, label: str = None) -> int:
+    """Executes Core INSERTs for an iterable of row dicts, `chunk` rows per executemany."""
+    count, batch = 0, []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk:
+            db.session.execute(table.insert(), batch)
+            count += len(batch)
+            if progress:
+                progress.update(label or table.name, len(batch))
+            batch = []
+    if batch:
+        db.session.execute(table.insert(), batch)
+        count += len(batch)
+        if progress:
+            progress.update(label or table.name, len(batch))
+    return count
 
 
 # ------------------ Seeding Logic ------------------
-def reset_and_seed():
-    app = create_app()
+def reset_and_seed(csr_users: int = 100, pin_users: int = 100, categories: int = 3,
+                   requests_per_category: int = 100, shortlist_every: int = 2, match_every: int = 3,
+                   seed: int = 42, chunk: int = CHUNK, app=None, quiet: bool = False):
+    """
+    Drops and recreates every table, then loads the demo dataset at the given
+    volumes. Every `shortlist_every`-th request is shortlisted by a CSR and
+    every `match_every`-th request is closed with a completed match (0 = none).
+    Returns a dict of row counts per table.
+    """
+    if categories < 1:
+        # checked before anything is dropped: the demo requests need a category
+        raise ValueError("At least one category is required.")
+    from app.migrations import upgrade
+    from app.control.request_search import drop_search_index
+    from app.control.user_search import drop_user_search_index
+
+    app = app or create_app()
+    rng = random.Random(seed)
+    progress = Progress(enabled=not quiet)
+    now = datetime.utcnow()
+
     with app.app_context():
+        # the FTS indexes are not entities: drop them with the tables, rebuild them once at the end
+        with db.engine.begin() as conn:
+            drop_search_index(conn)
+            drop_user_search_index(conn)
         db.drop_all()
         db.create_all()
 
-        # ---- Profiles ----
-        p_admin = UserProfile(profileName="UserAdmin", description="Manages users")
-        p_csr = UserProfile(profileName="CSRRep", description="CSR representative")
-        p_pin = UserProfile(profileName="PersonInNeed", description="Needs assistance")
-        p_pm = UserProfile(profileName="PlatformManager", description="Manages categories and reports")
-        db.session.add_all([p_admin, p_csr, p_pin, p_pm])
-        db.session.commit()
+        # one hash for every account (hashing is deliberately slow)
+        password_hash = hash_password(PASSWORD)
 
-        # ---- Core Demo Accounts ----
-        admin = make_user("Admin User", "admin@test.com", p_admin, 1)
-        csr_main = make_user("CSR User", "csr@test.com", p_csr, 2)
-        pin_main = make_user("PIN User", "pin@test.com", p_pin, 3)
-        pm = make_user("PM User", "pm@test.com", p_pm, 4)
-        db.session.commit()
-
-        # ---- 100 CSR Users ----
-        csr_users = []
-        idx = 10
-        for i in range(100):
-            name = CSR_NAMES[i % len(CSR_NAMES)] + f" {i+1:03d}"
-            csr_users.append(make_user(name, f"csr{i+1:03d}@test.com", p_csr, idx))
-            idx += 1
-
-        # ---- 100 PIN Users ----
-        pin_users = []
-        for i in range(100):
-            name = PIN_NAMES[i % len(PIN_NAMES)] + f" {i+1:03d}"
-            pin_users.append(make_user(name, f"pin{i+1:03d}@test.com", p_pin, idx))
-            idx += 1
-
-        db.session.commit()
+        # ---- Profiles ----
+        bulk_insert(UserProfile.__table__, [
+            {"profileID": 1, "profileName": "UserAdmin", "description": "Manages users", "isActive": True},
+            {"profileID": 2, "profileName": "CSRRep", "description": "CSR representative", "isActive": True},
+            {"profileID": 3, "profileName": "PersonInNeed", "description": "Needs assistance", "isActive": True},
+            {"profileID": 4, "profileName": "PlatformManager",
+             "description": "Manages categories and reports", "isActive": True},
+        ], progress=progress, label="profiles")
+        P_ADMIN, P_CSR, P_PIN, P_PM = 1, 2, 3, 4
+
+        # ---- Core Demo Accounts (userID 1-4) + CSR / PIN users ----
+        ADMIN, CSR_MAIN, PIN_MAIN, PM = 1, 2, 3, 4
+        csr_ids = range(5, 5 + csr_users)
+        pin_ids = range(5 + csr_users, 5 + csr_users + pin_users)
+
+        def users():
+            yield user_row(ADMIN, "Admin User", "admin@test.com", P_ADMIN, 1, password_hash)
+            yield user_row(CSR_MAIN, "CSR User", "csr@test.com", P_CSR, 2, password_hash)
+            yield user_row(PIN_MAIN, "PIN User", "pin@test.com", P_PIN, 3, password_hash)
+            yield user_row(PM, "PM User", "pm@test.com", P_PM, 4, password_hash)
+            idx = 10
+            for i, uid in enumerate(csr_ids):
+                name = CSR_NAMES[i % len(CSR_NAMES)] + f" {i+1:03d}"
+                yield user_row(uid, name, f"csr{i+1:03d}@test.com", P_CSR, idx, password_hash)
+                idx += 1
+            for i, uid in enumerate(pin_ids):
+                name = PIN_NAMES[i % len(PIN_NAMES)] + f" {i+1:03d}"
+                yield user_row(uid, name, f"pin{i+1:03d}@test.com", P_PIN, idx, password_hash)
+                idx += 1
+
+        bulk_insert(UserAccount.__table__, users(), chunk, progress, "users")
 
         # ---- Categories ----
-        c1 = Category(categoryName="Transportation", description="Transport help", isActive=True)
-        c2 = Category(categoryName="Medical Aid", description="Medical assistance", isActive=True)
-        c3 = Category(categoryName="Food Support", description="Food support & groceries", isActive=True)
-        db.session.add_all([c1, c2, c3])
-        db.session.commit()
-
-        categories = [c1, c2, c3]
-        all_requests = []
-        now = datetime.utcnow()
-
-        # ---- Generate 100 Requests per Category ----
-        for cat in categories:
-            for i in range(100):
-                pin = pin_users[(i + cat.categoryID) % len(pin_users)]
-                created = now - timedelta(days=(i % 30))
-                r = Request(
-                    pinID=pin.userID,
-                    categoryID=cat.categoryID,
-                    title=f"{cat.categoryName} Request {i+1}",
-                    description=f"Description for {cat.categoryName} request {i+1}",
-                    status="open",
-                    viewCount=(i % 7) + 1,
-                    shortlistCount=0,
-                    createdAt=created
-                )
-                db.session.add(r)
-                all_requests.append(r)
-
-        db.session.flush()
-
-        # ---- Shortlists + Matches ----
-        match_records = []
-        for i, r in enumerate(all_requests):
-            if i % 2 == 0:
-                csr = csr_users[i % len(csr_users)]
-                db.session.add(Shortlist(csrRepID=csr.userID, requestID=r.requestID))
-                r.shortlistCount += 1
-
-            if i % 3 == 0:
-                r.status = "closed"
-                completed = r.createdAt + timedelta(days=1)
-                r.closedAt = completed
-                csr = csr_users[(i * 7) % len(csr_users)]
-                match_records.append(
-                    MatchRecord(
-                        requestID=r.requestID,
-                        csrRepID=csr.userID,
-                        pinID=r.pinID,
-                        categoryID=r.categoryID,
-                        status="completed",
-                        matchedAt=r.createdAt + timedelta(hours=3),
-                        completedAt=completed
-                    )
-                )
-
-        db.session.add_all(match_records)
-        db.session.commit()
+        category_rows = [
+            {"categoryID": i + 1, "categoryName": name, "description": desc, "isActive": True}
+            for i, (name, desc) in enumerate(CATEGORIES[:categories])
+        ] + [
+            {"categoryID": i + 1, "categoryName": f"Category {i + 1}",
+             "description": f"Synthetic category {i + 1}", "isActive": True}
+            for i in range(len(CATEGORIES), categories)
+        ]
+        bulk_insert(Category.__table__, category_rows, progress=progress, label="categories")
+
+        # ---- Requests per Category, with Shortlists + Matches ----
+        def request_batches():
+            """Yields (requests, shortlists, matches) row lists of up to `chunk` requests each."""
+            rid, i = 0, 0
+            reqs, shorts, matches = [], [], []
+            for cat in category_rows:
+                cat_id, cat_name = cat["categoryID"], cat["categoryName"]
+                for n in range(requests_per_category):
+                    rid += 1
+                    pin = pin_ids[(n + cat_id) % len(pin_ids)]
+                    created = now - timedelta(days=(n % 30), seconds=rng.randrange(86_400))
+                    shortlisted = bool(shortlist_every) and i % shortlist_every == 0
+                    closed = bool(match_every) and i % match_every == 0
+                    reqs.append({
+                        "requestID": rid,
+                        "pinID": pin,
+                        "categoryID": cat_id,
+                        "title": f"{cat_name} Request {n+1}",
+                        "description": f"Description for {cat_name} request {n+1}",
+                        "status": "closed" if closed else "open",
+                        "viewCount": (n % 7) + 1,
+                        "shortlistCount": 1 if shortlisted else 0,
+                        "createdAt": created,
+                        "closedAt": created + timedelta(days=1) if closed else None,
+                    })
+                    if shortlisted:
+                        shorts.append({"csrRepID": csr_ids[i % len(csr_ids)], "requestID": rid, "createdAt": created})
+                    if closed:
+                        matches.append({
+                            "requestID": rid,
+                            "csrRepID": csr_ids[(i * 7) % len(csr_ids)],
+                            "pinID": pin,
+                            "categoryID": cat_id,
+                            "status": "completed",
+                            "matchedAt": created + timedelta(hours=3),
+                            "completedAt": created + timedelta(days=1),
+                        })
+                    i += 1
+                    if len(reqs) >= chunk:
+                        yield reqs, shorts, matches
+                        reqs, shorts, matches = [], [], []
+            if reqs:
+                yield reqs, shorts, matches
+
+        last_rid = 0
+        if csr_users and pin_users:
+            for reqs, shorts, matches in request_batches():
+                bulk_insert(Request.__table__, reqs, chunk, progress, "requests")
+                bulk_insert(Shortlist.__table__, shorts, chunk, progress, "shortlists")
+                bulk_insert(MatchRecord.__table__, matches, chunk, progress, "match_records")
+                last_rid = reqs[-1]["requestID"]
 
         # ---------------------------------------------------------
-        # ADD CLEAN DEMO DATA FOR CORE ACCOUNTS 
+        # ADD CLEAN DEMO DATA FOR CORE ACCOUNTS
         # ---------------------------------------------------------
-        demo_titles = [
-            "Wheelchair-accessible transport needed",
-            "Groceries delivery support",
-            "Medical appointment follow-up transport",
-            "Assistance with weekly food run",
-            "Support for clinic visit transportation"
-        ]
-
-        demo_descriptions = [
-            "Requesting assistance due to mobility issues.",
-            "Regular grocery support needed for 4 weeks.",
-            "Follow-up appointment scheduled, require lift assistance.",
-            "Need weekly help to collect groceries from NTUC.",
-            "Transportation support required for medical visit."
-        ]
-
-        demo_requests = []
+        demo = []
         for i in range(5):
             created_date = now - timedelta(days=(5 - i))
-            r = Request(
-                pinID=pin_main.userID,
-                categoryID=choice(categories).categoryID,
-                title=demo_titles[i],
-                description=demo_descriptions[i],
-                status="open",
-                viewCount=0,
-                shortlistCount=0,
-                createdAt=created_date,
-            )
-            db.session.add(r)
-            demo_requests.append(r)
-
-        db.session.flush()
-
-        for r in demo_requests:
-            db.session.add(Shortlist(csrRepID=csr_main.userID, requestID=r.requestID))
-            r.shortlistCount = 1
-
-        completed_1 = demo_requests[0]
-        completed_2 = demo_requests[1]
-
-        completed_1.status = "closed"
-        completed_2.status = "closed"
-
-        completed_1.closedAt = completed_1.createdAt + timedelta(days=1)
-        completed_2.closedAt = completed_2.createdAt + timedelta(days=2)
-
-        m1 = MatchRecord(
-            requestID=completed_1.requestID,
-            csrRepID=csr_main.userID,
-            pinID=pin_main.userID,
-            categoryID=completed_1.categoryID,
-            status="completed",
-            matchedAt=completed_1.createdAt + timedelta(hours=3),
-            completedAt=completed_1.closedAt
-        )
-
-        m2 = MatchRecord(
-            requestID=completed_2.requestID,
-            csrRepID=csr_main.userID,
-            pinID=pin_main.userID,
-            categoryID=completed_2.categoryID,
-            status="completed",
-            matchedAt=completed_2.createdAt + timedelta(hours=4),
-            completedAt=completed_2.closedAt
-        )
-
-        db.session.add_all([m1, m2])
+            closed = i < 2
+            demo.append({
+                "requestID": last_rid + i + 1,
+                "pinID": PIN_MAIN,
+                "categoryID": rng.choice(category_rows)["categoryID"],
+                "title": DEMO_TITLES[i],
+                "description": DEMO_DESCRIPTIONS[i],
+                "status": "closed" if closed else "open",
+                "viewCount": 0,
+                "shortlistCount": 1,
+                "createdAt": created_date,
+                "closedAt": created_date + timedelta(days=i + 1) if closed else None,
+            })
+        bulk_insert(Request.__table__, demo, progress=progress, label="requests")
+        bulk_insert(Shortlist.__table__, [
+            {"csrRepID": CSR_MAIN, "requestID": r["requestID"], "createdAt": r["createdAt"]} for r in demo
+        ], progress=progress, label="shortlists")
+        bulk_insert(MatchRecord.__table__, [
+            {
+                "requestID": r["requestID"],
+                "csrRepID": CSR_MAIN,
+                "pinID": PIN_MAIN,
+                "categoryID": r["categoryID"],
+                "status": "completed",
+                "matchedAt": r["createdAt"] + timedelta(hours=3 + i),
+                "completedAt": r["closedAt"],
+            }
+            for i, r in enumerate(demo[:2])
+        ], progress=progress, label="match_records")
         db.session.commit()
 
+        # rebuild the full-text index in one pass and refresh planner statistics
+        upgrade()
+        progress.summary()
+        counts = dict(progress.totals)
+
+    if not quiet:
         print("\nDatabase seeded successfully with realistic data.")
         print(" Login Accounts:")
         print(" admin@test.com / testing123!")
@@ -242,10 +329,29 @@ def reset_and_seed():
         print(" pin@test.com   / testing123!")
         print(" pm@test.com    / testing123!")
         print("\n Additional Test Users:")
-        print(" csr001@test.com .. csr100@test.com")
-        print(" pin001@test.com .. pin100@test.com")
+        print(f" csr001@test.com .. csr{csr_users:03d}@test.com")
+        print(f" pin001@test.com .. pin{pin_users:03d}@test.com")
         print("\n Core Accounts Now Have Visible Demo Requests, Shortlists & Completed Records.")
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reset the database and load demo / load-test data.")
+    parser.add_argument("--csr-users", type=int, default=100)
+    parser.add_argument("--pin-users", type=int, default=100)
+    parser.add_argument("--categories", type=int, default=3)
+    parser.add_argument("--requests-per-category", type=int, default=100)
+    parser.add_argument("--shortlist-every", type=int, default=2, help="shortlist every Nth request (0 = none)")
+    parser.add_argument("--match-every", type=int, default=3, help="close + match every Nth request (0 = none)")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed (same seed, same data)")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="rows per INSERT batch")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+    if args.categories < 1:
+        parser.error("--categories must be at least 1 (the demo requests need a category)")
+    reset_and_seed(args.csr_users, args.pin_users, args.categories, args.requests_per_category,
+                   args.shortlist_every, args.match_every, args.seed, args.chunk, quiet=args.quiet)
 
 
 if __name__ == "__main__":
-    reset_and_seed()
+    main()
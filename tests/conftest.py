@@ -34,14 +34,23 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 import pytest
 from app import create_app, db
 
+# in-memory DB + CSRF off for test POSTs; a cheap scrypt cost (the lowest werkzeug
+# accepts) keeps account seeding fast
+TEST_CONFIG = {
+    "TESTING": True,
+    "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+    "WTF_CSRF_ENABLED": False,
+    "PASSWORD_HASH_COST": 256,
+}
+
+@pytest.fixture()
+def make_app():
+    """create_app with TEST_CONFIG; keyword arguments override it (file databases, feature flags)."""
+    return lambda **config: create_app({**TEST_CONFIG, **config})
+
 @pytest.fixture()
-def app():
-    # in-memory DB + CSRF off for test POSTs
-    app = create_app({
-        "TESTING": True,
-        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
-        "WTF_CSRF_ENABLED": False,
-    })
+def app(make_app):
+    app = make_app()
     with app.app_context():
         db.create_all()
     yield app
@@ -49,3 +58,111 @@ def app():
 @pytest.fixture()
 def client(app):
     return app.test_client()
+
+
+@pytest.fixture()
+def user_factory():
+    """
+    user_factory(role, email=None, name=None, password="pw", **columns) adds an
+    account in the `role` profile (created on first use) and returns its userID.
+    email defaults to "<role>@test.com". Call inside an app context; it flushes
+    but does not commit.
+    """
+    from app.entity.user_profile import UserProfile
+    from app.entity.user_account import UserAccount
+
+    def make(role, email=None, name=None, password="pw", **columns):
+        profile = UserProfile.query.filter_by(profileName=role).first()
+        if profile is None:
+            profile = UserProfile(profileName=role)
+            db.session.add(profile)
+            db.session.flush()
+        user = UserAccount(name=name or f"{role} user", email=email or f"{role.lower()}@test.com",
+                           profileID=profile.profileID, **columns)
+        user.password = password
+        db.session.add(user)
+        db.session.flush()
+        return user.userID
+    return make
+
+
+@pytest.fixture()
+def staff(app, user_factory):
+    """One active user per role ("<role>@test.com", password "pw"); returns {profileName: userID}."""
+    with app.app_context():
+        users = {role: user_factory(role) for role in ("CSRRep", "PersonInNeed", "PlatformManager")}
+        db.session.commit()
+    return users
+
+
+class RequestsFactory:
+    """Adds categories, requests and match records (inside an app context; flushes, never commits)."""
+
+    def category(self, name="Food", active=True) -> int:
+        from app.entity.category import Category
+        category = Category(categoryName=name, isActive=active)
+        db.session.add(category)
+        db.session.flush()
+        return category.categoryID
+
+    def __call__(self, pin_id, category_id, titles=1, **columns) -> list:
+        """One request per title (n for "Request 0".."Request n-1"); returns their IDs in order."""
+        from app.entity.request import Request
+        if isinstance(titles, int):
+            titles = [f"Request {i}" for i in range(titles)]
+        requests = [Request(pinID=pin_id, categoryID=category_id, title=title, **columns) for title in titles]
+        db.session.add_all(requests)
+        db.session.flush()
+        return [r.requestID for r in requests]
+
+    def match(self, request_id, csr_id, **columns) -> int:
+        """A completed match of the request by csr_id (completedAt defaults to now)."""
+        from datetime import datetime
+        from app.entity.request import Request
+        from app.entity.match_record import MatchRecord
+        request = db.session.get(Request, request_id)
+        columns.setdefault("completedAt", datetime.utcnow())
+        record = MatchRecord(requestID=request_id, csrRepID=csr_id, pinID=request.pinID,
+                             categoryID=request.categoryID, **columns)
+        db.session.add(record)
+        db.session.flush()
+        return record.matchRecordID
+
+
+@pytest.fixture()
+def requests_factory():
+    """Returns a RequestsFactory for seeding categories, requests and matches."""
+    return RequestsFactory()
+
+
+class QueryCounter:
+    """Counts SQL statements sent to the engine while active (use as a context manager)."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        from sqlalchemy import event
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        from sqlalchemy import event
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@pytest.fixture()
+def query_counter(app):
+    """Returns a QueryCounter bound to the test app's engine."""
+    with app.app_context():
+        engine = db.engine
+    return QueryCounter(engine)
@@ -0,0 +1,63 @@
+import pytest
+from app import db
+from app.entity.category import Category
+from app.control.category_catalog import category_catalog
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+from app.control.platform_createCategory_controller import PlatformCreateCategoryController
+from app.control.platform_suspendCategory_controller import PlatformSuspendCategoryController
+from app.control.platform_updateCategory_controller import PlatformUpdateCategoryController
+
+
+@pytest.fixture()
+def categories(app, user_factory, requests_factory):
+    """A request in each of "Food Support", "Transport" and the inactive "Food Archive"; returns their IDs."""
+    with app.app_context():
+        pin = user_factory("PersonInNeed")
+        ids = []
+        for name, active in (("Food Support", True), ("Transport", True), ("Food Archive", False)):
+            ids.append(requests_factory.category(name, active))
+            requests_factory(pin, ids[-1], [name])
+        db.session.commit()
+    return ids
+
+
+def test_catalog_is_loaded_once_and_invalidated_by_platform_controllers(app, categories, query_counter):
+    food, ride, old = categories
+    with app.app_context():
+        assert [c.categoryName for c in category_catalog.active()] == ["Food Support", "Transport"]
+        with query_counter:
+            category_catalog.active()
+            assert category_catalog.name(old) == "Food Archive"
+        assert query_counter.count == 0
+
+        PlatformSuspendCategoryController().suspendCategory(ride)
+        PlatformUpdateCategoryController().updateCategory(food, "Groceries", None)
+        PlatformCreateCategoryController().create_category("Medical")
+        assert [c.categoryName for c in category_catalog.active()] == ["Groceries", "Medical"]
+
+
+def test_writes_from_other_processes_are_seen_after_the_ttl(app, categories, query_counter):
+    food = categories[0]
+    with app.app_context():
+        category_catalog.active()
+        # changed without the controllers (another worker): the version moves on flush
+        db.session.get(Category, food).isActive = False
+        db.session.commit()
+        assert food in category_catalog.snapshot().active_ids()
+
+        app.extensions["category_catalog"].ttl = 0
+        assert food not in category_catalog.snapshot().active_ids()
+        with query_counter:
+            category_catalog.snapshot()
+        assert query_counter.count == 1       # version check only
+
+
+def test_request_search_resolves_category_names_without_a_join(app, categories, query_counter):
+    with app.app_context():
+        category_catalog.active()
+        with query_counter:
+            titles = [r.title for r in CsrSearchRequestController().searchRequest("food")]
+        assert titles == ["Food Support"]     # the inactive "Food Archive" is excluded
+        assert not any("categories" in sql for sql in query_counter.statements)
+        assert [r.title for r in CsrSearchRequestController().searchRequest("")] == ["Transport", "Food Support"]
+        assert CsrSearchRequestController().searchRequest("nothing") == []
@@ -0,0 +1,76 @@
+from datetime import datetime
+import pytest
+from app import db
+from app.control import shortlist_store
+from app.control.platform_generateDailyReport_controller import PlatformGenerateDailyReportController
+
+
+@pytest.fixture()
+def open_requests(app, staff, requests_factory):
+    """Three open requests from the person in need; returns their IDs."""
+    with app.app_context():
+        ids = requests_factory(staff["PersonInNeed"], requests_factory.category(), 3, status="open")
+        db.session.commit()
+    return ids
+
+
+def test_report_page_answers_304_without_loading_the_report(app, client, staff, open_requests, query_counter):
+    with app.app_context():
+        report_id = PlatformGenerateDailyReportController().generateDailyReport(
+            staff["PlatformManager"], datetime.utcnow().strftime("%Y-%m-%d")
+        ).reportID
+
+    client.post("/login", data={"email": "platformmanager@test.com", "password": "pw"})
+    first = client.get(f"/pm/reports/{report_id}")
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, max-age=300"
+    assert first.last_modified is not None
+
+    with query_counter:
+        again = client.get(f"/pm/reports/{report_id}", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+    assert again.data == b""
+    assert again.headers["ETag"] == first.headers["ETag"]
+    # user loader + the generatedAt lookup; the payload is never read
+    assert not any("payload" in sql for sql in query_counter.statements)
+
+    since = client.get(f"/pm/reports/{report_id}",
+                       headers={"If-Modified-Since": first.headers["Last-Modified"]})
+    assert since.status_code == 304
+    assert client.get("/pm/reports/999").status_code == 404
+
+
+def test_shortlist_page_revalidates_on_the_users_shortlist_version(app, client, staff, open_requests):
+    r1, r2, r3 = open_requests
+    with app.app_context():
+        shortlist_store.add_many(staff["CSRRep"], [r1])
+
+    client.post("/login", data={"email": "csrrep@test.com", "password": "pw"})
+    first = client.get("/csr/shortlist")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert client.get("/csr/shortlist", headers={"If-None-Match": etag}).status_code == 304
+    # another page of the same list is a different representation
+    assert client.get("/csr/shortlist?page=2", headers={"If-None-Match": etag}).status_code == 200
+
+    # Core writes do not bump the "shortlists" table version; the per-CSR version moves
+    with app.app_context():
+        shortlist_store.add_many(staff["CSRRep"], [r2])
+    changed = client.get("/csr/shortlist", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+    # remove then add: SQLite reuses the freed shortlistID, the version still moves
+    etag = changed.headers["ETag"]
+    with app.app_context():
+        shortlist_store.remove_many(staff["CSRRep"], [r2])
+        shortlist_store.add_many(staff["CSRRep"], [r3])
+    swapped = client.get("/csr/shortlist", headers={"If-None-Match": etag})
+    assert swapped.status_code == 200
+    assert swapped.headers["ETag"] != etag
+
+    # a pending flash message is rendered, not hidden behind the browser's copy
+    etag = swapped.headers["ETag"]
+    client.post(f"/csr/requests/{r3}/shortlist")         # already shortlisted: flashes, changes nothing
+    assert client.get("/csr/shortlist", headers={"If-None-Match": etag}).status_code == 200
+    assert client.get("/csr/shortlist", headers={"If-None-Match": etag}).status_code == 304
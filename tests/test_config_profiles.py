@@ -0,0 +1,51 @@
+import pytest
+from app import create_app, db
+from app.config import DevConfig, PostgresProdConfig, SQLiteProdConfig, profile_config
+from app.sqlite_pragmas import current
+
+
+def test_profile_selection(monkeypatch):
+    monkeypatch.delenv("APP_PROFILE", raising=False)
+    assert profile_config() is DevConfig
+    monkeypatch.setenv("APP_PROFILE", "sqlite-prod")
+    assert profile_config() is SQLiteProdConfig
+    assert profile_config("postgres-prod") is PostgresProdConfig
+    assert PostgresProdConfig.SQLALCHEMY_ENGINE_OPTIONS["pool_pre_ping"] is True
+    with pytest.raises(ValueError, match="APP_PROFILE"):
+        profile_config("staging")
+
+
+def test_sqlite_prod_pragmas_apply_to_every_pooled_connection(monkeypatch, tmp_path):
+    monkeypatch.setenv("APP_PROFILE", "sqlite-prod")
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'prod.db'}"})
+    names = ["journal_mode", "synchronous", "busy_timeout", "mmap_size", "temp_store"]
+    with app.app_context():
+        assert db.engine.pool.size() == 10
+        with db.engine.connect() as a, db.engine.connect() as b:
+            assert current(a, names) == current(b, names) == {
+                "journal_mode": "wal", "synchronous": 1, "busy_timeout": 5000,
+                "mmap_size": 268435456, "temp_store": 2,
+            }
+        db.engine.dispose()
+
+
+def test_dev_profile_keeps_the_rollback_journal(monkeypatch, tmp_path):
+    monkeypatch.setenv("APP_PROFILE", "dev")
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'dev.db'}"})
+    with app.app_context():
+        with db.engine.connect() as conn:
+            assert current(conn, ["journal_mode", "busy_timeout"]) == {"journal_mode": "delete", "busy_timeout": 5000}
+        db.engine.dispose()
+
+
+def test_bad_pragma_is_rejected():
+    with pytest.raises(ValueError, match="pragma"):
+        create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite://",
+                    "SQLITE_PRAGMAS": {"journal_mode": "WAL; DROP TABLE requests"}})
+
+
+def test_postgres_profile_without_database_url_fails_at_startup(monkeypatch):
+    monkeypatch.setenv("APP_PROFILE", "postgres-prod")
+    monkeypatch.setattr(PostgresProdConfig, "SQLALCHEMY_DATABASE_URI", None)   # DATABASE_URL unset at import
+    with pytest.raises(RuntimeError, match="'postgres-prod' requires DATABASE_URL"):
+        create_app({"TESTING": True})
@@ -0,0 +1,52 @@
+import pytest
+from app import db
+from app.control.dashboard_metrics import dashboard_metrics
+from app.control.pin_createRequest_controller import PinCreateRequestController
+from app.control.csr_saveToShortlist_controller import CsrSaveToShortlistController
+from app.control.useradmin_suspendUserAccount_controller import UserAdminSuspendUserAccountController
+
+
+@pytest.fixture()
+def seeded(app, user_factory, requests_factory):
+    """A PIN with an open, a draft and a completed request, and a CSR in the same profile."""
+    with app.app_context():
+        pin = user_factory("PersonInNeed")
+        csr = user_factory("PersonInNeed", email="csr@test.com")
+        cat = requests_factory.category()
+        for title, status in (("a", "open"), ("b", "Draft"), ("c", "completed")):
+            requests_factory(pin, cat, [title], status=status)
+        db.session.commit()
+    return pin, csr, cat
+
+
+def test_snapshots_are_single_queries_and_cached(app, seeded, query_counter):
+    pin, csr, _ = seeded
+    with app.app_context():
+        with query_counter:
+            assert dashboard_metrics.pin(pin) == {"total": 3, "draft": 1, "open": 1, "completed": 1}
+            assert dashboard_metrics.csr(csr) == {"open_requests_count": 1, "shortlist_count": 0, "matches_count": 0}
+            assert dashboard_metrics.admin() == {"total_users": 2, "active_users": 2,
+                                                 "suspended_users": 0, "total_profiles": 1}
+            assert dashboard_metrics.pm()["total_requests"] == 3
+        assert query_counter.count == 4
+
+        with query_counter:
+            dashboard_metrics.pin(pin)
+            dashboard_metrics.pm()
+        assert query_counter.count == 0
+
+
+def test_controllers_invalidate_snapshots(app, seeded):
+    pin, csr, cat = seeded
+    with app.app_context():
+        dashboard_metrics.pin(pin), dashboard_metrics.csr(csr), dashboard_metrics.admin()
+
+        PinCreateRequestController().createRequest(userID=pin, categoryID=cat, title="d", description="x")
+        assert dashboard_metrics.pin(pin)["open"] == 2
+        assert dashboard_metrics.csr(csr)["open_requests_count"] == 2
+
+        CsrSaveToShortlistController().saveToShortlist(1, csr)
+        assert dashboard_metrics.csr(csr)["shortlist_count"] == 1
+
+        UserAdminSuspendUserAccountController().suspendUserAccount(csr)
+        assert dashboard_metrics.admin()["suspended_users"] == 1
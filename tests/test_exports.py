@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+import pytest
+from app import db
+from app.entity.match_record import MatchRecord
+from app.control.export_stream import encode_rows
+from app.control.csr_searchHistory_controller import CsrSearchHistoryController
+from app.control.pin_searchMatchRecord_controller import PinSearchMatchRecordController
+from app.control.platform_generateDailyReport_controller import PlatformGenerateDailyReportController
+from app.control.platform_exportReport_controller import PlatformExportReportController
+
+
+@pytest.fixture()
+def groceries(app, staff, requests_factory):
+    """A closed Food request plus a Transport category; returns (requestID, food, ride)."""
+    with app.app_context():
+        food, ride = requests_factory.category("Food"), requests_factory.category("Transport")
+        [request_id] = requests_factory(staff["PersonInNeed"], food, ["Groceries"], status="closed")
+        db.session.commit()
+    return request_id, food, ride
+
+
+def _add_matches(staff, groceries, n):
+    """n hourly matches of the request from 2025-01-01 (Food at odd hours) in one Core insert."""
+    request_id, food, ride = groceries
+    start = datetime(2025, 1, 1)
+    db.session.execute(MatchRecord.__table__.insert(), [
+        {"requestID": request_id, "csrRepID": staff["CSRRep"], "pinID": staff["PersonInNeed"],
+         "categoryID": food if i % 2 else ride, "status": "completed",
+         "matchedAt": start + timedelta(hours=i), "completedAt": start + timedelta(hours=i + 1)}
+        for i in range(n)
+    ])
+    db.session.commit()
+
+
+def test_history_export_streams_batches_with_one_query(app, staff, groceries, query_counter):
+    with app.app_context():
+        _add_matches(staff, groceries, 2500)
+        with query_counter:
+            header, rows = CsrSearchHistoryController().exportHistory(staff["CSRRep"], batch=1000)
+            chunks = list(encode_rows("csv", header, rows, batch=1000))
+        assert query_counter.count == 1
+
+    assert len(chunks) == 3
+    table = list(csv.reader(io.StringIO("".join(chunks))))
+    assert table[0] == ["matchRecordID", "requestID", "title", "category", "personInNeed",
+                        "matchedAt", "completedAt"]
+    assert len(table) == 2501
+    # newest completion first, names resolved through the joins
+    assert table[1][2:] == ["Groceries", "Food", "PersonInNeed user",
+                            "2025-04-15T03:00:00", "2025-04-15T04:00:00"]
+
+
+def test_match_record_export_applies_filters(app, staff, groceries):
+    with app.app_context():
+        _add_matches(staff, groceries, 48)
+        header, rows = PinSearchMatchRecordController().exportMatchRecords(
+            staff["PersonInNeed"], "food", "2025-01-01", "2025-01-01"
+        )
+        lines = "".join(encode_rows("ndjson", header, rows)).splitlines()
+
+    records = [json.loads(line) for line in lines]
+    assert len(records) == 11      # odd hours of Jan 1 are Food
+    assert {r["category"] for r in records} == {"Food"}
+    assert records[0]["csrRepresentative"] == "CSRRep user"
+
+
+def test_report_export_is_long_format(app, staff, groceries):
+    with app.app_context():
+        report = PlatformGenerateDailyReportController().generateDailyReport(
+            staff["PlatformManager"], datetime.utcnow().strftime("%Y-%m-%d")
+        )
+        report_id = report.reportID
+        db.session.expunge_all()
+        header, rows = PlatformExportReportController().exportReport(report_id)
+        rows = list(rows)
+
+    assert header == ("section", "name", "metric", "value")
+    assert ("summary", "", "total_requests", 1) in rows
+    assert ("category_breakdown", "Food", "closed_requests", 1) in rows
+
+
+def test_export_routes(app, client, staff, groceries):
+    with app.app_context():
+        _add_matches(staff, groceries, 3)
+
+    client.post("/login", data={"email": "csrrep@test.com", "password": "pw"})
+    resp = client.get("/csr/matches/export.csv?category=1")
+    assert resp.status_code == 200
+    assert resp.is_streamed
+    assert resp.headers["Content-Disposition"] == 'attachment; filename="match-history.csv"'
+    assert resp.get_data(as_text=True).count("\n") == 2        # header + the one Food row
+
+    resp = client.get("/csr/matches/export.csv?start_date=bad")
+    assert resp.status_code == 302
+
+    assert client.get("/csr/matches/export.xml").status_code == 404
+    assert client.get("/pm/reports/999/export.csv").status_code == 404
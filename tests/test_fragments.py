@@ -0,0 +1,70 @@
+import pytest
+from app import db
+from app.entity.shortlist import Shortlist
+
+HX = {"HX-Request": "true"}
+
+
+@pytest.fixture()
+def twelve_categories(app, staff, requests_factory):
+    """Twelve categories, each with a request the CSR has shortlisted and matched."""
+    csr, pin = staff["CSRRep"], staff["PersonInNeed"]
+    with app.app_context():
+        for c in range(12):
+            [request_id] = requests_factory(pin, requests_factory.category(f"Category {c}"), [f"Request {c}"],
+                                            status="open")
+            db.session.add(Shortlist(csrRepID=csr, requestID=request_id))
+            requests_factory.match(request_id, csr)
+        db.session.commit()
+
+
+PAGES = [
+    ("csrrep@test.com", "/csr/requests?page=2"),
+    ("csrrep@test.com", "/csr/shortlist?page=2"),
+    ("csrrep@test.com", "/csr/matches?page=2"),
+    ("personinneed@test.com", "/pin/requests?page=2"),
+    ("platformmanager@test.com", "/pm/categories?page=2"),
+]
+
+
+@pytest.mark.parametrize("email,url", PAGES)
+def test_htmx_requests_get_only_the_results_fragment(app, client, twelve_categories, query_counter, email, url):
+    client.post("/login", data={"email": email, "password": "pw"})
+
+    with query_counter:
+        full = client.get(url)
+    full_queries = query_counter.count
+    with query_counter:
+        fragment = client.get(url, headers=HX)
+
+    body = fragment.get_data(as_text=True)
+    assert fragment.status_code == 200
+    assert body.startswith('<div id="results">')
+    assert "<nav" not in body and "<select" not in body
+    assert 'hx-get="' in body and "page=1" in body           # pagination links swap #results
+    assert len(body) < len(full.get_data(as_text=True))
+    assert query_counter.count <= full_queries
+    assert "HX-Request" in fragment.headers["Vary"]
+
+    # back button on an htmx history cache miss asks for the whole page
+    restore = client.get(url, headers={**HX, "HX-History-Restore-Request": "true"})
+    assert "<nav" in restore.get_data(as_text=True)
+
+
+def test_fragment_and_full_page_have_different_etags(app, client, twelve_categories):
+    client.post("/login", data={"email": "csrrep@test.com", "password": "pw"})
+    full = client.get("/csr/shortlist")
+    fragment = client.get("/csr/shortlist", headers={**HX, "If-None-Match": full.headers["ETag"]})
+    assert fragment.status_code == 200
+    assert fragment.headers["ETag"] != full.headers["ETag"]
+    cached = client.get("/csr/shortlist", headers={**HX, "If-None-Match": fragment.headers["ETag"]})
+    assert cached.status_code == 304
+    assert {"HX-Request", "HX-History-Restore-Request"} <= set(cached.vary)
+
+    # a history restore also sends HX-Request but wants the page, not the cached fragment
+    restore = client.get("/csr/shortlist", headers={**HX, "HX-History-Restore-Request": "true",
+                                                    "If-None-Match": fragment.headers["ETag"]})
+    assert restore.status_code == 200
+    assert "<nav" in restore.get_data(as_text=True)
+    assert restore.headers["ETag"] == full.headers["ETag"]
+    assert "HX-History-Restore-Request" in restore.vary
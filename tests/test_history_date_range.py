@@ -0,0 +1,37 @@
+from datetime import datetime
+import pytest
+from app import db
+from app.control.csr_searchHistory_controller import CsrSearchHistoryController
+from app.control.pin_searchMatchRecord_controller import PinSearchMatchRecordController
+
+
+@pytest.fixture()
+def midnight_matches(app, staff, requests_factory):
+    """Closed Food requests matched by the CSR either side of midnight on 2025-10-05."""
+    with app.app_context():
+        cat = requests_factory.category()
+        for stamp in ("2025-10-04 23:59:59", "2025-10-05 00:00:00", "2025-10-05 23:30:00", "2025-10-06 00:00:00"):
+            [request_id] = requests_factory(staff["PersonInNeed"], cat, [stamp], status="closed")
+            requests_factory.match(request_id, staff["CSRRep"],
+                                   completedAt=datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S"))
+        db.session.commit()
+    return staff["CSRRep"], staff["PersonInNeed"]
+
+
+def test_inclusive_day_range_keeps_whole_end_day(app, midnight_matches):
+    csr, pin = midnight_matches
+    with app.app_context():
+        rows = CsrSearchHistoryController().searchHistory(csr, None, "2025-10-05", "2025-10-05")
+        assert [m.request.title for m in rows] == ["2025-10-05 23:30:00", "2025-10-05 00:00:00"]
+
+        rows = PinSearchMatchRecordController().searchMatchRecord(pin, "health", "2025-10-05", "")
+        assert rows == []
+        rows = PinSearchMatchRecordController().searchMatchRecord(pin, "fo", "", "2025-10-04")
+        assert [m.request.title for m in rows] == ["2025-10-04 23:59:59"]
+
+
+def test_invalid_date_is_rejected(app, midnight_matches):
+    csr, _ = midnight_matches
+    with app.app_context():
+        with pytest.raises(ValueError):
+            CsrSearchHistoryController().searchHistory(csr, None, "05/10/2025", None)
@@ -0,0 +1,51 @@
+"""
+Each list route must render in a fixed number of queries, however many rows
+(and distinct related categories / users) the page shows.
+"""
+from datetime import datetime, timedelta
+import pytest
+from app import db
+from app.entity.shortlist import Shortlist
+
+
+def _add_rows(staff, user_factory, requests_factory, rows):
+    """Per row: a category, another PIN and CSR, and shortlisted, twice-matched requests."""
+    csr, pin = staff["CSRRep"], staff["PersonInNeed"]
+    now = datetime.utcnow()
+    for i in range(rows):
+        # distinct category / PIN / CSR per row so lazy loads could not be deduplicated
+        cat = requests_factory.category(f"Category {i}")
+        other_pin = user_factory("PersonInNeed", f"pin{i}@test.com", f"Pin {i}")
+        other_csr = user_factory("CSRRep", f"csr{i}@test.com", f"Csr {i}")
+        for owner in (pin, other_pin):
+            [request_id] = requests_factory(owner, cat, [f"R{i}"], status="open")
+            db.session.add(Shortlist(csrRepID=csr, requestID=request_id))
+            for rep in (csr, other_csr):
+                requests_factory.match(request_id, rep, completedAt=now - timedelta(days=i))
+    db.session.commit()
+
+
+ROUTES = {
+    "csrrep@test.com": ["/csr/requests", "/csr/requests?sort=recommended", "/csr/shortlist", "/csr/matches"],
+    "personinneed@test.com": ["/pin/requests", "/pin/match-records"],
+    "platformmanager@test.com": ["/pm/categories"],
+}
+
+
+@pytest.mark.parametrize("rows", [1, 8])
+def test_list_routes_use_fixed_query_count(app, client, staff, user_factory, requests_factory, query_counter, rows):
+    with app.app_context():
+        _add_rows(staff, user_factory, requests_factory, rows)
+    counts = {}
+    for email, urls in ROUTES.items():
+        client.post("/login", data={"email": email, "password": "pw"})
+        for url in urls:
+            with query_counter:
+                resp = client.get(url)
+            assert resp.status_code == 200
+            counts[url] = query_counter.count
+        client.get("/logout")
+
+    # user loader + profile, category catalog (first load), COUNT, page SELECT (+ grouped counts)
+    for url, n in counts.items():
+        assert n <= 5, f"{url} issued {n} queries with {rows} row(s)"
@@ -0,0 +1,38 @@
+from sqlalchemy import inspect, text
+from app import db
+from app.migrations import upgrade
+
+
+def test_upgrade_adds_indexes_and_dedupes_shortlists(app):
+    with app.app_context():
+        with db.engine.begin() as conn:
+            # simulate a database created before the index set existed
+            conn.execute(text('DROP INDEX "uq_shortlists_csrRepID_requestID"'))
+            conn.execute(text('DROP INDEX "ix_match_records_csrRepID_status_completedAt"'))
+            conn.execute(text('INSERT INTO shortlists ("requestID", "csrRepID") VALUES (1, 7), (1, 7), (2, 7)'))
+
+        assert upgrade() is True
+
+        indexes = {ix["name"] for ix in inspect(db.engine).get_indexes("shortlists")}
+        assert "uq_shortlists_csrRepID_requestID" in indexes
+        indexes = {ix["name"] for ix in inspect(db.engine).get_indexes("match_records")}
+        assert "ix_match_records_csrRepID_status_completedAt" in indexes
+
+        rows = db.session.execute(text('SELECT "requestID" FROM shortlists ORDER BY 1')).scalars().all()
+        assert rows == [1, 2]
+
+        # second run is a no-op
+        assert upgrade() is False
+
+
+def test_upgrade_adds_missing_nullable_columns(app):
+    with app.app_context():
+        with db.engine.begin() as conn:
+            # simulate a reports table from before the report cache
+            conn.execute(text('DROP INDEX "ix_reports_reportType_period"'))
+            conn.execute(text('ALTER TABLE reports DROP COLUMN "dataVersion"'))
+
+        assert upgrade() is True
+        columns = {col["name"] for col in inspect(db.engine).get_columns("reports")}
+        assert "dataVersion" in columns
+        assert upgrade() is False
@@ -0,0 +1,38 @@
+import pytest
+from app import db
+from app.entity.request import Request
+from app.control.pagination import paginate
+from app.control.pin_searchRequest_controller import PinSearchRequestController
+
+
+@pytest.fixture()
+def open_requests(app, user_factory, requests_factory):
+    """open_requests(n) adds n open requests ("Request 0".."Request n-1") for a PIN; returns the PIN's ID."""
+    def make(n):
+        with app.app_context():
+            pin = user_factory("PersonInNeed")
+            requests_factory(pin, requests_factory.category(), n, status="open")
+            db.session.commit()
+        return pin
+    return make
+
+
+def test_paginate_limits_rows_and_counts_total(app, open_requests):
+    pin = open_requests(23)
+    with app.app_context():
+        page = PinSearchRequestController().searchRequestsPage(pin, page=3, per_page=9)
+
+        assert page.total == 23
+        assert page.pages == 3
+        assert len(page.items) == 5
+        assert page.has_prev and not page.has_next
+        assert [r.title for r in page.items][0] == "Request 4"
+
+
+def test_paginate_clamps_page_below_one(app, open_requests):
+    open_requests(3)
+    with app.app_context():
+        page = paginate(Request.query.order_by(Request.requestID), page=0, per_page=2)
+        assert page.page == 1
+        assert len(page.items) == 2
+
@@ -0,0 +1,49 @@
+import pytest
+from app import db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.control.auth_controller import AuthController
+from app.control.report_cache import data_version
+from app.passwords import hash_method, hash_password, needs_rehash
+
+
+def test_policy_method_strings():
+    assert hash_method("scrypt", 16384) == "scrypt:16384:8:1"
+    assert hash_method("pbkdf2", 100000) == "pbkdf2:sha256:100000"
+    assert hash_method("pbkdf2", None) == "pbkdf2:sha256:600000"
+    with pytest.raises(ValueError):
+        hash_method("md5", 1)
+
+    stored = hash_password("pw", "pbkdf2:sha256:1000")
+    assert not needs_rehash(stored, "pbkdf2:sha256:1000")
+    assert needs_rehash(stored, "pbkdf2:sha256:2000")
+    assert needs_rehash(stored, "scrypt:1024:8:1")
+
+
+def test_login_upgrades_outdated_hashes(app):
+    app.config.update(PASSWORD_HASH_ALGORITHM="pbkdf2", PASSWORD_HASH_COST=1000)
+    with app.app_context():
+        profile = UserProfile(profileName="CSRRep")
+        db.session.add(profile)
+        db.session.flush()
+        user = UserAccount(name="Old", email="old@test.com", profileID=profile.profileID)
+        user.password = "pw"
+        db.session.add(user)
+        db.session.commit()
+        assert user._password.startswith("pbkdf2:sha256:1000$")
+
+    app.config.update(PASSWORD_HASH_ALGORITHM="scrypt", PASSWORD_HASH_COST=1024)
+    with app.test_request_context():
+        version = data_version()
+        # a failed login leaves the hash alone
+        assert AuthController().login("old@test.com", "wrong") == (None, "Invalid credentials.")
+        assert db.session.scalar(db.select(UserAccount._password)).startswith("pbkdf2:")
+
+        assert AuthController().login("old@test.com", "pw") == ("/csr/dashboard", None)
+        stored = db.session.scalar(db.select(UserAccount._password))
+        assert stored.startswith("scrypt:1024:8:1$")
+        assert data_version() == version
+
+        # already current: nothing is written
+        assert AuthController().login("old@test.com", "pw")[1] is None
+        assert db.session.scalar(db.select(UserAccount._password)) == stored
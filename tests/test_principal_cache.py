@@ -0,0 +1,46 @@
+import pytest
+from app import db
+from app.entity.user_account import UserAccount
+from app.entity.principal import principal_cache
+from app.control.useradmin_suspendUserAccount_controller import UserAdminSuspendUserAccountController
+from app.control.useradmin_updateUserProfile_controller import UserAdminUpdateUserProfileController
+
+
+@pytest.fixture()
+def pin(app, user_factory):
+    """A person in need named "Pin"; returns (userID, profileID)."""
+    with app.app_context():
+        user_id = user_factory("PersonInNeed", name="Pin", phoneNumber="123")
+        db.session.commit()
+        return user_id, db.session.get(UserAccount, user_id).profileID
+
+
+def test_login_primes_cache_and_loader_skips_db(app, client, pin, query_counter):
+    user_id, _ = pin
+    with app.app_context():
+        principal_cache.clear()
+
+    resp = client.post("/login", data={"email": "personinneed@test.com", "password": "pw"})
+    assert resp.headers["Location"].endswith("/pin/dashboard")
+
+    with app.test_request_context(), query_counter:
+        principal = principal_cache.load(user_id)
+    assert query_counter.count == 0
+    assert principal.name == "Pin"
+    assert principal.profile.profileName == "PersonInNeed"
+    assert principal.is_authenticated and principal.get_id() == str(user_id)
+
+
+def test_account_and_profile_changes_invalidate(app, pin, query_counter):
+    user_id, profile_id = pin
+    with app.app_context():
+        assert principal_cache.load(user_id).isActive is True
+
+        UserAdminSuspendUserAccountController().suspendUserAccount(user_id)
+        assert principal_cache.load(user_id).isActive is False
+
+        UserAdminUpdateUserProfileController().updateUserProfile(profile_id, profileName="PIN")
+        with query_counter:
+            assert principal_cache.load(user_id).profile.profileName == "PIN"
+            assert principal_cache.load(user_id).profile.profileName == "PIN"
+        assert query_counter.count == 1
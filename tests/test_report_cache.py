@@ -0,0 +1,97 @@
+from datetime import datetime
+import pytest
+from app import db
+from app.entity.request import Request
+from app.entity.report import Report
+from app.control.report_cache import report_cache, data_version
+
+
+@pytest.fixture()
+def seeded(app, user_factory, requests_factory):
+    """A platform manager and an empty Food category; returns (userID, categoryID)."""
+    with app.app_context():
+        manager, food = user_factory("PlatformManager"), requests_factory.category()
+        db.session.commit()
+    return manager, food
+
+
+def test_closed_period_report_is_refreshed_after_source_writes(app, seeded, user_factory, query_counter):
+    manager, _ = seeded
+    with app.app_context():
+        first = report_cache.generate("monthly", "2025-01", manager)
+        assert first.dataVersion == data_version()
+        assert first.content.to_dict()["summary"]["total_users"] == 1
+
+        # nothing written since: reused (latest report + data version)
+        with query_counter:
+            assert report_cache.lookup("monthly", "2025-1").reportID == first.reportID
+        assert query_counter.count == 2
+
+        # the period is closed, but the platform-wide summary has moved on
+        user_factory("PlatformManager", "late@test.com")
+        db.session.commit()
+        assert report_cache.lookup("monthly", "2025-01") is None
+        second = report_cache.generate("monthly", "2025-01", manager)
+        assert second.reportID != first.reportID
+        assert second.content.to_dict()["summary"]["total_users"] == 2
+        assert Report.query.count() == 2
+
+
+def test_open_period_is_recomputed_only_after_source_writes(app, seeded):
+    manager, food = seeded
+    with app.app_context():
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        first = report_cache.generate("daily", today, manager)
+        assert report_cache.lookup("daily", today).reportID == first.reportID
+
+        # writes to non-source tables (reports, jobs) leave the version alone
+        version = data_version()
+        first.reportTitle = "Renamed"
+        db.session.commit()
+        assert data_version() == version
+
+        db.session.add(Request(pinID=manager, categoryID=food, title="new"))
+        db.session.commit()
+        assert data_version() > version
+        assert report_cache.lookup("daily", today) is None
+
+        second = report_cache.generate("daily", today, manager)
+        assert second.reportID != first.reportID
+        assert report_cache.lookup("daily", today).reportID == second.reportID
+        assert report_cache.stats() == {"hits": 2, "misses": 1, "generated": 2, "hit_rate": 0.667}
+
+
+def test_generate_route_reuses_cached_report(app, client, seeded):
+    manager, _ = seeded
+    with app.app_context():
+        report_id = report_cache.generate("weekly", "2025-01-06", manager).reportID
+    client.post("/login", data={"email": "platformmanager@test.com", "password": "pw"})
+
+    resp = client.post("/pm/reports/generate", data={"report_type": "weekly", "period": "2025-01-06"})
+    assert resp.status_code == 302
+    assert resp.headers["Location"].endswith(f"/pm/reports/{report_id}")
+    assert client.get("/pm/reports/cache").get_json()["hits"] == 1
+    with app.app_context():
+        assert Report.query.count() == 1
+
+    # a cache hit keeps the stored title and says so
+    resp = client.post("/pm/reports/generate", data={"report_type": "weekly", "period": "2025-01-06",
+                                                      "report_title": "Board pack"}, follow_redirects=True)
+    assert "so &#39;Board pack&#39; was not applied" in resp.get_data(as_text=True)
+
+
+def test_versions_are_bumped_once_at_commit(app, seeded, query_counter):
+    manager, food = seeded
+    with app.app_context():
+        version = data_version()
+
+        db.session.add(Request(pinID=manager, categoryID=food, title="rolled back"))
+        db.session.flush()
+        db.session.rollback()
+        db.session.add(Request(pinID=manager, categoryID=food, title="first"))
+        db.session.flush()
+        db.session.add(Request(pinID=manager, categoryID=food, title="second"))
+        with query_counter:
+            db.session.commit()
+        assert data_version() == version + 1
+        assert sum("table_versions" in sql for sql in query_counter.statements) == 1
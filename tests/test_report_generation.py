@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+import pytest
+from app import db
+from app.control.platform_generateDailyReport_controller import PlatformGenerateDailyReportController
+from app.control.platform_generateWeeklyReport_controller import PlatformGenerateWeeklyReportController
+
+
+@pytest.fixture()
+def seeded(app, staff, requests_factory):
+    """Four requests over two categories (plus an unused one), two of them matched; returns (manager, now)."""
+    pin, csr = staff["PersonInNeed"], staff["CSRRep"]
+    now = datetime.utcnow()
+    with app.app_context():
+        food, ride = requests_factory.category("Food"), requests_factory.category("Transport")
+        requests_factory.category("Unused")
+        requests_factory(pin, food, ["a"], status="open")
+        [b] = requests_factory(pin, food, ["b"], status="closed")
+        [c] = requests_factory(pin, ride, ["c"], status="closed")
+        requests_factory(pin, ride, ["d"], status="draft")
+        requests_factory.match(b, csr, completedAt=now - timedelta(days=2))
+        requests_factory.match(c, csr, completedAt=now - timedelta(days=60))
+        db.session.commit()
+    return staff["PlatformManager"], now
+
+
+def test_daily_report_summary_and_breakdown(app, seeded):
+    manager, now = seeded
+    with app.app_context():
+        report = PlatformGenerateDailyReportController().generateDailyReport(
+            manager, now.strftime("%Y-%m-%d")
+        )
+        data = report.content.to_dict()
+
+    assert data["summary"] == {
+        "total_users": 3,
+        "total_requests": 4,
+        "open_requests": 1,
+        "closed_requests": 2,
+        "total_matches": 2,
+        "recent_matches_30_days": 1,
+    }
+    assert data["category_breakdown"] == {
+        "Food": {"total_requests": 2, "open_requests": 1, "closed_requests": 1},
+        "Transport": {"total_requests": 2, "open_requests": 0, "closed_requests": 1},
+        "Unused": {"total_requests": 0, "open_requests": 0, "closed_requests": 0},
+    }
+
+
+def test_weekly_report_counts_matches_inside_week(app, seeded):
+    manager, now = seeded
+    with app.app_context():
+        start = (now - timedelta(days=3)).strftime("%Y-%m-%d")
+        report = PlatformGenerateWeeklyReportController().generateWeeklyReport(manager, start)
+        data = report.content.to_dict()
+
+    assert data["summary"]["matches_completed_this_week"] == 1
+    assert data["summary"]["total_requests"] == 4
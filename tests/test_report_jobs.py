@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+import pytest
+from app import db
+from app.entity.report import Report
+from app.entity.report_job import ReportJob
+from app.control.report_jobs import _ReportJobState, report_jobs
+
+
+def _add_manager(user_factory, requests_factory):
+    """A platform manager and a Food category in the current app; returns the manager's ID."""
+    manager = user_factory("PlatformManager")
+    requests_factory.category()
+    db.session.commit()
+    return manager
+
+
+@pytest.fixture()
+def manager(app, user_factory, requests_factory):
+    with app.app_context():
+        return _add_manager(user_factory, requests_factory)
+
+
+@pytest.fixture()
+def file_app(make_app, tmp_path):
+    # worker threads need their own connections, which an in-memory database cannot give them
+    return make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'jobs.db'}")
+
+
+def test_enqueue_runs_in_background_and_writes_report(file_app, user_factory, requests_factory):
+    app = file_app
+    with app.app_context():
+        assert not app.extensions["report_jobs"].eager
+        manager = _add_manager(user_factory, requests_factory)
+        job, created = report_jobs.enqueue("monthly", "2025-3", manager, "March")
+        assert created and job.period == "2025-03"
+
+        job = report_jobs.wait(job.jobID, timeout=10)
+        assert (job.status, job.progress, job.error) == ("done", 100, None)
+        report = db.session.get(Report, job.reportID)
+        assert (report.reportTitle, report.reportType, report.period) == ("March", "monthly", "2025-03")
+        assert "Food" in report.content["category_breakdown"]
+
+        # a finished job no longer blocks a fresh run of the same report
+        again, created = report_jobs.enqueue("monthly", "2025-03", manager)
+        assert created and again.jobID != job.jobID
+        report_jobs.wait(again.jobID, timeout=10)
+
+
+def test_identical_jobs_in_flight_are_deduplicated(app, manager):
+    with app.app_context():
+        # a queued row as left by another worker process
+        db.session.add(ReportJob(reportType="daily", period="2025-10-27", requestedBy=manager))
+        db.session.commit()
+
+        job, created = report_jobs.enqueue("daily", "2025-10-27", manager)
+        assert not created and job.status == "queued"
+        assert ReportJob.query.count() == 1
+
+        # the partial unique index backs this up for racing inserts
+        db.session.add(ReportJob(reportType="daily", period="2025-10-27", requestedBy=manager, status="running"))
+        with pytest.raises(Exception):
+            db.session.commit()
+        db.session.rollback()
+
+
+def test_stale_active_jobs_are_expired(make_app, user_factory, requests_factory):
+    app = make_app(REPORT_JOB_TIMEOUT=0.001, REPORT_JOBS_EAGER=True)
+    with app.app_context():
+        manager = _add_manager(user_factory, requests_factory)
+        db.session.add(ReportJob(reportType="daily", period="2025-10-27", requestedBy=manager,
+                                 status="running", createdAt=db.func.datetime("now", "-1 hour"),
+                                 startedAt=db.func.datetime("now", "-1 hour")))
+        db.session.commit()
+
+        job, created = report_jobs.enqueue("daily", "2025-10-27", manager)
+        assert created and job.status == "done"     # eager mode ran it inline
+        assert [j.status for j in ReportJob.query.order_by(ReportJob.jobID)] == ["failed", "done"]
+
+
+def test_running_jobs_are_timed_from_when_they_started(app, manager):
+    app.extensions["report_jobs"].timeout = 60
+    with app.app_context():
+        hour_ago = datetime.utcnow() - timedelta(hours=1)
+        db.session.add_all([
+            # waited an hour in the queue, picked up just now: still working
+            ReportJob(reportType="daily", period="2025-10-01", requestedBy=manager, status="running",
+                      createdAt=hour_ago, startedAt=datetime.utcnow()),
+            ReportJob(reportType="daily", period="2025-10-02", requestedBy=manager, status="running",
+                      createdAt=hour_ago, startedAt=hour_ago),
+            ReportJob(reportType="daily", period="2025-10-03", requestedBy=manager, status="queued",
+                      createdAt=hour_ago),
+        ])
+        db.session.commit()
+        assert report_jobs.expire_stale() == 2
+        assert [j.status for j in ReportJob.query.order_by(ReportJob.jobID)] == ["running", "failed", "failed"]
+
+
+def test_progress_follows_the_generation_stages(app, manager, monkeypatch):
+    seen = []
+    advance = _ReportJobState.advance
+
+    def spy(job_id, stage):
+        advance(job_id, stage)
+        seen.append((stage, db.session.get(ReportJob, job_id).progress))
+    monkeypatch.setattr(_ReportJobState, "advance", staticmethod(spy))
+    with app.app_context():
+        job, _ = report_jobs.enqueue("weekly", "2025-10-20", manager)
+        assert (job.status, job.progress) == ("done", 100)
+    assert seen == [("query", 10), ("aggregate", 30), ("render", 80)]
+
+
+@pytest.mark.parametrize("kind, period", [("daily", "27-10-2025"), ("monthly", "2025-13"), ("yearly", "2025")])
+def test_bad_input_is_rejected_before_queueing(app, manager, kind, period):
+    with app.app_context():
+        with pytest.raises(ValueError):
+            report_jobs.enqueue(kind, period, manager)
+        assert ReportJob.query.count() == 0
+
+
+def test_generate_route_returns_job_and_status_endpoint(app, client, manager):
+    client.post("/login", data={"email": "platformmanager@test.com", "password": "pw"})
+
+    resp = client.post("/pm/reports/generate", data={"report_type": "daily", "period": "2025-10-27"},
+                       headers={"Accept": "application/json"})
+    assert resp.status_code == 202
+    job_id = resp.get_json()["jobID"]
+    assert resp.headers["Location"].endswith(f"/pm/reports/jobs/{job_id}")
+
+    with app.app_context():
+        report_jobs.wait(job_id, timeout=10)
+    status = client.get(f"/pm/reports/jobs/{job_id}").get_json()
+    assert status["status"] == "done" and status["reportUrl"] == f"/pm/reports/{status['reportID']}"
+
+    resp = client.post("/pm/reports/generate", data={"report_type": "daily", "period": "nope"})
+    assert resp.status_code == 200 and b"Invalid date format" in resp.data
+    assert client.get("/pm/reports/jobs/999").status_code == 404
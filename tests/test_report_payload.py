@@ -0,0 +1,53 @@
+import json
+import pytest
+from sqlalchemy import text
+from app import db
+from app.entity.report import Report
+from app.report_payload import ReportPayload, encode
+from app.migrations import upgrade
+
+DATA = {
+    "summary": {"total_users": 3, "total_requests": 4},
+    "category_breakdown": {f"Category {i}": {"total_requests": i} for i in range(500)},
+}
+
+
+@pytest.mark.parametrize("codec", ["none", "zlib"])
+def test_payload_round_trip_decodes_sections_lazily(codec):
+    blob = encode(DATA, codec)
+    payload = ReportPayload(blob)
+    assert list(payload) == ["summary", "category_breakdown"] and payload.codec == codec
+    assert payload["summary"] == DATA["summary"]
+    assert list(payload._decoded) == ["summary"]        # breakdown still compressed
+    assert payload.to_dict() == DATA
+    assert payload.get("period") is None
+    if codec == "zlib":
+        assert len(blob) < len(json.dumps(DATA)) / 4
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        encode(DATA, "lz4")
+    with pytest.raises(ValueError):
+        ReportPayload(b"not a payload")
+
+
+def test_listing_defers_payload_and_legacy_rows_are_compacted(app, staff, query_counter):
+    manager = staff["PlatformManager"]
+    with app.app_context():
+        # a report written before the payload column existed
+        db.session.execute(text(
+            'INSERT INTO reports ("reportTitle", "reportType", "generatedBy", "reportData", period, "generatedAt") '
+            "VALUES ('Old', 'daily', :uid, :data, '2025-01-01', CURRENT_TIMESTAMP)"
+        ), {"uid": manager, "data": json.dumps(DATA)})
+        db.session.commit()
+        assert db.session.get(Report, 1).content == DATA
+
+        upgrade()
+        db.session.expunge_all()
+        with query_counter:
+            listed = Report.query.all()
+        assert '"payload"' not in query_counter.statements[0] and '"reportData"' not in query_counter.statements[0]
+        report = listed[0]
+        assert report.reportData is None and isinstance(report.content, ReportPayload)
+        assert report.content.to_dict() == DATA
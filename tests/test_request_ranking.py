@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+import pytest
+from app import db
+from app.entity.request import Request
+from app.control import shortlist_store
+from app.control.request_ranking import request_ranking
+from app.control.view_counter import view_counter
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+
+
+@pytest.fixture()
+def seeded(app, staff, requests_factory):
+    """Open Food and Transport requests of different ages, and a Food request the CSR matched."""
+    csr, pin = staff["CSRRep"], staff["PersonInNeed"]
+    with app.app_context():
+        food, ride = requests_factory.category("Food"), requests_factory.category("Transport")
+        now = datetime.utcnow()
+        ids = {}
+        for title, cat, days in (("old food", food, 20), ("new ride", ride, 0), ("ride", ride, 3),
+                                 ("food", food, 3), ("done food", food, 40)):
+            [ids[title]] = requests_factory(pin, cat, [title], status="open", createdAt=now - timedelta(days=days))
+        db.session.get(Request, ids["done food"]).status = "closed"
+        requests_factory.match(ids["done food"], csr, completedAt=now)
+        db.session.commit()
+    return csr, ids
+
+
+def _titles(csr_id, category=None, **kw):
+    page = CsrSearchRequestController().recommendRequestPage(csr_id, category, **kw)
+    return page.total, [r.title for r in page.items]
+
+
+def test_category_affinity_then_recency_orders_open_requests(app, seeded):
+    csr, _ = seeded
+    with app.app_context():
+        # matched in Food before: Food first, newest first within the category
+        assert _titles(csr) == (4, ["food", "old food", "new ride", "ride"])
+        assert _titles(csr, page=2, per_page=3) == (4, ["ride"])
+        assert _titles(csr, "Transport") == (2, ["new ride", "ride"])
+        assert _titles(csr, keyword="ride") == (2, ["new ride", "ride"])
+        # no history: recency and popularity only; equal ages go to the newer request
+        assert _titles(csr + 100)[1] == ["new ride", "food", "ride", "old food"]
+
+
+def test_counts_are_patched_in_place_and_structural_writes_rebuild(app, seeded, query_counter):
+    csr, ids = seeded
+    with app.app_context():
+        app.extensions["request_ranking"].weights = {"affinity": 0.0, "recency": 0.0, "popularity": 1.0}
+        _titles(csr)                                            # matrix and category catalog loaded
+        view_counter.increment(ids["ride"], 3)
+        view_counter.flush()
+        shortlist_store.add_many(csr, [ids["old food"]])       # one shortlist outweighs three views
+        with query_counter:
+            assert _titles(csr)[1][:2] == ["old food", "ride"]
+        # two history queries and the page; no matrix reload
+        assert query_counter.count == 3
+
+        db.session.get(Request, ids["old food"]).status = "closed"
+        db.session.commit()
+        app.extensions["request_ranking"].ttl = 0
+        assert _titles(csr)[1][0] == "ride"
@@ -0,0 +1,70 @@
+import pytest
+from app import db
+from app.entity.request import Request
+from app.control.request_search import search_backend
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+from app.control.pin_searchRequest_controller import PinSearchRequestController
+
+
+def _add_requests(user_factory, requests_factory):
+    """Three open Transport requests in the current app; returns the PIN's ID."""
+    pin, cat = user_factory("PersonInNeed"), requests_factory.category("Transport")
+    for title, description in (
+        ("Grocery run", "Need a wheelchair accessible ride to the market"),
+        ("Wheelchair repair", "Front wheel is loose"),
+        ("Pharmacy pickup", "Prescription ready on Friday"),
+    ):
+        requests_factory(pin, cat, [title], description=description, status="open")
+    db.session.commit()
+    return pin
+
+
+@pytest.fixture()
+def pin(app, user_factory, requests_factory):
+    with app.app_context():
+        return _add_requests(user_factory, requests_factory)
+
+
+def _titles(requests):
+    return [r.title for r in requests]
+
+
+def test_fts_prefix_match_ranks_title_hits_first(app, pin):
+    with app.app_context():
+        assert search_backend().name == "fts5"
+        found = CsrSearchRequestController().searchRequest(None, keyword="wheel")
+        assert _titles(found) == ["Wheelchair repair", "Grocery run"]
+        assert _titles(CsrSearchRequestController().searchRequest("trans", keyword="pharm friday")) == ["Pharmacy pickup"]
+        # FTS syntax in user input is treated as plain words
+        assert CsrSearchRequestController().searchRequest(None, keyword='"OR" NEAR(*') == []
+
+
+def test_fts_index_follows_updates_and_deletes(app, pin):
+    with app.app_context():
+        r = db.session.get(Request, 3)
+        r.title = "Dog walking"
+        db.session.commit()
+        csr_search = CsrSearchRequestController()
+        assert _titles(csr_search.searchRequest(None, keyword="dog")) == ["Dog walking"]
+        assert csr_search.searchRequest(None, keyword="pharmacy") == []
+        assert _titles(PinSearchRequestController().searchRequests(pin, "dog")) == ["Dog walking"]
+
+        db.session.delete(r)
+        db.session.commit()
+        assert csr_search.searchRequest(None, keyword="dog") == []
+
+
+def test_like_backend_matches_same_rows(make_app, user_factory, requests_factory):
+    app = make_app(SEARCH_BACKEND="like")
+    with app.app_context():
+        pin = _add_requests(user_factory, requests_factory)
+        assert search_backend().name == "like"
+        found = CsrSearchRequestController().searchRequest(None, keyword="wheel")
+        assert _titles(found) == ["Wheelchair repair", "Grocery run"]   # newest first, no ranking
+        assert _titles(PinSearchRequestController().searchRequests(pin, "ride market")) == ["Grocery run"]
+
+
+@pytest.mark.parametrize("keyword", ["", "   ", "!!"])
+def test_blank_keyword_is_no_filter(app, pin, keyword):
+    with app.app_context():
+        assert len(PinSearchRequestController().searchRequests(pin, keyword)) == 3
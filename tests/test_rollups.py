@@ -0,0 +1,123 @@
+from datetime import datetime
+import pytest
+from sqlalchemy import func, select
+from app import db
+from app.entity.request import Request
+from app.entity.match_record import MatchRecord
+from app.entity.daily_rollup import DailyRollup
+from app.control import rollups
+from app.control.pin_deleteRequest_controller import PinDeleteRequestController
+from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
+
+
+@pytest.fixture()
+def seeded(app, user_factory, requests_factory):
+    """A PIN and the Food and Transport categories; returns their IDs."""
+    with app.app_context():
+        ids = user_factory("PersonInNeed"), requests_factory.category("Food"), requests_factory.category("Transport")
+        db.session.commit()
+    return ids
+
+
+def _cells():
+    return sorted(
+        tuple(row) for row in db.session.execute(
+            select(DailyRollup.day, DailyRollup.categoryID, DailyRollup.status,
+                   DailyRollup.created, DailyRollup.closed, DailyRollup.matched)
+            .where((DailyRollup.created != 0) | (DailyRollup.closed != 0) | (DailyRollup.matched != 0))
+        )
+    )
+
+
+def test_orm_writes_keep_rollups_equal_to_a_rebuild(app, seeded):
+    pin, food, ride = seeded
+    with app.app_context():
+        march, april = datetime(2025, 3, 10, 9), datetime(2025, 4, 2, 18)
+        a = Request(pinID=pin, categoryID=food, title="a", createdAt=march)
+        b = Request(pinID=pin, categoryID=food, title="b", createdAt=march)
+        c = Request(pinID=pin, categoryID=ride, title="c")            # createdAt/status defaults
+        db.session.add_all([a, b, c])
+        db.session.commit()
+
+        # close one with a match, move one to another category, delete one
+        a.status, a.closedAt = "closed", april
+        db.session.add(MatchRecord(requestID=a.requestID, csrRepID=pin, pinID=pin,
+                                   categoryID=food, completedAt=april))
+        b.categoryID = ride
+        db.session.delete(c)
+        db.session.commit()
+
+        # a rolled-back change leaves no trace
+        b.status = "closed"
+        db.session.flush()
+        db.session.rollback()
+
+        incremental = _cells()
+        assert incremental == [
+            (march.date(), food, "closed", 1, 0, 0),
+            (march.date(), ride, "open", 1, 0, 0),
+            (april.date(), food, "closed", 0, 1, 0),
+            (april.date(), food, "completed", 0, 0, 1),
+        ]
+        rollups.rebuild()
+        assert _cells() == incremental
+
+
+def test_monthly_report_breakdown_covers_only_the_month(app, seeded):
+    pin, food, ride = seeded
+    with app.app_context():
+        db.session.add_all([
+            Request(pinID=pin, categoryID=food, title="feb", createdAt=datetime(2025, 2, 28, 23)),
+            Request(pinID=pin, categoryID=food, title="mar", createdAt=datetime(2025, 3, 1)),
+            Request(pinID=pin, categoryID=ride, title="mar2", status="closed",
+                    createdAt=datetime(2025, 3, 31, 22), closedAt=datetime(2025, 4, 1, 1)),
+        ])
+        db.session.commit()
+
+        report = PlatformGenerateMonthlyReportController().generateMonthlyReport(pin, "2025-03")
+        data = report.content.to_dict()
+
+    assert data["summary"]["total_requests"] == 3
+    assert data["category_breakdown"] == {
+        "Food": {"total_requests": 1, "open_requests": 1, "closed_requests": 0},
+        "Transport": {"total_requests": 1, "open_requests": 0, "closed_requests": 1},
+    }
+    assert data["period"] == {"start": "2025-03-01", "end": "2025-04-01", "requests_created": 2,
+                              "requests_closed": 0, "matches_completed": 0}
+
+
+def test_deleting_a_request_retracts_its_matches_from_every_report_total(app, seeded):
+    pin, food, _ = seeded
+    with app.app_context():
+        request = Request(pinID=pin, categoryID=food, title="done", status="closed",
+                          createdAt=datetime(2025, 3, 2), closedAt=datetime(2025, 3, 3))
+        db.session.add(request)
+        db.session.flush()
+        db.session.add(MatchRecord(requestID=request.requestID, csrRepID=pin, pinID=pin,
+                                   categoryID=food, completedAt=datetime(2025, 3, 3)))
+        db.session.commit()
+        request_id = request.requestID
+        db.session.expunge_all()                            # match_records not loaded, as on a real page
+
+        PinDeleteRequestController().deleteRequest(request_id, pin)
+
+        assert db.session.scalar(select(func.count()).select_from(MatchRecord)) == 0
+        assert _cells() == []
+        summary = PlatformGenerateMonthlyReportController().generateMonthlyReport(pin, "2025-03").content.to_dict()["summary"]
+    assert summary["total_requests"] == 0
+    assert summary["total_matches"] == 0
+
+
+def test_migration_backfills_rollups_after_bulk_load(app, seeded):
+    pin, food, _ = seeded
+    with app.app_context():
+        db.session.execute(Request.__table__.insert(), [
+            {"pinID": pin, "categoryID": food, "title": "bulk", "status": "open",
+             "createdAt": datetime(2025, 5, 5)},
+        ])
+        db.session.commit()
+        assert _cells() == []
+
+        from app.migrations import upgrade
+        assert upgrade() is True
+        assert _cells() == [(datetime(2025, 5, 5).date(), food, "open", 1, 0, 0)]
@@ -0,0 +1,46 @@
+import pytest
+from app import db
+from app.entity.user_account import UserAccount
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.entity.match_record import MatchRecord
+from app.control import shortlist_store
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+import seed
+
+
+def _snapshot():
+    return db.session.execute(
+        db.select(Request.requestID, Request.pinID, Request.categoryID, Request.status).order_by(Request.requestID)
+    ).all()
+
+
+def test_bulk_seed_volumes_and_consistency(app):
+    counts = seed.reset_and_seed(csr_users=7, pin_users=11, categories=5, requests_per_category=12,
+                                 app=app, quiet=True)
+    assert counts["users"] == 4 + 7 + 11
+    assert counts["requests"] == 5 * 12 + 5
+    with app.app_context():
+        assert Request.query.count() == counts["requests"]
+        assert Shortlist.query.count() == counts["shortlists"] == 30 + 5
+        assert MatchRecord.query.count() == counts["match_records"] == 20 + 2
+        # denormalised counters agree with the shortlist rows
+        assert shortlist_store.reconcile_counts() == 0
+        # one shared hash, still a valid login
+        assert db.session.get(UserAccount, 12).check_password(seed.PASSWORD)
+        # the full-text index is rebuilt after the load
+        assert CsrSearchRequestController().searchRequest(None, keyword="clinic")
+        first = _snapshot()
+
+    seed.reset_and_seed(csr_users=7, pin_users=11, categories=5, requests_per_category=12,
+                        app=app, quiet=True)
+    with app.app_context():
+        assert _snapshot() == first
+
+
+def test_seed_requires_a_category(app, capsys):
+    with pytest.raises(SystemExit):
+        seed.main(["--categories", "0", "--quiet"])
+    assert "--categories must be at least 1" in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        seed.reset_and_seed(categories=0, app=app, quiet=True)
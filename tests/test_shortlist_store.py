@@ -0,0 +1,74 @@
+import pytest
+from app import db
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.control import shortlist_store
+from app.control.csr_saveToShortlist_controller import CsrSaveToShortlistController
+from app.control.csr_removeShortlist_controller import CsrRemoveShortlistController
+
+
+@pytest.fixture()
+def csr(app, user_factory, requests_factory):
+    """A CSR and three unshortlisted requests (r0..r2); returns the CSR's ID."""
+    with app.app_context():
+        csr = user_factory("CSRRep")
+        requests_factory(csr, requests_factory.category(), ["r0", "r1", "r2"], shortlistCount=0)
+        db.session.commit()
+    return csr
+
+
+def _counts():
+    db.session.expire_all()
+    return [r.shortlistCount for r in Request.query.order_by(Request.requestID)]
+
+
+def test_save_is_idempotent_and_counts_once(app, csr):
+    with app.app_context():
+        ctl = CsrSaveToShortlistController()
+        assert ctl.saveToShortlist(1, csr) is True
+        assert ctl.saveToShortlist(1, csr) is False
+        assert Shortlist.query.count() == 1
+        assert _counts() == [1, 0, 0]
+        with pytest.raises(ValueError):
+            ctl.saveToShortlist(99, csr)
+
+
+def test_bulk_add_and_remove(app, csr):
+    with app.app_context():
+        assert CsrSaveToShortlistController().saveManyToShortlist([1, 2, 3, 99, 2], csr) == 3
+        assert _counts() == [1, 1, 1]
+        assert CsrRemoveShortlistController().removeManyFromShortlist(csr, [1, 3, 42]) == 2
+        assert _counts() == [0, 1, 0]
+        with pytest.raises(ValueError):
+            CsrRemoveShortlistController().removeFromShortlist(csr, 1)
+
+
+def test_without_returning_rows_are_written_one_at_a_time(app, csr, query_counter, monkeypatch):
+    # SQLite 3.24 - 3.34, MySQL: no INSERT / DELETE ... RETURNING
+    monkeypatch.setattr(shortlist_store, "SQLITE_RETURNING_SINCE", (99,))
+    with app.app_context():
+        assert shortlist_store.add_many(csr, [2]) == [2]
+        with query_counter:
+            assert shortlist_store.add_many(csr, [1, 2, 3, 99]) == [1, 3]
+        assert not any("RETURNING" in sql for sql in query_counter.statements)
+        assert Shortlist.query.count() == 3
+        assert _counts() == [1, 1, 1]
+        with query_counter:
+            assert shortlist_store.remove_many(csr, [1, 3, 42]) == [1, 3]
+        assert not any("RETURNING" in sql for sql in query_counter.statements)
+        assert _counts() == [0, 1, 0]
+
+
+def test_reconcile_fixes_drifted_counters(app, csr, query_counter):
+    with app.app_context():
+        shortlist_store.add_many(csr, [1, 2])
+        db.session.execute(db.update(Request).values(shortlistCount=7))
+        db.session.commit()
+
+        with query_counter:
+            assert shortlist_store.reconcile_counts() == 3
+        # one correlated UPDATE (+ COMMIT bookkeeping), no rows read into Python
+        assert sum(sql.lstrip().startswith("UPDATE") for sql in query_counter.statements) == 1
+        assert not any(sql.lstrip().startswith("SELECT") for sql in query_counter.statements)
+        assert _counts() == [1, 1, 0]
+        assert shortlist_store.reconcile_counts() == 0
@@ -0,0 +1,139 @@
+import io
+from datetime import datetime, timedelta
+import pytest
+from app import db
+from app.entity.user_account import UserAccount
+from app.entity.import_job import ImportJob
+from app.control import useradmin_importUserAccounts_controller as import_controller
+from app.control.useradmin_importUserAccounts_controller import UserAdminImportUserAccountsController
+from app.control.user_import_jobs import user_import_jobs
+
+
+def _add_accounts(user_factory):
+    """An existing CSR (taken@test.com) and a user admin (admin@test.com); returns the CSRRep profile ID."""
+    existing = user_factory("CSRRep", "taken@test.com", "Existing")
+    user_factory("UserAdmin", "admin@test.com", "Admin")
+    db.session.commit()
+    return db.session.get(UserAccount, existing).profileID
+
+
+@pytest.fixture()
+def csr(app, user_factory):
+    with app.app_context():
+        return _add_accounts(user_factory)
+
+
+def test_import_creates_valid_rows_and_reports_the_rest(app, csr):
+    app.config["USER_IMPORT_CHUNK"] = 2
+    csv_text = (
+        "name,email,password,age,phoneNumber,profile\n"
+        "Ann,ann@test.com,secret1,30,81230001,\n"
+        "Ben,taken@test.com,secret2,,,\n"
+        ",nobody@test.com,secret3,,,\n"
+        "Cat,cat@test.com,secret4,abc,,\n"
+        "Dan,dan@test.com,secret5,,,UserAdmin\n"
+        "Eve,ann@test.com,secret6,,,\n"
+        "Fay,fay@test.com,secret7,,,Unknown\n"
+    )
+    with app.app_context():
+        result = UserAdminImportUserAccountsController().importUserAccounts(io.StringIO(csv_text), csr)
+
+        assert result.created == 2
+        assert result.errors == [
+            (3, "Email 'taken@test.com' already exists."),
+            (4, "Name is required (at most 100 characters)."),
+            (5, "Invalid age 'abc'."),
+            (7, "Email 'ann@test.com' appears more than once in the file."),
+            (8, "Profile 'Unknown' not found or inactive."),
+        ]
+        ann = UserAccount.query.filter_by(email="ann@test.com").one()
+        assert (ann.age, ann.phoneNumber, ann.profileID) == (30, "81230001", csr)
+        assert ann.check_password("secret1")
+        assert UserAccount.query.filter_by(email="dan@test.com").one().profile.profileName == "UserAdmin"
+
+
+def test_import_hashes_in_a_process_pool_with_set_based_queries(app, csr, query_counter):
+    lines = ["name,email,password"] + [f"User {i},user{i}@test.com,pw{i}" for i in range(40)]
+    with app.app_context():
+        with query_counter:
+            result = UserAdminImportUserAccountsController().importUserAccounts(
+                io.StringIO("\n".join(lines)), csr, hash_workers=2
+            )
+        # profiles, email check, one executemany INSERT, table version bump
+        assert query_counter.count == 4
+        assert result.created == 40 and result.errors == []
+        assert UserAccount.query.filter_by(email="user39@test.com").one().check_password("pw39")
+
+
+def test_import_rejects_files_without_required_columns(app, csr):
+    with app.app_context():
+        with pytest.raises(ValueError, match="password"):
+            UserAdminImportUserAccountsController().importUserAccounts(io.StringIO("name,email\nA,a@b.c\n"), csr)
+
+
+def test_import_route_queues_a_job_and_shows_its_result(app, client, csr, monkeypatch):
+    # eager jobs (in-memory test database) run in the request thread and hash in-process
+    monkeypatch.setattr(import_controller, "ProcessPoolExecutor", None)
+    client.post("/login", data={"email": "admin@test.com", "password": "pw"})
+    resp = client.post("/admin/users/import", data={
+        "profile_id": str(csr),
+        "file": (io.BytesIO(b"\xef\xbb\xbfname,email,password\nZoe,zoe@test.com,pw\nBad,bad,pw\n"), "users.csv"),
+    }, content_type="multipart/form-data")
+    assert resp.status_code == 302
+    job_url = resp.headers["Location"]
+    assert "/admin/users/import/jobs/" in job_url
+
+    body = client.get(job_url).get_data(as_text=True)
+    assert "imported 1 user account(s); 1 row(s) rejected." in body
+    assert "Invalid email &#39;bad&#39;." in body
+    status = client.get(job_url, headers={"Accept": "application/json"}).get_json()
+    assert (status["status"], status["created"], status["rejected"]) == ("done", 1, 1)
+    with app.app_context():
+        assert db.session.get(ImportJob, status["jobID"]).upload is None    # passwords are not kept
+
+    # a file without the required columns is refused in the request, before queueing
+    resp = client.post("/admin/users/import", data={
+        "file": (io.BytesIO(b"name,email\nA,a@b.c\n"), "bad.csv"),
+    }, content_type="multipart/form-data")
+    assert resp.status_code == 200 and b"missing required column(s): password" in resp.data
+    assert client.get("/admin/users/import/jobs/999", headers={"Accept": "application/json"}).status_code == 404
+
+
+def test_upload_imports_run_in_a_background_worker(make_app, user_factory, tmp_path):
+    app = make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'import.db'}", USER_IMPORT_HASH_WORKERS=1)
+    data = ("name,email,password\n" + "".join(f"User {i},bg{i}@test.com,pw{i}\n" for i in range(5))).encode()
+    with app.app_context():
+        assert not app.extensions["user_import_jobs"].eager
+        csr = _add_accounts(user_factory)
+        admin = UserAccount.query.filter_by(email="admin@test.com").one().userID
+        job = user_import_jobs.enqueue(data, "users.csv", csr, admin)
+        job = user_import_jobs.wait(job.jobID, timeout=30)
+        assert (job.status, job.created, job.rejected, job.error) == ("done", 5, 0, None)
+        assert job.startedAt is not None and job.finishedAt >= job.startedAt
+        assert UserAccount.query.filter_by(email="bg4@test.com").one().check_password("pw4")
+
+
+def test_only_jobs_running_past_the_timeout_are_expired(app, csr):
+    app.extensions["user_import_jobs"].timeout = 60
+    with app.app_context():
+        admin = UserAccount.query.filter_by(email="admin@test.com").one().userID
+        hour_ago = datetime.utcnow() - timedelta(hours=1)
+        db.session.add_all([
+            # waited an hour in the queue but only just started: not stale
+            ImportJob(requestedBy=admin, status="running", createdAt=hour_ago, startedAt=datetime.utcnow()),
+            ImportJob(requestedBy=admin, status="running", createdAt=hour_ago, startedAt=hour_ago),
+            ImportJob(requestedBy=admin, status="queued", createdAt=hour_ago),
+        ])
+        db.session.commit()
+        assert user_import_jobs.expire_stale() == 2
+        assert [j.status for j in ImportJob.query.order_by(ImportJob.jobID)] == ["running", "failed", "failed"]
+
+
+def test_import_users_cli_uses_the_configured_pool(app, csr, tmp_path):
+    app.config["USER_IMPORT_HASH_WORKERS"] = 2
+    path = tmp_path / "users.csv"
+    path.write_text("name,email,password\n" + "".join(f"User {i},cli{i}@test.com,pw{i}\n" for i in range(40)))
+    out = app.test_cli_runner().invoke(args=["import-users", str(path), "--profile", str(csr)])
+    assert "Imported 40 user account(s); 0 row(s) rejected." in out.output
+    with app.app_context():
+        assert UserAccount.query.filter_by(email="cli39@test.com").one().check_password("pw39")
@@ -0,0 +1,94 @@
+import pytest
+from app import db
+from app.entity.user_account import UserAccount
+from app.control import user_search
+from app.control.user_search import BACKENDS, user_search_backend
+from app.control.useradmin_searchUserAccount_controller import UserAdminSearchUserAccountController
+
+PEOPLE = [
+    ("Alice Tan", "alice.tan@partner.org"),
+    ("Brandon Lee", "blee@mail.com"),
+    ("Caleb Lim", "caleb@partner.org"),
+    ("Daniel Tanaka", "dtanaka@mail.com"),
+    ("Elaine Koh", "elaine@koh.sg"),
+]
+
+
+@pytest.fixture()
+def people(app, user_factory):
+    with app.app_context():
+        for name, email in PEOPLE:
+            user_factory("CSRRep", email, name)
+        db.session.commit()
+
+
+def _names(search, **kw):
+    page = UserAdminSearchUserAccountController().searchUserAccountPage(search, **kw)
+    return page.total, [u.name for u in page.items]
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_substring_search_over_name_and_email(app, people, backend):
+    with app.app_context():
+        app.extensions["user_search"] = BACKENDS[backend]()
+        assert _names("tan") == (2, ["Alice Tan", "Daniel Tanaka"])
+        assert _names("PARTNER") == (2, ["Alice Tan", "Caleb Lim"])
+        assert _names("partner lim") == (1, ["Caleb Lim"])          # every term must match
+        assert _names("nobody") == (0, [])
+        assert _names("", per_page=2) == (5, ["Alice Tan", "Brandon Lee"])
+        assert _names("", page=2, per_page=2) == (5, ["Caleb Lim", "Daniel Tanaka"])
+
+
+def test_trigram_index_tracks_writes(app, people, query_counter):
+    with app.app_context():
+        assert user_search_backend().name == "trigram"
+        elaine = UserAccount.query.filter_by(email="elaine@koh.sg").one()
+        elaine.name, elaine.email = "Elaine Wong", "ewong@mail.com"
+        db.session.delete(UserAccount.query.filter_by(name="Brandon Lee").one())
+        db.session.commit()
+
+        with query_counter:
+            assert _names("wong") == (1, ["Elaine Wong"])
+        assert any("user_accounts_fts" in sql for sql in query_counter.statements)
+        assert _names("koh") == (0, [])
+        assert _names("mail") == (2, ["Daniel Tanaka", "Elaine Wong"])
+        # one- and two-letter terms have no trigram; still substrings, alone or beside a longer term
+        assert _names("an") == (2, ["Alice Tan", "Daniel Tanaka"])
+        assert _names("mail wo") == (1, ["Elaine Wong"])
+
+
+@pytest.mark.parametrize("term", ["li", "LI", "e", "ta n"])
+def test_short_terms_match_the_same_users_on_every_backend(app, people, term):
+    with app.app_context():
+        found = {}
+        for name, backend in BACKENDS.items():
+            app.extensions["user_search"] = backend()
+            found[name] = _names(term)
+        assert found["trigram"] == found["like"]
+    assert found["like"][0] > 0
+
+
+def test_materialized_hint_only_on_sqlite_that_has_it(app, people, query_counter, monkeypatch):
+    with app.app_context():
+        with query_counter:
+            assert _names("partner") == (2, ["Alice Tan", "Caleb Lim"])
+        assert any("AS MATERIALIZED" in sql for sql in query_counter.statements)
+
+        # SQLite 3.34 has the trigram tokenizer but not AS MATERIALIZED
+        monkeypatch.setattr(user_search, "MATERIALIZED_SINCE", (99,))
+        with query_counter:
+            assert _names("partner") == (2, ["Alice Tan", "Caleb Lim"])
+        assert not any("MATERIALIZED" in sql for sql in query_counter.statements)
+
+
+def test_upgrade_drops_the_old_prefix_indexes(app):
+    from sqlalchemy import text
+    from app.migrations import upgrade
+    with app.app_context():
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql("CREATE INDEX ix_user_accounts_name_nocase ON user_accounts (name COLLATE NOCASE)")
+        assert upgrade() is True
+        with db.engine.connect() as conn:
+            assert conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE name = 'ix_user_accounts_name_nocase'"
+            )).first() is None
@@ -0,0 +1,88 @@
+import gc
+import threading
+import weakref
+import pytest
+from app import db
+from app.entity.request import Request
+from app.control import view_counter as view_counter_module
+from app.control.view_counter import view_counter
+from app.control.csr_viewRequest_controller import CsrViewRequestController
+from app.control.pin_trackViews_controller import PinTrackViewsController
+
+
+@pytest.fixture()
+def app(make_app, user_factory, requests_factory):
+    app = make_app(VIEW_COUNT_FLUSH_THRESHOLD=3, VIEW_COUNT_FLUSH_INTERVAL=0)
+    with app.app_context():
+        requests_factory(user_factory("PersonInNeed"), requests_factory.category(), ["r"], viewCount=5)
+        db.session.commit()
+    yield app
+
+
+def _persisted(request_id):
+    db.session.expire_all()
+    return db.session.get(Request, request_id).viewCount
+
+
+def test_views_are_buffered_until_threshold(app):
+    with app.app_context():
+        CsrViewRequestController().viewRequestDetails(1)
+        CsrViewRequestController().viewRequestDetails(1)
+        assert _persisted(1) == 5
+        assert PinTrackViewsController().trackViews(1) == 7
+
+        CsrViewRequestController().viewRequestDetails(1)  # hits the threshold -> flush
+        assert _persisted(1) == 8
+        assert view_counter.pending(1) == 0
+
+
+def test_concurrent_views_are_not_lost(app):
+    def worker():
+        with app.app_context():
+            for _ in range(50):
+                view_counter.increment(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    with app.app_context():
+        view_counter.flush()
+        assert _persisted(1) == 5 + 8 * 50
+
+
+def test_failed_threshold_flush_keeps_views_and_does_not_fail_the_page(app, monkeypatch):
+    from sqlalchemy.exc import OperationalError
+
+    def locked():
+        raise OperationalError("UPDATE requests", {}, Exception("database is locked"))
+
+    with app.app_context():
+        monkeypatch.setattr(db.engine, "begin", locked)
+        for _ in range(3):                                   # third view reaches the threshold
+            CsrViewRequestController().viewRequestDetails(1)
+        assert view_counter.pending(1) == 3
+
+        monkeypatch.undo()
+        assert view_counter.flush() == 3
+        assert _persisted(1) == 8
+
+
+def test_discarded_apps_are_not_kept_alive_for_the_exit_flush(make_app):
+    app = make_app()
+    state = app.extensions["view_counter"]
+    assert state in view_counter_module._live_states
+    ref = weakref.ref(app)
+
+    del app, state
+    gc.collect()
+    assert ref() is None
+
+
+def test_exit_hook_flushes_every_live_app(app):
+    with app.app_context():
+        view_counter.increment(1)
+    view_counter_module._flush_all()
+    with app.app_context():
+        assert _persisted(1) == 6